@@ -0,0 +1,286 @@
+"""asyncio Gmail client for overlapping reads, label writes and draft creation."""
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from googleapiclient.errors import HttpError
+
+from .gmail_client import GmailClient
+from .send_journal import PENDING
+
+# 기본 동시 요청 수 (읽기 / 쓰기 별도 제한)
+DEFAULT_READ_CONCURRENCY = 8
+DEFAULT_WRITE_CONCURRENCY = 4
+
+
+class AsyncGmailClient:
+    """
+    Async counterpart to GmailClient.
+
+    Covers messages.list/get/modify/batchModify and drafts.create/update/send. Each call runs on
+    GmailClient's worker pool (one httplib2 service per thread, see
+    ConcurrentFetcher) and is awaited from the event loop, so independent
+    reads, label writes and draft creation can overlap. Reads and writes
+    have separate semaphores to bound concurrency.
+
+    Everything else (labels setup, local store, etc.) stays on the wrapped
+    sync client: `async_gmail.gmail`.
+
+    Example:
+        async_gmail = AsyncGmailClient(gmail)
+        drafts = await asyncio.gather(*[
+            async_gmail.create_draft(e["thread_id"], e["sender"], d["subject"], d["body"])
+            for e, d in zip(emails, drafts)
+        ])
+    """
+
+    def __init__(
+        self,
+        gmail: Optional[GmailClient] = None,
+        read_concurrency: int = DEFAULT_READ_CONCURRENCY,
+        write_concurrency: int = DEFAULT_WRITE_CONCURRENCY,
+    ) -> None:
+        """
+        Initialize async client.
+
+        Args:
+            gmail: Existing GmailClient to share credentials, store and worker pool
+                   (a new one is created if omitted)
+            read_concurrency: Max concurrent list/get calls
+            write_concurrency: Max concurrent modify/drafts calls
+        """
+        self.gmail = gmail or GmailClient(max_workers=read_concurrency + write_concurrency)
+        self.read_concurrency = read_concurrency
+        self.write_concurrency = write_concurrency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._read_limit: Optional[asyncio.Semaphore] = None
+        self._write_limit: Optional[asyncio.Semaphore] = None
+
+    def _limits(self) -> None:
+        """Create semaphores for the running event loop (asyncio.run creates a new loop each time)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._read_limit = asyncio.Semaphore(self.read_concurrency)
+            self._write_limit = asyncio.Semaphore(self.write_concurrency)
+
+    async def _read(self, fn: Callable[[Any], Any]) -> Any:
+        """Run a read call (fn(service)) on the worker pool."""
+        self._limits()
+        async with self._read_limit:
+            return await asyncio.wrap_future(self.gmail.fetcher.submit(fn))
+
+    async def _write(self, fn: Callable[[Any], Any]) -> Any:
+        """Run a write call (fn(service)) on the worker pool."""
+        self._limits()
+        async with self._write_limit:
+            return await asyncio.wrap_future(self.gmail.fetcher.submit(fn))
+
+    # ===== 읽기 =====
+
+    async def list_messages(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        max_results: int = 100,
+        page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        List messages (one page).
+
+        Returns:
+            Raw messages.list response with 'messages' and optional 'nextPageToken'
+        """
+        params: Dict[str, Any] = {"userId": "me", "maxResults": max_results}
+        if query:
+            params["q"] = query
+        if label_ids:
+            params["labelIds"] = label_ids
+        if page_token:
+            params["pageToken"] = page_token
+
+        return await self._read(
+            lambda service: service.users().messages().list(**params).execute()
+        )
+
+    async def get_message(
+        self,
+        message_id: str,
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get a single message resource."""
+        params: Dict[str, Any] = {"userId": "me", "id": message_id, "format": format}
+        if metadata_headers:
+            params["metadataHeaders"] = metadata_headers
+        if fields:
+            params["fields"] = fields
+
+        return await self._read(
+            lambda service: service.users().messages().get(**params).execute()
+        )
+
+    # ===== 쓰기 =====
+
+    async def modify_message(
+        self,
+        message_id: str,
+        add_label_ids: Optional[List[str]] = None,
+        remove_label_ids: Optional[List[str]] = None,
+    ) -> None:
+        """Add/remove labels on a message (local store is updated too)."""
+        add, remove = await self._change_labels(
+            [message_id], add_label_ids or [], remove_label_ids or []
+        )
+
+        # 저장소는 이벤트 루프(메인 스레드)에서만 갱신
+        self.gmail.store.update_labels(message_id, add=add, remove=remove)
+
+    async def _change_labels(
+        self, message_ids: List[str], add: List[str], remove: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Async version of GmailClient._execute_label_change().
+
+        Only the modify/batchModify call runs on the worker pool; label
+        registry remapping and rebuilding stay on the event loop thread.
+
+        Returns:
+            (add, remove) label IDs actually applied
+        """
+        gmail = self.gmail
+        add, remove = gmail._current_label_ids(add, remove)
+
+        try:
+            await self._write(
+                lambda service, a=add, r=remove: gmail._send_label_change(service, message_ids, a, r)
+            )
+        except HttpError as e:
+            if not gmail.labels.is_stale_label_error(e):
+                raise
+            add, remove = gmail._refresh_label_ids(add, remove)
+            await self._write(
+                lambda service, a=add, r=remove: gmail._send_label_change(service, message_ids, a, r)
+            )
+
+        return add, remove
+
+    async def apply_labels_to_email(
+        self,
+        message_id: str,
+        status: str,
+        priority: int,
+        label_ids: Dict[str, str],
+    ) -> None:
+        """Async version of GmailClient.apply_labels_to_email()."""
+        labels_to_add, labels_to_remove = self.gmail._classification_label_changes(
+            status, priority, label_ids
+        )
+        if labels_to_add:
+            await self.modify_message(message_id, labels_to_add, labels_to_remove)
+
+    async def batch_modify_labels(self, changes: List[Tuple[str, List[str], List[str]]]) -> List[str]:
+        """
+        Async version of GmailClient.batch_modify_labels().
+
+        Each (add, remove) group is one batchModify call; groups run concurrently.
+        Stale label IDs are remapped through the label registry as in the sync client.
+
+        Returns:
+            Message IDs whose labels could not be changed
+        """
+
+        async def _group(add: List[str], remove: List[str], ids: List[str]) -> List[str]:
+            try:
+                applied_add, applied_remove = await self._change_labels(ids, add, remove)
+            except Exception:
+                if len(ids) == 1:
+                    return ids
+                # 묶음 호출 실패 → 메시지별로 다시 시도해 실패한 ID만 골라냄
+                results = await asyncio.gather(
+                    *[self.modify_message(msg_id, add, remove) for msg_id in ids],
+                    return_exceptions=True,
+                )
+                return [msg_id for msg_id, r in zip(ids, results) if isinstance(r, BaseException)]
+
+            self.gmail.store.update_labels_many(ids, add=applied_add, remove=applied_remove)
+            return []
+
+        groups = self.gmail._group_label_changes(changes)
+        failed = await asyncio.gather(*[_group(*group) for group in groups])
+        return [msg_id for ids in failed for msg_id in ids]
+
+    async def apply_labels_to_emails(
+        self,
+        classifications: List[Tuple[str, str, int]],
+        label_ids: Dict[str, str],
+    ) -> List[str]:
+        """Async version of GmailClient.apply_labels_to_emails()."""
+        changes = []
+        for message_id, status, priority in classifications:
+            labels_to_add, labels_to_remove = self.gmail._classification_label_changes(
+                status, priority, label_ids
+            )
+            if labels_to_add:
+                changes.append((message_id, labels_to_add, labels_to_remove))
+
+        return await self.batch_modify_labels(changes)
+
+    async def create_draft(
+        self, thread_id: str, to: str, subject: str, body: str, is_html: bool = True
+    ) -> Dict[str, Any]:
+        """Async version of GmailClient.create_draft()."""
+        draft_body = self.gmail._build_draft_body(thread_id, to, subject, body, is_html)
+
+        return await self._write(
+            lambda service: service.users().drafts().create(
+                userId="me", body=draft_body
+            ).execute()
+        )
+
+    async def create_drafts_bulk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Async version of GmailClient.create_drafts_bulk().
+
+        One draft per thread: a rerun updates the thread's recorded draft
+        instead of creating another. Results are in input order.
+        """
+        plan = self.gmail._plan_drafts(items)
+
+        async def _upsert(draft_body: Dict[str, Any], existing_id: Optional[str]) -> Any:
+            try:
+                return await self._write(
+                    lambda service: self.gmail._upsert_draft(service, draft_body, existing_id)
+                )
+            except Exception as e:
+                return e
+
+        outcomes = await asyncio.gather(*[_upsert(*entry) for entry in plan.values()])
+        return self.gmail._finish_drafts(items, dict(zip(plan, outcomes)))
+
+    async def batch_send_drafts(self, draft_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Async version of GmailClient.batch_send_drafts().
+
+        Uses the same send journal: drafts already sent are not sent again,
+        and each send is journaled 'pending' before drafts.send. Sent threads
+        go into the sent-thread index. Journal and store writes stay on the
+        event loop thread; sends are bounded by the write semaphore.
+
+        Returns:
+            Results in the same order as draft_ids (see GmailClient.batch_send_drafts)
+        """
+        gmail = self.gmail
+        results, to_send = gmail._plan_sends(draft_ids)
+
+        async def _send(draft_id: str) -> None:
+            gmail.send_journal.record(draft_id, PENDING)
+            try:
+                sent = await self._write(lambda service: gmail._send_draft_call(service, draft_id))
+            except Exception as e:
+                results[draft_id] = gmail._record_send(draft_id, error=e)
+            else:
+                results[draft_id] = gmail._record_send(draft_id, sent=sent)
+
+        await asyncio.gather(*[_send(draft_id) for draft_id in to_send])
+        return [results[draft_id] for draft_id in draft_ids]
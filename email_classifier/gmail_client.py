@@ -1,11 +1,18 @@
 """Gmail API client for fetching emails."""
 import os.path
-from typing import Any, List, Dict, Optional, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from .concurrent_fetcher import DEFAULT_MAX_WORKERS, ConcurrentFetcher
+from .label_registry import LabelRegistry
+from .message_store import MessageStore
+from .request_scheduler import RequestScheduler, get_default_scheduler
+from .send_journal import FAILED, PENDING, SENT, SendJournal
 
 SCOPES = [
     "https://www.googleapis.com/auth/gmail.readonly",
@@ -15,14 +22,82 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",  # Sheets 읽기/쓰기
 ]
 
+# 1단계(메타데이터) 조회 시 파이프라인이 실제로 읽는 헤더만 요청
+METADATA_HEADERS = ["Subject", "From", "To", "Cc", "Date"]
+METADATA_FIELDS = "id,threadId,labelIds,snippet,internalDate,payload/headers"
+
+# 2단계(본문) 조회 시 필요한 필드만 요청
+FULL_FIELDS = "id,threadId,labelIds,snippet,internalDate,payload"
+
+# 스레드 조회 시 필요한 필드 (thread historyId + 메시지별 필드)
+THREAD_METADATA_FIELDS = f"id,historyId,messages({METADATA_FIELDS})"
+THREAD_FULL_FIELDS = f"id,historyId,messages({FULL_FIELDS})"
+
+# 초안 동시 발송 수 (발송 속도 자체는 RequestScheduler의 발송 버킷이 제한)
+DEFAULT_SEND_CONCURRENCY = 4
+
+# 연락처 인덱스를 채우기 위해 훑는 메일 범위
+CONTACT_SYNC_QUERY = "in:inbox OR in:sent"
+
+# 증분 동기화 체크포인트 (마지막 historyId) 저장 위치
+SYNC_STATE_PATH = os.path.join(os.path.dirname(__file__), '..', 'email_sync_state.json')
+
+# 전체 재동기화 시 나열하는 메일 수 (max_results의 배수). 이월 목록을 몇 번의 실행분으로 제한
+FULL_RESYNC_LIST_FACTOR = 5
+
+# 계정 정보(주소 + send-as 별칭) 디스크 캐시 위치 (profile_cache_ttl 지정 시 사용)
+PROFILE_CACHE_PATH = os.path.join(os.path.dirname(__file__), '..', 'email_profile_cache.json')
+
 
 class GmailClient:
     """Simple Gmail API client."""
 
-    def __init__(self) -> None:
-        """Initialize Gmail client with OAuth."""
+    # Gmail은 배치당 최대 100개 호출을 허용하지만 50개 이하를 권장 (초과 시 429 빈발)
+    BATCH_SIZE = 50
+
+    # messages.batchModify 호출당 최대 메시지 수
+    BATCH_MODIFY_SIZE = 1000
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        scheduler: Optional[RequestScheduler] = None,
+        profile_cache_ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize Gmail client with OAuth.
+
+        Args:
+            max_workers: Concurrency limit for full-body fetches (fetch_many)
+            scheduler: Rate limiter/retry policy (defaults to the shared scheduler)
+            profile_cache_ttl: Seconds to reuse the account identity from
+                               email_profile_cache.json across runs (None = per client only)
+        """
         self.creds = self._get_credentials()
-        self.service = build("gmail", "v1", credentials=self.creds)
+        # 모든 요청은 quota 스케줄러를 거침 (token bucket + 429/5xx 재시도)
+        self.scheduler = scheduler or get_default_scheduler()
+        self.service = build(
+            "gmail", "v1", credentials=self.creds, requestBuilder=self.scheduler.request_builder
+        )
+        # 본문 전체 조회용 병렬 fetcher (스레드별 service 객체 사용)
+        self.fetcher = ConcurrentFetcher(self.creds, max_workers=max_workers, scheduler=self.scheduler)
+        # 증분 동기화: 처리 완료 후 저장할 체크포인트 (save_sync_checkpoint)
+        self._pending_sync_state: Optional[Dict[str, Any]] = None
+        # 로컬 메시지 저장소 (이미 받은 메시지는 다시 다운로드하지 않음)
+        self.store = MessageStore()
+        self._store_labels_synced = False
+        # users.history.list 결과 (실행당 한 번, 라벨 동기화와 증분 동기화가 공유)
+        self._history_walk: Optional[Dict[str, Any]] = None
+        # 이번 실행에서 historyId로 확인된 스레드 (check_if_replied가 재조회하지 않음)
+        self._fresh_threads: set = set()
+        self._contacts_synced = False
+        # 라벨 이름 ↔ ID 맵 (email_labels.json, 라벨 목록은 필요할 때만 조회)
+        self.labels = LabelRegistry(self.service)
+        # 계정 정보 (내 주소 + send-as 별칭): 클라이언트 수명 동안 한 번만 조회
+        self.profile_cache_ttl = profile_cache_ttl
+        self._account: Optional[Dict[str, Any]] = None
+        # 초안 발송 기록 (email_send_journal.jsonl, 중단된 발송 재개용)
+        self.send_journal = SendJournal()
 
     def _get_credentials(self) -> Credentials:
         """Get or create OAuth credentials."""
@@ -51,98 +126,1021 @@ class GmailClient:
 
         return creds
 
-    def get_recent_emails(self, max_results: int = 10, skip_processed: bool = True) -> List[Dict[str, Any]]:
+    # ===== 계정 정보 (프로필 캐시) =====
+
+    def get_my_email(self) -> str:
+        """
+        Get the account's primary email address (lowercase, cached).
+
+        Example:
+            my_email = gmail.get_my_email()  # 'me@example.com'
+        """
+        return self._get_account()["email_address"]
+
+    def get_my_addresses(self) -> List[str]:
+        """
+        Get every address this account sends as (primary + send-as aliases, lowercase).
+
+        Use this for "is this me?" checks so replies sent from an alias count too.
+
+        Example:
+            if sender_email in gmail.get_my_addresses():
+                print("내가 보낸 메일")
+        """
+        return self._get_account()["addresses"]
+
+    def _get_account(self) -> Dict[str, Any]:
+        """
+        Resolve the account identity once per client.
+
+        Uses getProfile + settings.sendAs.list on first use, or
+        email_profile_cache.json when profile_cache_ttl is set and the
+        cached entry is still fresh.
+
+        Returns:
+            {'email_address': 'me@example.com', 'addresses': ['me@example.com', 'alias@example.com']}
+        """
+        if self._account is not None:
+            return self._account
+
+        account = self._load_profile_cache()
+        if account is None:
+            profile = self.service.users().getProfile(userId='me').execute()
+            email_address = profile['emailAddress'].lower()
+            addresses = [email_address]
+
+            try:
+                send_as = self.service.users().settings().sendAs().list(userId='me').execute()
+                for alias in send_as.get('sendAs', []):
+                    address = alias.get('sendAsEmail', '').lower()
+                    if address and address not in addresses:
+                        addresses.append(address)
+            except HttpError:
+                pass  # 별칭 조회 실패 시 기본 주소만 사용
+
+            account = {"email_address": email_address, "addresses": addresses}
+            self._save_profile_cache(account)
+
+        self._account = account
+        return account
+
+    def _load_profile_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the account identity from email_profile_cache.json if within TTL."""
+        import json
+        import time
+
+        if self.profile_cache_ttl is None or not os.path.exists(PROFILE_CACHE_PATH):
+            return None
+
+        try:
+            with open(PROFILE_CACHE_PATH, 'r') as f:
+                cached = json.load(f)
+            if time.time() - cached["cached_at"] > self.profile_cache_ttl:
+                return None  # Expired
+            return {"email_address": cached["email_address"], "addresses": cached["addresses"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Corrupt cache → fetch again
+
+    def _save_profile_cache(self, account: Dict[str, Any]) -> None:
+        """Save the account identity to email_profile_cache.json (only when TTL is set)."""
+        import json
+        import time
+
+        if self.profile_cache_ttl is None:
+            return
+
+        with open(PROFILE_CACHE_PATH, 'w') as f:
+            json.dump({**account, "cached_at": time.time()}, f, ensure_ascii=False, indent=2)
+
+    def batch_get_messages(
+        self,
+        message_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch multiple messages using Gmail HTTP batch requests.
+
+        Groups up to BATCH_SIZE messages.get calls into a single HTTP round trip
+        instead of one request per message.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+            format: Message format ("full", "metadata", "minimal", "raw")
+            metadata_headers: Headers to include when format is "metadata"
+            fields: Optional partial-response mask (e.g. "id,threadId,payload/headers")
+
+        Returns:
+            List of results in the same order as message_ids:
+            [{'id': ..., 'success': True, 'message': {...}, 'error': None}, ...]
+
+        Example:
+            for result in gmail.batch_get_messages(['abc123', 'def456']):
+                if result['success']:
+                    print(result['message']['snippet'])
+                else:
+                    print(f"Failed: {result['error']}")
+        """
+        def _request(msg_id: str) -> Any:
+            params: Dict[str, Any] = {"userId": "me", "id": msg_id, "format": format}
+            if metadata_headers:
+                params["metadataHeaders"] = metadata_headers
+            if fields:
+                params["fields"] = fields
+            return self.service.users().messages().get(**params)
+
+        return self._batch_execute(message_ids, _request, "gmail.users.messages.get", "message")
+
+    def batch_get_threads(
+        self,
+        thread_ids: List[str],
+        format: str = "metadata",
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch multiple threads using Gmail HTTP batch requests.
+
+        Args:
+            thread_ids: Gmail thread IDs to fetch
+            format: Thread format ("full", "metadata", "minimal")
+            metadata_headers: Headers to include when format is "metadata"
+            fields: Optional partial-response mask
+
+        Returns:
+            List of results in the same order as thread_ids:
+            [{'id': ..., 'success': True, 'thread': {...}, 'error': None}, ...]
+        """
+        def _request(thread_id: str) -> Any:
+            params: Dict[str, Any] = {"userId": "me", "id": thread_id, "format": format}
+            if metadata_headers:
+                params["metadataHeaders"] = metadata_headers
+            if fields:
+                params["fields"] = fields
+            return self.service.users().threads().get(**params)
+
+        return self._batch_execute(thread_ids, _request, "gmail.users.threads.get", "thread")
+
+    def _batch_execute(
+        self,
+        ids: List[str],
+        make_request: Callable[[str], Any],
+        method_id: str,
+        result_key: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one API call per ID in HTTP batches of BATCH_SIZE, retrying 429/5xx items.
+
+        Args:
+            ids: Resource IDs (duplicates allowed)
+            make_request: Builds the HttpRequest for one ID
+            method_id: Discovery method ID (for quota accounting)
+            result_key: Key for the response in each result ("message", "thread")
+
+        Returns:
+            [{'id': ..., 'success': bool, result_key: response or None, 'error': str or None}, ...]
+            in the same order as ids
+        """
+        results: List[Dict[str, Any]] = [
+            {"id": item_id, "success": False, result_key: None, "error": None}
+            for item_id in ids
+        ]
+
+        retry_indexes: List[int] = []
+
+        def _callback(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            index = int(request_id)
+            result = results[index]
+            if exception is not None:
+                result["error"] = str(exception)
+                if self.scheduler.is_retryable(exception, method_id):
+                    retry_indexes.append(index)
+            else:
+                result["success"] = True
+                result[result_key] = response
+                result["error"] = None
+
+        pending = list(range(len(ids)))
+
+        for attempt in range(self.scheduler.max_retries + 1):
+            for start in range(0, len(pending), self.BATCH_SIZE):
+                chunk = pending[start:start + self.BATCH_SIZE]
+                batch = self.service.new_batch_http_request(callback=_callback)
+
+                for index in chunk:
+                    # request_id = 원래 순서의 인덱스 (중복 ID도 안전하게 처리)
+                    batch.add(make_request(ids[index]), request_id=str(index))
+
+                # 배치 안의 각 호출도 quota를 소모하므로 항목 수만큼 예약
+                self.scheduler.acquire(method_id, len(chunk))
+
+                try:
+                    batch.execute()
+                except Exception as e:
+                    # 배치 전체 실패 시 해당 묶음의 모든 항목을 실패로 기록
+                    for index in chunk:
+                        if not results[index]["success"]:
+                            results[index]["error"] = str(e)
+                            if self.scheduler.is_retryable(e, method_id):
+                                retry_indexes.append(index)
+
+            # 429/5xx로 실패한 항목만 backoff 후 다시 배치로 요청
+            pending = sorted(set(retry_indexes))
+            retry_indexes.clear()
+            if not pending or attempt >= self.scheduler.max_retries:
+                break
+            self.scheduler.backoff(attempt)
+
+        return results
+
+    def fetch_many(
+        self,
+        message_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch messages concurrently with per-thread service objects.
+
+        Better throughput than batch_get_messages() for large full-body
+        fetches. Concurrency is limited by max_workers (see __init__).
+
+        Returns:
+            Results in the same order and shape as batch_get_messages()
+        """
+        return self.fetcher.fetch_many(
+            message_ids, format=format, metadata_headers=metadata_headers, fields=fields
+        )
+
+    def build_inbox_query(
+        self,
+        skip_processed: bool = True,
+        newer_than: Optional[str] = None,
+        exclude_categories: Optional[List[str]] = None,
+        blocked_senders: Optional[List[str]] = None,
+    ) -> str:
+        """
+        Build a Gmail search query (q parameter) so filtering happens server-side.
+
+        Args:
+            skip_processed: Exclude emails with "처리완료" label
+            newer_than: Only emails newer than this (Gmail syntax: "7d", "2m", "1y")
+            exclude_categories: Inbox categories to skip (e.g. ["promotions", "social"])
+            blocked_senders: Sender addresses to skip
+
+        Returns:
+            Query string (empty if no filters)
+
+        Example:
+            gmail.build_inbox_query(newer_than="7d", exclude_categories=["promotions"])
+            # '-label:처리완료 newer_than:7d -category:promotions'
+        """
+        terms = []
+
+        if skip_processed:
+            terms.append("-label:처리완료")
+        if newer_than:
+            terms.append(f"newer_than:{newer_than}")
+        for category in exclude_categories or []:
+            terms.append(f"-category:{category.lower()}")
+        if blocked_senders:
+            # -{from:a from:b} = a, b 어느 쪽에서도 오지 않은 메일
+            terms.append("-{" + " ".join(f"from:{address}" for address in sorted(blocked_senders)) + "}")
+
+        return " ".join(terms)
+
+    def list_message_ids(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> List[str]:
+        """
+        List message IDs matching a query, following nextPageToken.
+
+        Args:
+            query: Gmail search query (q parameter)
+            label_ids: Only messages with all of these labels
+            max_results: Stop after this many IDs (None = all matches)
+
+        Returns:
+            Message IDs, newest first
+
+        Example:
+            ids = gmail.list_message_ids(query="-label:처리완료", label_ids=["INBOX"], max_results=20)
+        """
+        messages = self._list_paged(
+            self.service.users().messages().list, "messages", query, label_ids, max_results
+        )
+        return [m["id"] for m in messages]
+
+    def list_threads(
+        self,
+        query: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List threads matching a query, following nextPageToken.
+
+        Returns:
+            [{'id': ..., 'historyId': ..., 'snippet': ...}, ...], newest first
+            (pass to get_thread_summaries() so unchanged threads come from cache)
+        """
+        return self._list_paged(
+            self.service.users().threads().list, "threads", query, label_ids, max_results
+        )
+
+    def _list_paged(
+        self,
+        list_method: Callable[..., Any],
+        item_key: str,
+        query: Optional[str],
+        label_ids: Optional[List[str]],
+        max_results: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Call a messages/threads list method page by page (max 500 per page)."""
+        items: List[Dict[str, Any]] = []
+        page_token = None
+
+        while max_results is None or len(items) < max_results:
+            page_size = 500 if max_results is None else min(500, max_results - len(items))
+            params: Dict[str, Any] = {"userId": "me", "maxResults": page_size}
+            if query:
+                params["q"] = query
+            if label_ids:
+                params["labelIds"] = label_ids
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = list_method(**params).execute()
+            items.extend(response.get(item_key, []))
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        return items if max_results is None else items[:max_results]
+
+    def get_recent_emails(
+        self,
+        max_results: int = 10,
+        skip_processed: bool = True,
+        incremental: bool = False,
+        include_body: bool = True,
+        newer_than: Optional[str] = None,
+        exclude_categories: Optional[List[str]] = None,
+        blocked_senders: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Get recent emails from inbox.
 
+        Filters are pushed into the Gmail search query (see build_inbox_query),
+        so only matching messages are listed and fetched.
+
         Args:
             max_results: Maximum number of emails to fetch
             skip_processed: If True, skip emails with "처리완료" label (default: True)
+            incremental: If True, only look at messages added/relabeled since the
+                last saved historyId checkpoint (falls back to a full scan when
+                no checkpoint exists or it has expired). The checkpoint is
+                committed by save_sync_checkpoint() / mark_as_processed().
+                A full scan lists at most FULL_RESYNC_LIST_FACTOR * max_results
+                messages; older unprocessed mail is left to a non-incremental run.
+                Opt-in: the bundled entry points don't use it.
+            include_body: If False, fetch headers only (format=metadata) and leave
+                "body" empty with body_loaded=False. Call load_email_bodies() later
+                for the emails that survive pre-filtering.
+            newer_than: Only emails newer than this (e.g. "7d")
+            exclude_categories: Inbox categories to skip (e.g. ["promotions", "social"])
+            blocked_senders: Sender addresses to skip
 
         Returns:
-            List of email dictionaries with id, subject, sender, snippet, recipient_type
+            List of email dictionaries with id, subject, sender, snippet, recipient_type,
+            replied (I sent a message in the thread)
         """
-        # Get processed message IDs if filtering
-        processed_ids = set()
+        changes = self.get_inbox_changes() if incremental else None
+
+        if changes and not changes["full_resync"]:
+            return self._get_incremental_emails(
+                changes, max_results, skip_processed, include_body,
+                exclude_categories=exclude_categories, blocked_senders=blocked_senders,
+            )
+
         if skip_processed:
-            # Get "처리완료" label ID
-            label_ids = self.setup_email_labels()
-            processed_label_id = label_ids.get("처리완료")
-            if processed_label_id:
-                processed_results = (
-                    self.service.users()
-                    .messages()
-                    .list(userId="me", labelIds=[processed_label_id], maxResults=500)
-                    .execute()
+            self.setup_email_labels()  # "처리완료" 라벨이 있어야 -label: 검색이 동작
+
+        query = self.build_inbox_query(
+            skip_processed=skip_processed,
+            newer_than=newer_than,
+            exclude_categories=exclude_categories,
+            blocked_senders=blocked_senders,
+        )
+
+        if changes:
+            # 전체 재동기화: 최근 메일을 몇 번의 실행분만 나열하고, 이번에 처리하지 못한
+            # 메일은 다음 증분 실행으로 이월 (받은편지함 전체를 나열하지 않음)
+            message_ids = self.list_message_ids(
+                query, label_ids=["INBOX"], max_results=max_results * FULL_RESYNC_LIST_FACTOR
+            )
+            self._pending_sync_state = {
+                "history_id": changes["history_id"],
+                "pending_ids": message_ids[max_results:],
+            }
+        else:
+            message_ids = self.list_message_ids(query, label_ids=["INBOX"], max_results=max_results)
+
+        return self._build_email_list(message_ids[:max_results], include_body)
+
+    def _build_email_list(self, message_ids: List[str], include_body: bool = True) -> List[Dict[str, Any]]:
+        """Load messages (store first, then Gmail) and convert them to email dicts."""
+        emails = []
+
+        # Headers only unless body requested; cached messages cost no API calls
+        for record in self._get_message_records(message_ids, include_body):
+            if record is None:
+                continue  # Skip messages that failed to load (e.g. deleted meanwhile)
+            emails.append(self._parse_email(record))
+
+        # 답장 여부 (보낸 메일 스레드 인덱스, API 호출 없음)
+        if emails:
+            replied = self.get_replied_map([e["thread_id"] for e in emails])
+            for email in emails:
+                email["replied"] = replied[email["thread_id"]]
+
+        return emails
+
+    def load_email_bodies(self, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch bodies for emails returned by get_recent_emails(include_body=False).
+
+        Only emails with body_loaded=False are fetched (message store first,
+        then one batch for the rest). Updates the dicts in place.
+
+        Args:
+            emails: Email dicts (typically the ones that survived pre-filtering)
+
+        Returns:
+            The same list, with "body" filled in
+        """
+        pending = [e for e in emails if not e.get("body_loaded", True)]
+        if not pending:
+            return emails
+
+        records = self._get_message_records([e["id"] for e in pending], include_body=True)
+
+        for email, record in zip(pending, records):
+            if record is not None and record["body"] is not None:
+                email["body"] = record["body"]
+                email["body_loaded"] = True
+
+        return emails
+
+    # ===== 스레드 단위 조회 =====
+
+    def get_inbox_threads(
+        self,
+        max_results: int = 10,
+        skip_processed: bool = True,
+        newer_than: Optional[str] = None,
+        exclude_categories: Optional[List[str]] = None,
+        blocked_senders: Optional[List[str]] = None,
+        format: str = "metadata",
+    ) -> List[Dict[str, Any]]:
+        """
+        Get summaries of recent inbox threads (one threads.get per changed thread).
+
+        Uses the same server-side filters as get_recent_emails(). Threads
+        whose historyId hasn't changed since the last run come from the
+        local store without any threads.get call.
+
+        Args:
+            max_results: Maximum number of threads
+            skip_processed: Skip threads with "처리완료" label
+            newer_than: Only threads newer than this (e.g. "7d")
+            exclude_categories: Inbox categories to skip
+            blocked_senders: Sender addresses to skip
+            format: "metadata" (headers only) or "full" (bodies are saved to the message store)
+
+        Returns:
+            List of thread summaries (see get_thread_summaries)
+        """
+        if skip_processed:
+            self.setup_email_labels()
+
+        query = self.build_inbox_query(
+            skip_processed=skip_processed,
+            newer_than=newer_than,
+            exclude_categories=exclude_categories,
+            blocked_senders=blocked_senders,
+        )
+        threads = self.list_threads(query, label_ids=["INBOX"], max_results=max_results)
+
+        return [s for s in self.get_thread_summaries(threads, format=format) if s is not None]
+
+    def get_thread_summaries(self, threads: List[Any], format: str = "metadata") -> List[Optional[Dict[str, Any]]]:
+        """
+        Load threads (cache first, then one batch) and summarize them.
+
+        A cached summary is reused when its historyId matches the one from
+        threads.list, or when the thread was already loaded by this client.
+        Messages of fetched threads are saved to the message store too.
+
+        Args:
+            threads: Thread IDs, or {'id', 'historyId'} dicts from list_threads()
+            format: "metadata" or "full"
+
+        Returns:
+            Summaries in the same order as threads (None if a thread failed to load):
+            {
+                'thread_id': 't456',
+                'history_id': '98765',
+                'message_ids': ['m1', 'm2'],
+                'message_count': 2,
+                'latest_inbound': {'id': 'm1', 'sender': ..., 'subject': ..., 'date': ..., 'label_ids': [...]},
+                'replied': True,           # I sent a message after the first one
+                'reply_count': 1,
+                'awaiting_reply': False,   # Latest message is not from me
+                'participants': ['a@example.com'],  # Addresses other than mine
+            }
+
+        Example:
+            for summary in gmail.get_thread_summaries(gmail.list_threads(label_ids=["INBOX"], max_results=20)):
+                if summary and summary['awaiting_reply']:
+                    print(summary['latest_inbound']['subject'])
+        """
+        refs = [t if isinstance(t, dict) else {"id": t} for t in threads]
+        cached = self.store.get_threads(ref["id"] for ref in refs)
+
+        summaries: Dict[str, Dict[str, Any]] = {}
+        to_fetch: List[str] = []
+        for ref in refs:
+            summary = cached.get(ref["id"])
+            history_id = ref.get("historyId")
+            if summary and (
+                (history_id is not None and str(history_id) == summary["history_id"])
+                or (history_id is None and ref["id"] in self._fresh_threads)
+            ):
+                summaries[ref["id"]] = summary
+            elif ref["id"] not in to_fetch:
+                to_fetch.append(ref["id"])
+
+        if to_fetch:
+            include_body = format == "full"
+            results = self.batch_get_threads(
+                to_fetch,
+                format=format,
+                metadata_headers=None if include_body else METADATA_HEADERS,
+                fields=THREAD_FULL_FIELDS if include_body else THREAD_METADATA_FIELDS,
+            )
+
+            records = []
+            fetched = []
+            for result in results:
+                if not result["success"]:
+                    continue
+                thread = result["thread"]
+                fetched.append(self._summarize_thread(thread))
+                records.extend(self._to_record(m, include_body) for m in thread.get("messages", []))
+
+            self._put_records(records)
+            self.store.put_threads(fetched)
+            summaries.update((summary["thread_id"], summary) for summary in fetched)
+
+        self._fresh_threads.update(summaries)
+        return [summaries.get(ref["id"]) for ref in refs]
+
+    def _summarize_thread(self, thread: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive latest inbound message, reply state and participants from a thread resource."""
+        import re
+
+        my_addresses = set(self.get_my_addresses())
+
+        def _addresses(value: str) -> List[str]:
+            return [a.lower() for a in re.findall(r'[\w\.+-]+@[\w\.-]+', value)]
+
+        messages = thread.get("messages", [])
+        latest_inbound = None
+        reply_count = 0
+        last_from_me = False
+        participants: List[str] = []
+
+        for index, msg in enumerate(messages):
+            headers = msg.get("payload", {}).get("headers", [])
+
+            def _header(name: str) -> str:
+                return next((h["value"] for h in headers if h["name"].lower() == name), "")
+
+            sender = _header("from")
+            last_from_me = bool(my_addresses.intersection(_addresses(sender)))
+
+            if last_from_me:
+                if index > 0:  # First message is the original email, not a reply
+                    reply_count += 1
+            else:
+                latest_inbound = {
+                    "id": msg["id"],
+                    "sender": sender,
+                    "subject": _header("subject"),
+                    "date": _header("date"),
+                    "label_ids": msg.get("labelIds", []),
+                }
+
+            for address in _addresses(sender) + _addresses(_header("to")) + _addresses(_header("cc")):
+                if address not in my_addresses and address not in participants:
+                    participants.append(address)
+
+        return {
+            "thread_id": thread["id"],
+            "history_id": str(thread.get("historyId", "")),
+            "message_ids": [m["id"] for m in messages],
+            "message_count": len(messages),
+            "latest_inbound": latest_inbound,
+            "replied": reply_count > 0,
+            "reply_count": reply_count,
+            "awaiting_reply": bool(messages) and not last_from_me,
+            "participants": participants,
+        }
+
+    def _parse_email(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a message record (see MessageStore) into an email dict."""
+        # Extract headers
+        headers = record["headers"]
+        subject = next((h["value"] for h in headers if h["name"] == "Subject"), "No Subject")
+        sender = next((h["value"] for h in headers if h["name"] == "From"), "Unknown")
+        date_str = next((h["value"] for h in headers if h["name"] == "Date"), "")
+        to_header = next((h["value"] for h in headers if h["name"] == "To"), "")
+        cc = next((h["value"] for h in headers if h["name"] == "Cc"), "")
+
+        # Convert label IDs to names
+        label_names = self.get_label_names(record["label_ids"])
+
+        # Determine recipient type (To/CC/Group), matching any of my addresses
+        recipient_info = self.get_recipient_type(headers)
+
+        return {
+            "id": record["id"],
+            "thread_id": record["thread_id"],
+            "subject": subject,
+            "sender": sender,
+            "date": date_str,
+            "to": to_header,
+            "cc": cc,
+            "labels": label_names,
+            "snippet": record["snippet"],
+            "body": record["body"] or "",
+            "body_loaded": record["body"] is not None,
+            "recipient_type": recipient_info["recipient_type"],
+            "priority_modifier": recipient_info["priority_modifier"],
+        }
+
+    # ===== 로컬 메시지 저장소 =====
+
+    def _get_message_records(
+        self, message_ids: List[str], include_body: bool = False
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get message records from the local store, fetching only unseen messages.
+
+        Args:
+            message_ids: Gmail message IDs
+            include_body: If True, messages cached without a body are re-fetched in full
+
+        Returns:
+            Records in the same order as message_ids (None for messages that failed to load)
+        """
+        self._sync_store_labels()
+
+        records = self.store.get_many(message_ids)
+        missing = [
+            msg_id for msg_id in dict.fromkeys(message_ids)
+            if msg_id not in records or (include_body and records[msg_id]["body"] is None)
+        ]
+
+        # history로 이어갈 수 없었던 라벨만 다시 조회 (헤더/본문은 캐시 사용)
+        stale = [
+            msg_id for msg_id, record in records.items()
+            if record["labels_stale"] and msg_id not in missing
+        ]
+        if stale:
+            fetched = self.batch_get_messages(stale, format="minimal", fields="id,labelIds")
+            labels = {
+                result["id"]: result["message"].get("labelIds", [])
+                for result in fetched if result["success"]
+            }
+            self.store.set_labels_many(labels)
+            for msg_id, label_ids in labels.items():
+                records[msg_id]["label_ids"] = label_ids
+
+        if missing:
+            if include_body:
+                # 본문은 용량이 커서 배치보다 병렬 조회가 빠름
+                fetched = self.fetch_many(missing, format="full", fields=FULL_FIELDS)
+            else:
+                fetched = self.batch_get_messages(
+                    missing,
+                    format="metadata",
+                    metadata_headers=METADATA_HEADERS,
+                    fields=METADATA_FIELDS,
                 )
-                processed_ids = set(m['id'] for m in processed_results.get('messages', []))
 
-        # Get message list (fetch more to account for filtering)
-        fetch_count = max_results * 3 if skip_processed else max_results
-        results = (
-            self.service.users()
-            .messages()
-            .list(userId="me", labelIds=["INBOX"], maxResults=fetch_count)
-            .execute()
+            new_records = [
+                self._to_record(result["message"], include_body)
+                for result in fetched if result["success"]
+            ]
+            self._put_records(new_records)
+
+            for record in new_records:
+                records[record["id"]] = record
+
+        return [records.get(msg_id) for msg_id in message_ids]
+
+    def _put_records(self, records: List[Dict[str, Any]]) -> None:
+        """Store message records (the contact index skips mail from my own addresses)."""
+        if records:
+            self.store.own_addresses = set(self.get_my_addresses())
+        self.store.put_many(records)
+
+    def _to_record(self, message: Dict[str, Any], include_body: bool) -> Dict[str, Any]:
+        """Convert a Gmail API message resource into a store record."""
+        payload = message.get("payload", {})
+        wanted_headers = {name.lower() for name in METADATA_HEADERS}
+
+        return {
+            "id": message["id"],
+            "thread_id": message.get("threadId", ""),
+            "label_ids": message.get("labelIds", []),
+            "snippet": message.get("snippet", ""),
+            # 수신 시각 (epoch ms). Date 헤더는 발신자가 임의로 쓰는 값이라 집계에 쓰지 않음
+            "internal_date": int(message["internalDate"]) if message.get("internalDate") else None,
+            "headers": [h for h in payload.get("headers", []) if h["name"].lower() in wanted_headers],
+            # Get email body (prefer text/plain)
+            "body": self._get_message_body(payload) if include_body else None,
+        }
+
+    def _sync_store_labels(self) -> None:
+        """
+        Replay label changes since the store's historyId so cached labels stay current.
+
+        Also adds threads of newly sent messages to the sent-thread index.
+        Runs once per client, on the shared history walk (_walk_history).
+        If the store's checkpoint has expired, cached labels are marked stale
+        (refreshed on next read) and the sent-thread index is rebuilt; cached
+        headers and bodies are kept.
+        """
+        if self._store_labels_synced:
+            return
+        self._store_labels_synced = True
+
+        start_history_id = self.store.get_meta("history_id")
+        walk = self._walk_history()
+
+        if start_history_id and not self._history_covers(walk, start_history_id):
+            # 체크포인트 만료 → 라벨만 신뢰할 수 없음 (메시지 캐시는 유지)
+            self.store.mark_labels_stale()
+        elif start_history_id:
+            for record in self._history_records_after(walk, start_history_id):
+                # 내가 보낸 메일이 생긴 스레드 → 답장 인덱스에 추가
+                self.store.add_sent_threads(
+                    change["message"].get("threadId", "")
+                    for change in record.get("messagesAdded", []) + record.get("labelsAdded", [])
+                    if "SENT" in change["message"].get("labelIds", [])
+                )
+                for added in record.get("labelsAdded", []):
+                    self.store.update_labels(added["message"]["id"], add=added.get("labelIds", []))
+                for removed in record.get("labelsRemoved", []):
+                    self.store.update_labels(removed["message"]["id"], remove=removed.get("labelIds", []))
+                deleted_ids = [d["message"]["id"] for d in record.get("messagesDeleted", [])]
+                if deleted_ids:
+                    self.store.delete(deleted_ids)
+
+        self.store.set_meta("history_id", walk["history_id"])
+
+    def _walk_history(self) -> Dict[str, Any]:
+        """
+        Read users.history.list once per client for both history consumers.
+
+        The store's label checkpoint (meta history_id) and the incremental
+        sync checkpoint (email_sync_state.json) usually differ, so the walk
+        starts at the older one and each consumer skips the records up to its
+        own checkpoint (_history_records_after). If that start has expired
+        (404), the walk is retried from the newer one.
+
+        Returns:
+            Dict with:
+            - records: History records (oldest first)
+            - history_id: Latest historyId (next checkpoint for both consumers)
+            - since: startHistoryId the records are complete from (None if
+              every checkpoint expired or none exists)
+        """
+        if self._history_walk is not None:
+            return self._history_walk
+
+        starts = sorted(
+            {h for h in (self.store.get_meta("history_id"), self._load_sync_state().get("history_id")) if h},
+            key=int,
         )
 
-        messages = results.get("messages", [])
+        walk: Optional[Dict[str, Any]] = None
+        for start_history_id in starts:
+            try:
+                walk = self._list_history(start_history_id)
+                break
+            except HttpError as e:
+                # 404: startHistoryId가 만료됨 (보통 약 1주일 보관) → 더 최근 체크포인트로 재시도
+                if e.resp.status != 404:
+                    raise
+
+        if walk is None:
+            profile = self.service.users().getProfile(userId='me').execute()
+            walk = {"records": [], "history_id": str(profile["historyId"]), "since": None}
+
+        self._history_walk = walk
+        return walk
+
+    def _list_history(self, start_history_id: str) -> Dict[str, Any]:
+        """Page through users.history.list from one startHistoryId (see _walk_history)."""
+        records: List[Dict[str, Any]] = []
+        latest_history_id = start_history_id
+        page_token = None
+
+        while True:
+            params: Dict[str, Any] = {
+                "userId": "me",
+                "startHistoryId": start_history_id,
+                "historyTypes": ["messageAdded", "labelAdded", "labelRemoved", "messageDeleted"],
+            }
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = self.service.users().history().list(**params).execute()
+            records.extend(response.get("history", []))
+
+            latest_history_id = response.get("historyId", latest_history_id)
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        return {"records": records, "history_id": str(latest_history_id), "since": start_history_id}
+
+    @staticmethod
+    def _history_covers(walk: Dict[str, Any], start_history_id: str) -> bool:
+        """Check if the walk has every change after a consumer's checkpoint."""
+        return walk["since"] is not None and int(start_history_id) >= int(walk["since"])
+
+    @staticmethod
+    def _history_records_after(walk: Dict[str, Any], start_history_id: str) -> List[Dict[str, Any]]:
+        """History records newer than a consumer's checkpoint."""
+        return [r for r in walk["records"] if int(r["id"]) > int(start_history_id)]
+
+    # ===== 증분 동기화 (historyId 체크포인트) =====
+
+    def get_inbox_changes(self) -> Dict[str, Any]:
+        """
+        Get inbox message IDs added or relabeled since the saved historyId checkpoint.
+
+        Uses users.history.list so a daily/hourly cron run only touches the delta
+        instead of re-listing the whole inbox.
+
+        Returns:
+            Dict with:
+            - full_resync: True if no checkpoint exists or it has expired
+            - message_ids: Candidate message IDs (newest first, deduplicated)
+            - history_id: historyId to save as the next checkpoint
+        """
+        state = self._load_sync_state()
+        start_history_id = state.get("history_id")
+
+        if not start_history_id:
+            return self._full_resync_changes()
+
+        walk = self._walk_history()
+        if not self._history_covers(walk, start_history_id):
+            # startHistoryId가 만료됨 → 전체 재동기화
+            return self._full_resync_changes()
+
+        processed_label_id = self.setup_email_labels().get("처리완료")
+
+        # 이전 실행에서 이월된 메일 + 새 변경분 (history는 오래된 순)
+        candidate_ids = list(reversed(state.get("pending_ids", [])))
+
+        for record in self._history_records_after(walk, start_history_id):
+            # 새로 받은 메일
+            for added in record.get("messagesAdded", []):
+                if "INBOX" in added["message"].get("labelIds", []):
+                    candidate_ids.append(added["message"]["id"])
+
+            # 받은편지함으로 다시 이동된 메일
+            for added in record.get("labelsAdded", []):
+                if "INBOX" in added.get("labelIds", []):
+                    candidate_ids.append(added["message"]["id"])
+
+            # 처리완료 라벨이 제거된 메일 (재처리 대상)
+            for removed in record.get("labelsRemoved", []):
+                if processed_label_id and processed_label_id in removed.get("labelIds", []):
+                    candidate_ids.append(removed["message"]["id"])
+
+        # 최신순 정렬 + 중복 제거
+        message_ids = list(dict.fromkeys(reversed(candidate_ids)))
+
+        return {
+            "full_resync": False,
+            "message_ids": message_ids,
+            "history_id": walk["history_id"],
+        }
+
+    def _full_resync_changes(self) -> Dict[str, Any]:
+        """Changes marker for a full resync (checkpoint taken before listing)."""
+        return {
+            "full_resync": True,
+            "message_ids": [],
+            "history_id": self._walk_history()["history_id"],
+        }
+
+    def _get_incremental_emails(
+        self,
+        changes: Dict[str, Any],
+        max_results: int,
+        skip_processed: bool,
+        include_body: bool = True,
+        exclude_categories: Optional[List[str]] = None,
+        blocked_senders: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build email list from history delta candidates (INBOX, not 처리완료).
 
-        # Filter out processed messages
-        if skip_processed:
-            messages = [m for m in messages if m['id'] not in processed_ids]
+        History deltas can't be searched, so category and blocked-sender
+        filters are applied to the stored records instead of the query.
+        """
+        import re
 
-        # Get my email address once for recipient type detection
-        profile = self.service.users().getProfile(userId='me').execute()
-        my_email = profile['emailAddress'].lower()
+        processed_label_id = self.setup_email_labels().get("처리완료") if skip_processed else None
+        excluded_labels = {f"CATEGORY_{c.upper()}" for c in exclude_categories or []}
+        blocked = {address.lower() for address in blocked_senders or []}
+
+        # 후보 메일의 현재 라벨 확인 (저장소 라벨은 history로 최신 상태 유지)
+        records = self._get_message_records(changes["message_ids"])
+
+        eligible_ids = []
+        for record in records:
+            if record is None:
+                continue  # Deleted since the history record was written
+            labels = record["label_ids"]
+            if "INBOX" not in labels:
+                continue
+            if processed_label_id and processed_label_id in labels:
+                continue
+            if excluded_labels.intersection(labels):
+                continue
+            if blocked:
+                sender = next((h["value"] for h in record["headers"] if h["name"] == "From"), "")
+                match = re.search(r'[\w\.+-]+@[\w\.-]+', sender)
+                if match and match.group(0).lower() in blocked:
+                    continue
+            eligible_ids.append(record["id"])
+
+        # max_results를 넘는 메일은 다음 실행으로 이월
+        self._pending_sync_state = {
+            "history_id": changes["history_id"],
+            "pending_ids": eligible_ids[max_results:],
+        }
 
-        emails = []
+        return self._build_email_list(eligible_ids[:max_results], include_body)
 
-        for msg in messages[:max_results]:  # Limit to max_results
-            # Get full message details
-            message = (
-                self.service.users().messages().get(userId="me", id=msg["id"]).execute()
-            )
+    def save_sync_checkpoint(self) -> None:
+        """
+        Commit the historyId checkpoint reserved by get_recent_emails(incremental=True).
 
-            # Extract headers
-            headers = message["payload"]["headers"]
-            subject = next((h["value"] for h in headers if h["name"] == "Subject"), "No Subject")
-            sender = next((h["value"] for h in headers if h["name"] == "From"), "Unknown")
-            date_str = next((h["value"] for h in headers if h["name"] == "Date"), "")
-            to_header = next((h["value"] for h in headers if h["name"] == "To"), "")
-            cc = next((h["value"] for h in headers if h["name"] == "Cc"), "")
-            label_ids = message.get("labelIds", [])
+        Call after the fetched emails have been processed so an interrupted run
+        re-reads the same delta next time. mark_as_processed() calls this automatically.
+        """
+        if not self._pending_sync_state:
+            return
 
-            # Convert label IDs to names
-            label_names = self.get_label_names(label_ids)
+        self._save_sync_state(self._pending_sync_state)
+        self._pending_sync_state = None
 
-            # Extract thread ID and full body
-            thread_id = message["threadId"]
+    def _load_sync_state(self) -> Dict[str, Any]:
+        """Load historyId checkpoint from email_sync_state.json."""
+        import json
 
-            # Get email body (prefer text/plain)
-            body = self._get_message_body(message["payload"])
+        if os.path.exists(SYNC_STATE_PATH):
+            try:
+                with open(SYNC_STATE_PATH, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass  # Corrupt state → treat as no checkpoint (full resync)
 
-            # Determine recipient type (To/CC/Group)
-            recipient_info = self.get_recipient_type(headers, my_email)
+        return {}
 
-            emails.append(
-                {
-                    "id": message["id"],
-                    "thread_id": thread_id,
-                    "subject": subject,
-                    "sender": sender,
-                    "date": date_str,
-                    "to": to_header,
-                    "cc": cc,
-                    "labels": label_names,
-                    "snippet": message["snippet"],
-                    "body": body,
-                    "recipient_type": recipient_info["recipient_type"],
-                    "priority_modifier": recipient_info["priority_modifier"],
-                }
-            )
+    def _save_sync_state(self, state: Dict[str, Any]) -> None:
+        """Save historyId checkpoint to email_sync_state.json."""
+        import json
 
-        return emails
+        with open(SYNC_STATE_PATH, 'w') as f:
+            json.dump(state, f)
 
     def _get_message_body(self, payload: dict) -> str:
         """Extract email body from message payload (recursive for nested parts)."""
@@ -203,7 +1201,8 @@ class GmailClient:
 
         Args:
             headers: Email headers list from Gmail API
-            my_email: User's email address (if None, will fetch from profile)
+            my_email: User's email address (if None, uses the cached account
+                      addresses including send-as aliases)
 
         Returns:
             Dict with:
@@ -213,12 +1212,11 @@ class GmailClient:
         """
         import re
 
-        # Get my email if not provided
+        # My addresses (cached profile + aliases) if not provided
         if my_email is None:
-            profile = self.service.users().getProfile(userId='me').execute()
-            my_email = profile['emailAddress'].lower()
+            my_addresses = set(self.get_my_addresses())
         else:
-            my_email = my_email.lower()
+            my_addresses = {my_email.lower()}
 
         # Extract To, CC headers
         to_header = next((h["value"] for h in headers if h["name"].lower() == "to"), "")
@@ -244,7 +1242,7 @@ class GmailClient:
                 break
 
         # Determine recipient type
-        if my_email in cc_emails:
+        if my_addresses & set(cc_emails):
             return {
                 "recipient_type": "cc",
                 "priority_modifier": -1,
@@ -256,7 +1254,7 @@ class GmailClient:
                 "priority_modifier": -1,
                 "description": "그룹메일 수신 → 우선순위 -1",
             }
-        elif my_email in to_emails:
+        elif my_addresses & set(to_emails):
             return {
                 "recipient_type": "direct",
                 "priority_modifier": 0,
@@ -278,33 +1276,46 @@ class GmailClient:
             thread_id: Gmail thread ID to check
 
         Returns:
-            True if user has sent a reply in this thread, False otherwise
+            True if user has sent a message in this thread, False otherwise
         """
         try:
-            # Get my email address
-            profile = self.service.users().getProfile(userId='me').execute()
-            my_email = profile['emailAddress'].lower()
+            return self.get_replied_map([thread_id])[thread_id]
+        except Exception:
+            return False  # On error, assume not replied
 
-            # Get thread with all messages
-            thread = self.service.users().threads().get(
-                userId='me', id=thread_id, format='metadata',
-                metadataHeaders=['From']
-            ).execute()
+    def get_replied_map(self, thread_ids: List[str]) -> Dict[str, bool]:
+        """
+        Check many threads for a message I sent, using the local sent-thread index.
 
-            messages = thread.get('messages', [])
+        The index is built once from SENT listings and kept current with
+        history deltas, so lookups make no API calls after the first run.
 
-            # Skip the first message (original email) and check if I sent any reply
-            for msg in messages[1:]:  # Skip first message
-                headers = msg.get('payload', {}).get('headers', [])
-                from_header = next(
-                    (h['value'] for h in headers if h['name'].lower() == 'from'), ''
-                )
-                if my_email in from_header.lower():
-                    return True  # I replied
+        Args:
+            thread_ids: Gmail thread IDs
 
-            return False  # No reply from me
-        except Exception:
-            return False  # On error, assume not replied
+        Returns:
+            Dict mapping thread ID to True if I sent a message in that thread
+
+        Example:
+            replied = gmail.get_replied_map([e['thread_id'] for e in emails])
+        """
+        self._ensure_sent_index()
+        sent = self.store.get_sent_threads(thread_ids)
+        return {thread_id: thread_id in sent for thread_id in thread_ids}
+
+    def _ensure_sent_index(self) -> None:
+        """Apply history deltas, then build the sent-thread index if the store doesn't have one."""
+        self._sync_store_labels()
+
+        if self.store.get_meta("sent_index_built"):
+            return
+
+        # messages.list 응답에 threadId가 포함되므로 메시지 조회 없이 구성 가능
+        sent_messages = self._list_paged(
+            self.service.users().messages().list, "messages", None, ["SENT"], None
+        )
+        self.store.add_sent_threads(m["threadId"] for m in sent_messages)
+        self.store.set_meta("sent_index_built", "1")
 
     def create_draft(
         self, thread_id: str, to: str, subject: str, body: str, is_html: bool = True
@@ -322,6 +1333,23 @@ class GmailClient:
         Returns:
             Created draft information with 'id' and 'message' fields
         """
+        # Create draft
+        draft = (
+            self.service.users()
+            .drafts()
+            .create(
+                userId="me",
+                body=self._build_draft_body(thread_id, to, subject, body, is_html),
+            )
+            .execute()
+        )
+
+        return draft
+
+    def _build_draft_body(
+        self, thread_id: Optional[str], to: str, subject: str, body: str, is_html: bool = True
+    ) -> Dict[str, Any]:
+        """Build the drafts.create request body (MIME message, base64url-encoded)."""
         import base64
         from email.mime.text import MIMEText
 
@@ -333,18 +1361,137 @@ class GmailClient:
         # Encode message
         raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
-        # Create draft
-        draft = (
-            self.service.users()
-            .drafts()
-            .create(
-                userId="me",
-                body={"message": {"raw": raw, "threadId": thread_id}},
+        draft_message: Dict[str, Any] = {"raw": raw}
+        if thread_id:
+            draft_message["threadId"] = thread_id
+        return {"message": draft_message}
+
+    def create_drafts_bulk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create (or refresh) draft replies for many threads concurrently.
+
+        All MIME messages are built up front and submitted to the worker pool.
+        The thread ID is the idempotency key: the draft created for a thread
+        is recorded in the message store, and a rerun updates that draft
+        (drafts.update) instead of adding another one to the thread. If the
+        recorded draft is gone (sent or deleted), a new one is created.
+
+        Args:
+            items: Dicts with 'thread_id', 'to', 'subject', 'body' and optional
+                   'is_html' (default: True)
+
+        Returns:
+            Results in input order:
+            [{'thread_id': ..., 'success': True, 'draft': {...}, 'draft_id': ...,
+              'updated': False, 'error': None}, ...]
+
+        Example:
+            results = gmail.create_drafts_bulk([
+                {'thread_id': e['thread_id'], 'to': e['sender'], 'subject': d['subject'], 'body': d['body']}
+                for e, d in zip(emails, drafts)
+            ])
+            failed = [r for r in results if not r['success']]
+        """
+        plan = self._plan_drafts(items)
+
+        futures = {
+            key: self.fetcher.submit(
+                lambda service, b=draft_body, d=existing_id: self._upsert_draft(service, b, d)
             )
-            .execute()
+            for key, (draft_body, existing_id) in plan.items()
+        }
+
+        outcomes: Dict[str, Any] = {}
+        for key, future in futures.items():
+            try:
+                outcomes[key] = future.result()
+            except Exception as e:
+                outcomes[key] = e
+
+        return self._finish_drafts(items, outcomes)
+
+    def _draft_key(self, index: int, item: Dict[str, Any]) -> str:
+        """Idempotency key of a draft item (thread ID; items without a thread are never merged)."""
+        return item.get("thread_id") or f"#{index}"
+
+    def _plan_drafts(
+        self, items: List[Dict[str, Any]]
+    ) -> Dict[str, Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Build draft request bodies and find existing drafts, one per thread.
+
+        Returns:
+            Dict mapping draft key to (drafts.create/update body, existing draft ID or None).
+            If a thread appears more than once, the last item wins.
+        """
+        existing = self.store.get_thread_drafts(
+            [item["thread_id"] for item in items if item.get("thread_id")]
         )
 
-        return draft
+        plan: Dict[str, Tuple[Dict[str, Any], Optional[str]]] = {}
+        for index, item in enumerate(items):
+            draft_body = self._build_draft_body(
+                item.get("thread_id"), item["to"], item["subject"], item["body"],
+                item.get("is_html", True),
+            )
+            plan[self._draft_key(index, item)] = (draft_body, existing.get(item.get("thread_id")))
+
+        return plan
+
+    def _upsert_draft(
+        self, service: Any, draft_body: Dict[str, Any], existing_id: Optional[str]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Update an existing draft, or create one (runs on a worker thread).
+
+        Returns:
+            (draft object, True if an existing draft was updated)
+        """
+        drafts = service.users().drafts()
+        if existing_id:
+            try:
+                return drafts.update(userId="me", id=existing_id, body=draft_body).execute(), True
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise
+                # 기록된 초안이 발송/삭제됨 → 새로 생성
+
+        return drafts.create(userId="me", body=draft_body).execute(), False
+
+    def _finish_drafts(
+        self, items: List[Dict[str, Any]], outcomes: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Record created drafts per thread and build results in input order."""
+        created = {}
+        results = []
+
+        for index, item in enumerate(items):
+            outcome = outcomes[self._draft_key(index, item)]
+            if isinstance(outcome, BaseException):
+                results.append({
+                    "thread_id": item.get("thread_id"),
+                    "success": False,
+                    "draft": None,
+                    "draft_id": None,
+                    "updated": False,
+                    "error": str(outcome),
+                })
+                continue
+
+            draft, updated = outcome
+            if item.get("thread_id"):
+                created[item["thread_id"]] = draft.get("id", "")
+            results.append({
+                "thread_id": item.get("thread_id"),
+                "success": True,
+                "draft": draft,
+                "draft_id": draft.get("id"),
+                "updated": updated,
+                "error": None,
+            })
+
+        self.store.put_thread_drafts(created)
+        return results
 
     def send_draft(self, draft_id: str) -> Dict[str, Any]:
         """
@@ -368,6 +1515,7 @@ class GmailClient:
             .execute()
         )
 
+        self.store.add_sent_threads([sent.get("threadId", "")])
         return sent
 
     def send_email(
@@ -411,19 +1559,34 @@ class GmailClient:
             .execute()
         )
 
+        self.store.add_sent_threads([sent.get("threadId", "")])
         return sent
 
-    def batch_send_drafts(self, draft_ids: List[str]) -> List[Dict[str, Any]]:
+    def batch_send_drafts(
+        self, draft_ids: List[str], max_concurrent: int = DEFAULT_SEND_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
         """
-        Send multiple Gmail drafts by ID.
+        Send multiple Gmail drafts by ID, concurrently and journaled.
 
         Preserves all user edits made in Gmail app.
 
+        Each send is written to the send journal (email_send_journal.jsonl)
+        as 'pending' before drafts.send and as 'sent'/'failed' after, so a
+        rerun after a crash only sends what is still pending:
+        - 'sent' drafts are not sent again; the recorded result is returned
+        - 'pending' drafts (interrupted mid-send) are sent only if the draft
+          still exists (Gmail deletes a draft once it is sent)
+        - 'failed' drafts are retried
+
+        Sends run on the worker pool, at most max_concurrent at a time, and
+        are rate limited by the scheduler's send bucket.
+
         Args:
             draft_ids: List of draft IDs to send
+            max_concurrent: Max drafts.send calls in flight
 
         Returns:
-            List of results with success/failure status
+            List of results with success/failure status (same order as draft_ids)
 
         Example:
             results = gmail.batch_send_drafts(['r123...', 'r456...'])
@@ -433,29 +1596,98 @@ class GmailClient:
                 else:
                     print(f"Failed: {result['error']}")
         """
-        results = []
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        results, to_send = self._plan_sends(draft_ids)
+
+        # 동시 발송 수를 max_concurrent로 제한 (완료되는 대로 다음 초안 제출)
+        in_flight: Dict[Any, str] = {}
+        queue = list(reversed(to_send))
+        while queue or in_flight:
+            while queue and len(in_flight) < max_concurrent:
+                draft_id = queue.pop()
+                self.send_journal.record(draft_id, PENDING)
+                future = self.fetcher.submit(lambda service, d=draft_id: self._send_draft_call(service, d))
+                in_flight[future] = draft_id
+
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                draft_id = in_flight.pop(future)
+                try:
+                    results[draft_id] = self._record_send(draft_id, sent=future.result())
+                except Exception as e:
+                    results[draft_id] = self._record_send(draft_id, error=e)
+
+        return [results[draft_id] for draft_id in draft_ids]
+
+    def _plan_sends(self, draft_ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        Check the send journal before sending (shared with AsyncGmailClient).
 
-        for draft_id in draft_ids:
-            try:
-                sent = self.send_draft(draft_id)
+        Returns:
+            (results for drafts already sent or in an unknown state, draft IDs to send)
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        to_send = []
+
+        for draft_id in dict.fromkeys(draft_ids):
+            entry = self.send_journal.get(draft_id)
+            if entry and entry["status"] == PENDING:
+                # 발송 도중 중단됨 → 초안이 사라졌으면 이미 발송된 것
+                try:
+                    if not self._draft_exists(draft_id):
+                        entry = self.send_journal.record(draft_id, SENT)
+                except Exception as e:
+                    # 발송 여부를 알 수 없으면 중복 발송하지 않고 다음 실행으로 미룸
+                    results[draft_id] = {**self._send_result(entry), "error": str(e)}
+                    continue
+            if entry and entry["status"] == SENT:
+                results[draft_id] = self._send_result(entry)
+            else:
+                to_send.append(draft_id)
 
-                results.append({
-                    "draft_id": draft_id,
-                    "success": True,
-                    "message_id": sent.get("id"),
-                    "thread_id": sent.get("threadId"),
-                    "error": None,
-                })
-            except Exception as e:
-                results.append({
-                    "draft_id": draft_id,
-                    "success": False,
-                    "message_id": None,
-                    "thread_id": None,
-                    "error": str(e),
-                })
+        return results, to_send
 
-        return results
+    @staticmethod
+    def _send_draft_call(service: Any, draft_id: str) -> Dict[str, Any]:
+        """drafts.send on the given service (worker pool thread)."""
+        return service.users().drafts().send(userId="me", body={"id": draft_id}).execute()
+
+    def _record_send(
+        self,
+        draft_id: str,
+        sent: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> Dict[str, Any]:
+        """Journal a finished drafts.send (and index the sent thread); returns its result."""
+        if error is not None:
+            entry = self.send_journal.record(draft_id, FAILED, error=str(error))
+        else:
+            entry = self.send_journal.record(
+                draft_id, SENT, message_id=sent.get("id"), thread_id=sent.get("threadId")
+            )
+            self.store.add_sent_threads([sent.get("threadId", "")])
+        return self._send_result(entry)
+
+    def _draft_exists(self, draft_id: str) -> bool:
+        """Check if a draft still exists (404 = deleted or already sent)."""
+        try:
+            self.service.users().drafts().get(userId="me", id=draft_id, format="minimal").execute()
+            return True
+        except HttpError as e:
+            if e.resp.status == 404:
+                return False
+            raise
+
+    def _send_result(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a send journal entry into a batch_send_drafts result."""
+        return {
+            "draft_id": entry["draft_id"],
+            "success": entry["status"] == SENT,
+            "message_id": entry.get("message_id"),
+            "thread_id": entry.get("thread_id"),
+            "error": entry.get("error"),
+        }
 
     def batch_send_emails(self, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -525,14 +1757,15 @@ class GmailClient:
         messages = results.get("messages", [])
         sent_emails = []
 
-        for msg in messages:
-            # Get full message details
-            message = (
-                self.service.users().messages().get(userId="me", id=msg["id"]).execute()
-            )
+        # Get full message details (message store first, then batches)
+        records = self._get_message_records([m["id"] for m in messages], include_body=True)
+
+        for record in records:
+            if record is None:
+                continue
 
             # Extract headers
-            headers = message["payload"]["headers"]
+            headers = record["headers"]
             subject = next(
                 (h["value"] for h in headers if h["name"] == "Subject"), "No Subject"
             )
@@ -541,7 +1774,7 @@ class GmailClient:
             )
 
             # Get email body
-            body = self._get_message_body(message["payload"])
+            body = record["body"] or ""
 
             # Only include if body is substantial (not just "Sent from my iPhone")
             if len(body.strip()) > 50:
@@ -555,80 +1788,106 @@ class GmailClient:
 
     def get_conversation_history(self, sender_email: str, max_results: int = 20) -> Dict[str, Any]:
         """
-        Get conversation history with a specific sender.
+        Get conversation history with a specific sender (from the local contact index).
 
         Args:
             sender_email: Email address to get history for
-            max_results: Maximum number of messages to analyze
+            max_results: Maximum number of body samples per direction
 
         Returns:
             Dictionary with sent/received emails and conversation stats
         """
-        # Extract email address from "Name <email@domain.com>" format
-        import re
-        email_match = re.search(r'<(.+?)>', sender_email)
-        search_email = email_match.group(1) if email_match else sender_email
+        return self.get_conversation_histories([sender_email], max_results)[sender_email]
 
-        # Search for emails from/to this sender
-        query = f'from:{search_email} OR to:{search_email}'
-        results = (
-            self.service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=max_results)
-            .execute()
-        )
+    def get_conversation_histories(self, senders: List[str], max_results: int = 20) -> Dict[str, Dict[str, Any]]:
+        """
+        Get conversation history for many senders with one local query.
 
-        messages = results.get("messages", [])
+        Reads the contact index in the message store (no per-sender Gmail
+        search). The index is topped up once per client by sync_contact_index().
 
-        sent_to_sender = []
-        received_from_sender = []
+        Args:
+            senders: Sender strings ("Name <email@domain.com>" or bare addresses)
+            max_results: Maximum number of body samples per direction
 
-        for msg in messages:
-            # Get full message details
-            message = (
-                self.service.users().messages().get(userId="me", id=msg["id"]).execute()
-            )
+        Returns:
+            Dict mapping each sender string to:
+            {
+                'sender_email': 'a@example.com',
+                'sent_to_sender': [{'subject': ..., 'body': ...}, ...],        # newest first
+                'received_from_sender': [{'subject': ..., 'body': ...}, ...],
+                'total_sent': 3,
+                'total_received': 5,
+                'total_exchanges': 8,
+                'weighted_score': 11,
+                'is_first_contact': False,
+                'first_contact': 1700000000000,  # epoch ms (None if unknown)
+                'last_contact': 1736000000000,
+            }
 
-            # Extract headers
-            headers = message["payload"]["headers"]
-            from_header = next((h["value"] for h in headers if h["name"] == "From"), "")
-            subject = next((h["value"] for h in headers if h["name"] == "Subject"), "")
+        Example:
+            histories = gmail.get_conversation_histories([e['sender'] for e in emails])
+        """
+        import re
 
-            # Get email body
-            body = self._get_message_body(message["payload"])
+        self.sync_contact_index()
+
+        addresses = {}
+        for sender in senders:
+            email_match = re.search(r'<(.+?)>', sender)
+            addresses[sender] = (email_match.group(1) if email_match else sender).strip()
+
+        contacts = self.store.get_contacts(addresses.values())
+
+        histories = {}
+        for sender, address in addresses.items():
+            contact = contacts.get(address.lower(), {})
+            total_sent = contact.get("total_sent", 0)
+            total_received = contact.get("total_received", 0)
+
+            histories[sender] = {
+                "sender_email": address,
+                "sent_to_sender": [
+                    {"subject": s["subject"], "body": s["body"]}
+                    for s in contact.get("sent_samples", [])[:max_results]
+                ],
+                "received_from_sender": [
+                    {"subject": s["subject"], "body": s["body"]}
+                    for s in contact.get("received_samples", [])[:max_results]
+                ],
+                "total_sent": total_sent,
+                "total_received": total_received,
+                "total_exchanges": total_sent + total_received,
+                # 내가 보낸 메일에 2배 가중치 (회사 공지 등 수신만 하는 경우 중요도 낮음)
+                "weighted_score": total_sent * 2 + total_received,
+                # 첫 연락 여부 (이번 메일 1통만 받은 상태)
+                "is_first_contact": total_sent == 0 and total_received == 1,
+                "first_contact": contact.get("first_contact"),
+                "last_contact": contact.get("last_contact"),
+            }
 
-            # Categorize by sent/received
-            if search_email.lower() in from_header.lower():
-                # Received from sender
-                received_from_sender.append({
-                    "subject": subject,
-                    "body": body,
-                })
-            else:
-                # Sent to sender
-                if len(body.strip()) > 50:
-                    sent_to_sender.append({
-                        "subject": subject,
-                        "body": body,
-                    })
+        return histories
 
-        # Calculate priority score (발신 가중치 적용)
-        # 내가 보낸 메일에 2배 가중치 (회사 공지 등 수신만 하는 경우 중요도 낮음)
-        weighted_score = len(sent_to_sender) * 2 + len(received_from_sender)
+    def sync_contact_index(self, max_messages: int = 500) -> None:
+        """
+        Make sure recent inbox/sent messages are in the message store (and so in the contact index).
 
-        # 첫 연락 여부 확인
-        is_first_contact = len(sent_to_sender) == 0 and len(received_from_sender) == 1
+        Runs once per client. Only messages the store hasn't seen are
+        downloaded: headers for all, bodies only for sent mail (used as
+        writing samples).
 
-        return {
-            "sender_email": search_email,
-            "sent_to_sender": sent_to_sender,
-            "received_from_sender": received_from_sender,
-            "total_sent": len(sent_to_sender),
-            "total_received": len(received_from_sender),
-            "total_exchanges": len(sent_to_sender) + len(received_from_sender),
-            "weighted_score": weighted_score,
-            "is_first_contact": is_first_contact,
-        }
+        Args:
+            max_messages: How many recent inbox/sent messages to cover
+        """
+        if self._contacts_synced:
+            return
+        self._contacts_synced = True
+
+        message_ids = self.list_message_ids(CONTACT_SYNC_QUERY, max_results=max_messages)
+        records = self._get_message_records(message_ids)
+
+        sent_ids = [r["id"] for r in records if r is not None and "SENT" in r["label_ids"]]
+        self._get_message_records(sent_ids, include_body=True)
 
     def collect_all_sender_stats(
         self,
@@ -638,11 +1897,14 @@ class GmailClient:
         """
         Collect statistics for all senders for sender management tab.
 
-        This function analyzes recent emails and calculates stats needed
-        for automatic sender importance scoring.
+        Stats come from the persistent per-sender aggregates in the message
+        store (contacts table). Syncing only downloads messages the store
+        hasn't seen, and each new message updates its sender's counters in
+        O(1), so nothing is rescanned. recent_7days is an exponentially
+        decayed message count (τ = 7 days) instead of a fixed 7-day window.
 
         Args:
-            max_emails: Maximum number of emails to analyze (default: 200)
+            max_emails: How many recent inbox/sent messages to sync (default: 200)
             classified_emails: Optional list of already classified emails with priority scores
 
         Returns:
@@ -654,122 +1916,27 @@ class GmailClient:
                     'total_received': 10,
                     'p45_count': 3,  # Count of P4-5 priority emails
                     'total_emails': 10,  # Total received from this sender
-                    'recent_7days': 2,
+                    'recent_7days': 2.4,  # Decayed recent activity
                     'last_contact_date': '2024-01-15',
                 }
             }
         """
-        import re
-        from datetime import datetime, timedelta
-        from collections import defaultdict
-
-        sender_stats = defaultdict(lambda: {
-            'name': '',
-            'total_sent': 0,
-            'total_received': 0,
-            'p45_count': 0,
-            'total_emails': 0,
-            'recent_7days': 0,
-            'last_contact_date': '',
-        })
-
-        # Get recent emails (both inbox and sent)
-        query = 'in:inbox OR in:sent'
-        results = (
-            self.service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=max_emails)
-            .execute()
-        )
+        from email.utils import parseaddr
 
-        messages = results.get("messages", [])
-        seven_days_ago = datetime.now() - timedelta(days=7)
+        self.sync_contact_index(max_messages=max_emails)
 
-        # Build priority map from classified emails if provided
-        priority_map = {}
+        # 분류 결과의 우선순위 기록 (메시지별 1회만 P4-5 집계에 반영)
         if classified_emails:
+            classifications = []
             for email in classified_emails:
-                sender = email.get('sender', '')
-                # Extract email from "Name <email>" format
-                email_match = re.search(r'<(.+?)>', sender)
-                sender_email = email_match.group(1) if email_match else sender
-                priority = email.get('priority', 3)
-
-                if sender_email not in priority_map:
-                    priority_map[sender_email] = []
-                priority_map[sender_email].append(priority)
-
-        for msg in messages:
-            # Get message details
-            message = (
-                self.service.users().messages().get(
-                    userId="me", id=msg["id"], format="metadata",
-                    metadataHeaders=["From", "To", "Date"]
-                ).execute()
-            )
+                _, sender_email = parseaddr(email.get('sender', ''))
+                if not email.get('id') or not sender_email:
+                    continue
+                priority = email.get('classification', {}).get('priority', email.get('priority', 3))
+                classifications.append((email['id'], sender_email, priority))
+            self.store.record_priorities(classifications)
 
-            headers = message["payload"]["headers"]
-            from_header = next((h["value"] for h in headers if h["name"] == "From"), "")
-            to_header = next((h["value"] for h in headers if h["name"] == "To"), "")
-            date_header = next((h["value"] for h in headers if h["name"] == "Date"), "")
-
-            # Parse date
-            try:
-                # Simple date parsing (handles most formats)
-                msg_date = datetime.strptime(date_header.split(' +')[0].split(' -')[0].strip(),
-                                            "%a, %d %b %Y %H:%M:%S")
-            except:
-                msg_date = datetime.now()
-
-            # Determine if sent or received
-            is_sent = 'SENT' in message.get('labelIds', [])
-
-            # Extract sender email and name
-            sender_match = re.search(r'(.+?)\s*<(.+?)>', from_header)
-            if sender_match:
-                sender_name = sender_match.group(1).strip(' "\'')
-                sender_email = sender_match.group(2)
-            else:
-                sender_name = ''
-                sender_email = from_header
-
-            # Skip if it's me (for sent emails, track recipient instead)
-            if is_sent:
-                # For sent emails, extract recipient
-                recipient_match = re.search(r'<(.+?)>', to_header)
-                sender_email = recipient_match.group(1) if recipient_match else to_header
-                sender_stats[sender_email]['total_sent'] += 1
-            else:
-                # Received email
-                sender_stats[sender_email]['name'] = sender_name or sender_stats[sender_email]['name']
-                sender_stats[sender_email]['total_received'] += 1
-                sender_stats[sender_email]['total_emails'] += 1
-
-                # Check priority (from classified_emails if available)
-                if sender_email in priority_map:
-                    # Use average priority from classified emails
-                    avg_priority = sum(priority_map[sender_email]) / len(priority_map[sender_email])
-                    if avg_priority >= 4:
-                        sender_stats[sender_email]['p45_count'] += 1
-
-            # Update last contact date
-            date_str = msg_date.strftime('%Y-%m-%d')
-            if not sender_stats[sender_email]['last_contact_date'] or \
-               date_str > sender_stats[sender_email]['last_contact_date']:
-                sender_stats[sender_email]['last_contact_date'] = date_str
-
-            # Check if within last 7 days
-            if msg_date >= seven_days_ago:
-                sender_stats[sender_email]['recent_7days'] += 1
-
-        # Convert defaultdict to regular dict and filter out low-activity senders
-        result = {}
-        for email, stats in sender_stats.items():
-            # Only include senders with at least 1 received email
-            if stats['total_received'] > 0:
-                result[email] = dict(stats)
-
-        return result
+        return self.store.get_sender_stats()
 
     def get_label_names(self, label_ids: List[str]) -> List[str]:
         """
@@ -781,18 +1948,8 @@ class GmailClient:
         Returns:
             List of label names (e.g., ['답장필요', 'P3-보통'])
         """
-        # Cache label mapping
-        if not hasattr(self, '_label_cache'):
-            results = self.service.users().labels().list(userId="me").execute()
-            self._label_cache = {
-                label["id"]: label["name"]
-                for label in results.get("labels", [])
-            }
-
-        return [
-            self._label_cache.get(lid, lid)
-            for lid in label_ids
-        ]
+        # Label registry (saved map; relisted only for unknown IDs)
+        return self.labels.get_names(label_ids)
 
     def create_or_get_label(self, label_name: str, color: Optional[Dict[str, str]] = None) -> str:
         """
@@ -812,32 +1969,8 @@ class GmailClient:
                 {'backgroundColor': '#fb4c2f', 'textColor': '#ffffff'}
             )
         """
-        # Check if label already exists
-        results = self.service.users().labels().list(userId="me").execute()
-        labels = results.get("labels", [])
-
-        for label in labels:
-            if label["name"] == label_name:
-                return label["id"]
-
-        # Create new label
-        label_object = {
-            "name": label_name,
-            "labelListVisibility": "labelShow",
-            "messageListVisibility": "show",
-        }
-
-        if color:
-            label_object["color"] = color
-
-        created = (
-            self.service.users()
-            .labels()
-            .create(userId="me", body=label_object)
-            .execute()
-        )
-
-        return created["id"]
+        # Label registry (no labels.list call if the label is already known)
+        return self.labels.get_or_create(label_name, color)
 
     def setup_email_labels(self) -> Dict[str, str]:
         """
@@ -878,12 +2011,8 @@ class GmailClient:
             "메일요약": {"backgroundColor": "#42d692", "textColor": "#ffffff"},      # Teal green
         }
 
-        label_ids = {}
-        for label_name, color in labels_config.items():
-            label_id = self.create_or_get_label(label_name, color)
-            label_ids[label_name] = label_id
-
-        return label_ids
+        # Only missing labels are created; existing IDs come from the registry
+        return self.labels.ensure(labels_config)
 
     def apply_labels_to_email(
         self,
@@ -912,6 +2041,200 @@ class GmailClient:
                 label_ids=label_ids
             )
         """
+        labels_to_add, labels_to_remove = self._classification_label_changes(status, priority, label_ids)
+
+        # Apply labels (remove old, add new in one call)
+        if labels_to_add:
+            self._modify_labels(message_id, add=labels_to_add, remove=labels_to_remove)
+
+    def _modify_labels(
+        self,
+        message_id: str,
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None,
+    ) -> None:
+        """Add/remove labels on a message and update the local store."""
+        add, remove = self._execute_label_change([message_id], add or [], remove or [])
+        self.store.update_labels(message_id, add=add, remove=remove)
+
+    def _execute_label_change(
+        self, message_ids: List[str], add: List[str], remove: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Apply one label change with messages.modify (1 message) or messages.batchModify.
+
+        If Gmail rejects a label ID from the saved registry (label deleted or
+        recreated), the registry is invalidated, the labels are resolved
+        again by name and the call is retried once. AsyncGmailClient runs
+        the same steps with the API call on its worker pool.
+
+        Returns:
+            (add, remove) label IDs actually applied
+        """
+        add, remove = self._current_label_ids(add, remove)
+
+        try:
+            self._send_label_change(self.service, message_ids, add, remove)
+        except HttpError as e:
+            if not self.labels.is_stale_label_error(e):
+                raise
+            add, remove = self._refresh_label_ids(add, remove)
+            self._send_label_change(self.service, message_ids, add, remove)
+
+        return add, remove
+
+    @staticmethod
+    def _send_label_change(
+        service: Any, message_ids: List[str], add: List[str], remove: List[str]
+    ) -> None:
+        """Call messages.modify (1 message) or messages.batchModify on `service`."""
+        body: Dict[str, Any] = {}
+        if add:
+            body["addLabelIds"] = add
+        if remove:
+            body["removeLabelIds"] = remove
+
+        messages = service.users().messages()
+        if len(message_ids) == 1:
+            messages.modify(userId="me", id=message_ids[0], body=body).execute()
+        else:
+            messages.batchModify(userId="me", body={"ids": message_ids, **body}).execute()
+
+    def _current_label_ids(self, add: List[str], remove: List[str]) -> Tuple[List[str], List[str]]:
+        """Remap label IDs the registry already invalidated this run (caller's old label_ids)."""
+        if any(self.labels.is_retired(lid) for lid in add + remove):
+            return self._remap_label_ids(add), self._remap_label_ids(remove)
+        return add, remove
+
+    def _refresh_label_ids(self, add: List[str], remove: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Handle a label ID Gmail rejected: rebuild the registry and remap by name.
+
+        If the IDs were already retired by another failed call, only the
+        remap is done (the registry is rebuilt once).
+        """
+        if not any(self.labels.is_retired(lid) for lid in add + remove):
+            # 저장된 라벨 ID가 더 이상 없음 → 레지스트리 재구성 후 이름으로 다시 매핑
+            self.labels.invalidate()
+            self.setup_email_labels()
+        return self._remap_label_ids(add), self._remap_label_ids(remove)
+
+    def batch_modify_labels(self, changes: List[Tuple[str, List[str], List[str]]]) -> List[str]:
+        """
+        Apply label changes to many messages with messages.batchModify.
+
+        Messages with the same (add, remove) label sets share one batchModify
+        call (up to BATCH_MODIFY_SIZE IDs each), so 100 classified emails take
+        about 10 calls instead of one modify per message. If a batchModify
+        call fails, its messages are retried one by one to find which failed.
+
+        Args:
+            changes: (message_id, add_label_ids, remove_label_ids) per message
+
+        Returns:
+            Message IDs whose labels could not be changed (empty if all succeeded)
+
+        Example:
+            failed = gmail.batch_modify_labels([
+                ('abc123', ['Label_1'], ['Label_2']),
+                ('def456', ['Label_1'], ['Label_2']),
+            ])
+            # 1 batchModify call; failed == [] on success
+        """
+        failed: List[str] = []
+
+        for add, remove, chunk in self._group_label_changes(changes):
+            try:
+                applied_add, applied_remove = self._execute_label_change(chunk, add, remove)
+                self.store.update_labels_many(chunk, add=applied_add, remove=applied_remove)
+            except Exception:
+                if len(chunk) == 1:
+                    failed.extend(chunk)
+                    continue
+
+                # 묶음 호출 실패 → 메시지별로 다시 시도해 실패한 ID만 골라냄
+                for msg_id in chunk:
+                    try:
+                        self._modify_labels(msg_id, add=add, remove=remove)
+                    except Exception:
+                        failed.append(msg_id)
+
+        return failed
+
+    def _group_label_changes(
+        self, changes: List[Tuple[str, List[str], List[str]]]
+    ) -> List[Tuple[List[str], List[str], List[str]]]:
+        """
+        Group label changes by identical (add, remove) sets.
+
+        Returns:
+            (add, remove, message_ids) per group, message_ids split into
+            chunks of at most BATCH_MODIFY_SIZE
+        """
+        groups: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[str]] = {}
+        for message_id, add, remove in changes:
+            if not add and not remove:
+                continue
+            key = (tuple(sorted(set(add))), tuple(sorted(set(remove))))
+            ids = groups.setdefault(key, [])
+            if message_id not in ids:
+                ids.append(message_id)
+
+        return [
+            (list(add), list(remove), ids[start:start + self.BATCH_MODIFY_SIZE])
+            for (add, remove), ids in groups.items()
+            for start in range(0, len(ids), self.BATCH_MODIFY_SIZE)
+        ]
+
+    def apply_labels_to_emails(
+        self,
+        classifications: List[Tuple[str, str, int]],
+        label_ids: Dict[str, str],
+    ) -> List[str]:
+        """
+        Bulk version of apply_labels_to_email() using batch_modify_labels().
+
+        Args:
+            classifications: (message_id, status, priority) per email
+            label_ids: Dict mapping label names to IDs (from setup_email_labels)
+
+        Returns:
+            Message IDs that could not be labeled
+
+        Example:
+            failed = gmail.apply_labels_to_emails(
+                [('abc123', '답장필요', 5), ('def456', '답장불필요', 2)],
+                label_ids,
+            )
+        """
+        changes = []
+        for message_id, status, priority in classifications:
+            labels_to_add, labels_to_remove = self._classification_label_changes(status, priority, label_ids)
+            if labels_to_add:
+                changes.append((message_id, labels_to_add, labels_to_remove))
+
+        return self.batch_modify_labels(changes)
+
+    def _remap_label_ids(self, label_ids: List[str]) -> List[str]:
+        """Map label IDs from an invalidated registry to current IDs (by name)."""
+        remapped = []
+        for lid in label_ids:
+            name = self.labels.retired_name(lid)
+            new_id = self.labels.get_id(name) if name else None
+            if new_id:
+                remapped.append(new_id)
+            elif lid.isupper():
+                remapped.append(lid)  # System labels (INBOX, UNREAD, ...) never change
+        return remapped
+
+    def _classification_label_changes(
+        self, status: str, priority: int, label_ids: Dict[str, str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Compute (labels_to_add, labels_to_remove) for a status/priority classification.
+
+        Existing classification labels other than the new ones are removed.
+        """
         # Map priority number to label name
         priority_labels = {
             1: "P1-최저",
@@ -935,17 +2258,7 @@ class GmailClient:
         all_label_ids = list(label_ids.values())
         labels_to_remove = [lid for lid in all_label_ids if lid not in labels_to_add]
 
-        # Apply labels (remove old, add new in one call)
-        if labels_to_add:
-            modify_body = {"addLabelIds": labels_to_add}
-            if labels_to_remove:
-                modify_body["removeLabelIds"] = labels_to_remove
-
-            self.service.users().messages().modify(
-                userId="me",
-                id=message_id,
-                body=modify_body
-            ).execute()
+        return labels_to_add, labels_to_remove
 
     def remove_all_classification_labels(self, message_id: str, label_ids: Dict[str, str]) -> None:
         """
@@ -960,11 +2273,7 @@ class GmailClient:
         labels_to_remove = list(label_ids.values())
 
         if labels_to_remove:
-            self.service.users().messages().modify(
-                userId="me",
-                id=message_id,
-                body={"removeLabelIds": labels_to_remove}
-            ).execute()
+            self._modify_labels(message_id, remove=labels_to_remove)
 
     def send_summary_report(
         self,
@@ -992,9 +2301,8 @@ class GmailClient:
         import base64
         from email.mime.text import MIMEText
 
-        # Get my email address
-        profile = self.service.users().getProfile(userId='me').execute()
-        my_email = profile['emailAddress']
+        # Get my email address (cached)
+        my_email = self.get_my_email()
 
         # Create HTML message
         message = MIMEText(body, 'html', 'utf-8')
@@ -1018,40 +2326,41 @@ class GmailClient:
             label_ids = self.setup_email_labels()
 
         if "메일요약" in label_ids:
-            self.service.users().messages().modify(
-                userId="me",
-                id=sent["id"],
-                body={"addLabelIds": [label_ids["메일요약"]]}
-            ).execute()
+            self._modify_labels(sent["id"], add=[label_ids["메일요약"]])
 
         return sent
 
-    def mark_as_processed(self, message_ids: List[str], label_ids: Optional[Dict[str, str]] = None) -> None:
+    def mark_as_processed(self, message_ids: List[str], label_ids: Optional[Dict[str, str]] = None) -> List[str]:
         """
         Mark emails as processed by adding "처리완료" label.
 
         This prevents emails from being reprocessed in future runs.
+        Also commits the incremental sync checkpoint, if one is pending
+        (messages that failed to be labeled are carried over to the next run).
 
         Args:
             message_ids: List of Gmail message IDs
             label_ids: Dict mapping label names to IDs (optional)
 
+        Returns:
+            Message IDs that could not be marked (e.g. deleted meanwhile)
+
         Example:
-            gmail.mark_as_processed(['abc123', 'def456'])
+            failed = gmail.mark_as_processed(['abc123', 'def456'])
         """
         if label_ids is None:
             label_ids = self.setup_email_labels()
 
         processed_label_id = label_ids.get("처리완료")
         if not processed_label_id:
-            return
+            return []
 
-        for msg_id in message_ids:
-            try:
-                self.service.users().messages().modify(
-                    userId="me",
-                    id=msg_id,
-                    body={"addLabelIds": [processed_label_id]}
-                ).execute()
-            except Exception:
-                pass  # Skip if message not found
+        failed = self.batch_modify_labels([(msg_id, [processed_label_id], []) for msg_id in message_ids])
+
+        # 처리 완료 → 증분 동기화 체크포인트 확정 (실패한 메일은 다음 실행으로 이월)
+        if failed and self._pending_sync_state:
+            pending_ids = self._pending_sync_state.get("pending_ids", [])
+            self._pending_sync_state["pending_ids"] = failed + [i for i in pending_ids if i not in failed]
+        self.save_sync_checkpoint()
+
+        return failed
@@ -0,0 +1,224 @@
+"""Persistent Gmail label registry (label name ↔ ID map, listed once)."""
+import json
+import os.path
+from typing import Any, Dict, Iterable, List, Optional
+
+from googleapiclient.errors import HttpError
+
+# 라벨 이름 → ID 맵 저장 위치 (email_store.db와 같은 프로젝트 루트)
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), '..', 'email_labels.json')
+
+
+class LabelRegistry:
+    """
+    Name → ID map of the account's Gmail labels, persisted across runs.
+
+    The map is loaded from email_labels.json, or built with a single
+    labels.list call when there is no saved map. Labels that don't exist
+    yet are created on demand; existing ones are never listed again.
+
+    The saved map can go stale (a label deleted or recreated in Gmail), so
+    it is rebuilt at most once per client when an unknown label ID shows up,
+    and dropped entirely via invalidate() when Gmail rejects a saved ID.
+
+    Example:
+        registry = LabelRegistry(gmail.service)
+        label_ids = registry.ensure({"답장필요": {"backgroundColor": "#fb4c2f", "textColor": "#ffffff"}})
+        print(registry.get_name("INBOX"))  # 'INBOX'
+    """
+
+    def __init__(self, service: Any, path: str = DEFAULT_REGISTRY_PATH) -> None:
+        """
+        Initialize registry (nothing is loaded until first use).
+
+        Args:
+            service: Gmail API service
+            path: JSON file for the persisted name → ID map
+        """
+        self.service = service
+        self.path = path
+        self._ids: Optional[Dict[str, str]] = None  # name → ID
+        self._names: Dict[str, str] = {}            # ID → name
+        self._retired: Dict[str, str] = {}          # ID → name of invalidated entries
+        self._listed = False                        # labels.list called by this registry
+
+    # ===== 조회 =====
+
+    def get_id(self, name: str) -> Optional[str]:
+        """Get a label ID by name (None if the label doesn't exist)."""
+        return self._load().get(name)
+
+    def get_name(self, label_id: str) -> str:
+        """
+        Get a label name by ID.
+
+        An unknown ID means the saved map is stale, so labels are listed
+        again (once per registry). Falls back to the ID itself.
+        """
+        self._load()
+        if label_id not in self._names and not self._listed:
+            self.refresh()
+        return self._names.get(label_id, label_id)
+
+    def get_names(self, label_ids: Iterable[str]) -> List[str]:
+        """Convert label IDs to names."""
+        return [self.get_name(lid) for lid in label_ids]
+
+    def retired_name(self, label_id: str) -> Optional[str]:
+        """Get the name a label ID had before invalidate() (for remapping stale IDs)."""
+        return self._names.get(label_id) or self._retired.get(label_id)
+
+    def is_retired(self, label_id: str) -> bool:
+        """Check if a label ID was dropped by invalidate() and not seen since."""
+        return label_id in self._retired and label_id not in self._names
+
+    # ===== 생성 =====
+
+    def get_or_create(self, name: str, color: Optional[Dict[str, str]] = None) -> str:
+        """
+        Get a label ID by name, creating the label if it doesn't exist.
+
+        Args:
+            name: Label name (e.g., "답장필요")
+            color: Optional color dict with 'backgroundColor' and 'textColor'
+
+        Returns:
+            Label ID
+        """
+        return self.ensure({name: color})[name]
+
+    def ensure(self, labels_config: Dict[str, Optional[Dict[str, str]]]) -> Dict[str, str]:
+        """
+        Make sure all labels exist, creating only the missing ones.
+
+        Labels missing from a saved map are first looked up with one fresh
+        labels.list (another run may have created them) before creating.
+
+        Args:
+            labels_config: Dict mapping label name to color (or None)
+
+        Returns:
+            Dict mapping label name to label ID
+        """
+        ids = self._load()
+        missing = [name for name in labels_config if name not in ids]
+
+        if missing and not self._listed:
+            ids = self.refresh()
+            missing = [name for name in labels_config if name not in ids]
+
+        for name in missing:
+            self._create(name, labels_config[name])
+
+        return {name: self._ids[name] for name in labels_config}
+
+    def _create(self, name: str, color: Optional[Dict[str, str]]) -> str:
+        """Create a label and record it."""
+        label_object: Dict[str, Any] = {
+            "name": name,
+            "labelListVisibility": "labelShow",
+            "messageListVisibility": "show",
+        }
+        if color:
+            label_object["color"] = color
+
+        try:
+            created = self.service.users().labels().create(userId="me", body=label_object).execute()
+        except HttpError as e:
+            if e.resp.status != 409:
+                raise
+            # 이미 존재 (다른 실행에서 생성됨) → 다시 목록 조회
+            label_id = self.refresh().get(name)
+            if label_id is None:
+                raise
+            return label_id
+
+        self._add(created["id"], name)
+        self._save()
+        return created["id"]
+
+    # ===== 갱신 / 무효화 =====
+
+    def refresh(self) -> Dict[str, str]:
+        """Rebuild the map with one labels.list call and save it."""
+        results = self.service.users().labels().list(userId="me").execute()
+
+        self._ids = {}
+        self._names = {}
+        for label in results.get("labels", []):
+            self._add(label["id"], label["name"])
+
+        self._listed = True
+        self._save()
+        return self._ids
+
+    def invalidate(self) -> None:
+        """
+        Drop the saved map (e.g. Gmail returned 404 for a saved label ID).
+
+        The next lookup lists labels again.
+        """
+        # 호출자가 들고 있는 예전 ID를 이름으로 재매핑할 수 있도록 보관
+        if self._ids is None:
+            self._load_saved()
+        self._retired.update(self._names)
+        self._ids = None
+        self._names = {}
+        self._listed = False
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def is_stale_label_error(self, error: BaseException) -> bool:
+        """
+        Check if an API error means a saved label ID no longer exists.
+
+        Gmail answers 404 (or 400 "Invalid label") for unknown label IDs; a 404
+        for a missing message doesn't mention a label and is not treated as stale.
+        """
+        if not isinstance(error, HttpError) or error.resp.status not in (400, 404):
+            return False
+        content = error.content.decode("utf-8", errors="replace") if error.content else ""
+        return "label" in content.lower()
+
+    # ===== 저장 =====
+
+    def _add(self, label_id: str, name: str) -> None:
+        """Record one label in both directions."""
+        if self._ids is None:
+            self._ids = {}
+        self._ids[name] = label_id
+        self._names[label_id] = name
+
+    def _load(self) -> Dict[str, str]:
+        """Load the saved map, or list labels if there is none."""
+        if self._ids is not None:
+            return self._ids
+
+        if self._load_saved():
+            return self._ids
+
+        return self.refresh()
+
+    def _load_saved(self) -> bool:
+        """Load email_labels.json into memory (False if missing or corrupt)."""
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            with open(self.path, 'r') as f:
+                saved = json.load(f)
+            self._ids = {}
+            self._names = {}
+            for name, label_id in saved["labels"].items():
+                self._add(label_id, name)
+            return True
+        except (OSError, ValueError, KeyError, AttributeError):
+            self._ids = None
+            self._names = {}
+            return False  # Corrupt file → list again
+
+    def _save(self) -> None:
+        """Persist the name → ID map."""
+        with open(self.path, 'w') as f:
+            json.dump({"labels": self._ids or {}}, f, ensure_ascii=False, indent=2)
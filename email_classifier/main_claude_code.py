@@ -100,21 +100,22 @@ def main() -> None:
         print("\n🔍 Analyzing conversation history with each sender...")
         sender_histories = {}
 
-        for email in emails:
-            sender = email['sender']
-            sender_email = extract_email_address(sender)
+        # One local query over the contact index for all senders
+        histories = gmail.get_conversation_histories(
+            list(dict.fromkeys(email['sender'] for email in emails)), max_results=20
+        )
 
-            if sender not in sender_histories:
-                print(f"   Checking {sender_email}...", end=" ")
-                history = gmail.get_conversation_history(sender, max_results=20)
-                sender_histories[sender] = {
-                    "sender_email": sender_email,
-                    "total_exchanges": history['total_exchanges'],
-                    "sent_to_sender": history['sent_to_sender'],
-                    "received_from_sender": history['received_from_sender'],
-                    "has_history": history['total_exchanges'] > 0,
-                }
-                print(f"{history['total_exchanges']} exchanges")
+        for sender, history in histories.items():
+            sender_email = extract_email_address(sender)
+            print(f"   Checking {sender_email}...", end=" ")
+            sender_histories[sender] = {
+                "sender_email": sender_email,
+                "total_exchanges": history['total_exchanges'],
+                "sent_to_sender": history['sent_to_sender'],
+                "received_from_sender": history['received_from_sender'],
+                "has_history": history['total_exchanges'] > 0,
+            }
+            print(f"{history['total_exchanges']} exchanges")
 
         # === STEP 3: Classify with Priority ===
         print("\n" + "="*80)
@@ -9,10 +9,13 @@ v0.5.0 Features:
 - Batch sending from spreadsheet
 - Status management (답장필요/불필요/완료)
 """
+import asyncio
 import sys
 import re
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 
+from .async_gmail_client import AsyncGmailClient
 from .claude_code_classifier import ClaudeCodeClassifier
 from .gmail_client import GmailClient
 from .sheets_client import SheetsClient
@@ -30,10 +33,12 @@ def main() -> None:
     print("   ✨ Features: Priority ranking + Sheets tracking + Batch sending")
     print("   💰 No API costs - runs in Claude Code\n")
 
+    sheets: Optional[SheetsClient] = None
     try:
         # Initialize clients
         print("📧 Connecting to Gmail...")
         gmail = GmailClient()
+        async_gmail = AsyncGmailClient(gmail)
 
         print("📊 Connecting to Google Sheets...")
         sheets = SheetsClient()
@@ -82,33 +87,44 @@ def main() -> None:
         print("STEP 2: FETCH EMAILS & ANALYZE HISTORY")
         print("="*80)
 
-        print("\n📬 Fetching recent emails...")
-        emails = gmail.get_recent_emails(max_results=20)
+        # Senders manually graded 차단 are excluded in the Gmail search query
+        try:
+            blocked_senders = sheets.get_blocked_senders(spreadsheet_id)
+        except Exception as e:
+            print(f"⚠️  Could not read blocked senders, fetching without filter: {e}")
+            blocked_senders = []
+
+        print("\n📬 Fetching recent emails (headers only)...")
+        emails = gmail.get_recent_emails(
+            max_results=20, include_body=False, blocked_senders=blocked_senders
+        )
         print(f"   → Found {len(emails)} emails")
+        if blocked_senders:
+            print(f"   → Excluded {len(blocked_senders)} blocked senders")
+
+        # Fetch bodies only for the remaining candidates
+        gmail.load_email_bodies(emails)
 
         # Analyze conversation history
         print("\n🔍 Analyzing conversation history...")
-        sender_histories = {}
-
-        for email in emails:
-            sender = email['sender']
-
-            if sender not in sender_histories:
-                sender_email = extract_email_address(sender)
-                print(f"   {sender_email}...", end=" ")
-
-                history = gmail.get_conversation_history(sender, max_results=20)
-                sender_histories[sender] = history
+        # One local query over the contact index for all senders
+        sender_histories = gmail.get_conversation_histories(
+            list(dict.fromkeys(email['sender'] for email in emails)), max_results=20
+        )
 
-                # Display priority hints
-                if history['is_first_contact']:
-                    print("✨ FIRST CONTACT")
-                elif history['total_sent'] > 10:
-                    print(f"🔥 VIP (sent: {history['total_sent']})")
-                elif history['total_exchanges'] > 10:
-                    print(f"📧 Frequent ({history['total_exchanges']} exchanges)")
-                else:
-                    print(f"{history['total_exchanges']} exchanges")
+        for sender, history in sender_histories.items():
+            sender_email = extract_email_address(sender)
+            print(f"   {sender_email}...", end=" ")
+
+            # Display priority hints
+            if history['is_first_contact']:
+                print("✨ FIRST CONTACT")
+            elif history['total_sent'] > 10:
+                print(f"🔥 VIP (sent: {history['total_sent']})")
+            elif history['total_exchanges'] > 10:
+                print(f"📧 Frequent ({history['total_exchanges']} exchanges)")
+            else:
+                print(f"{history['total_exchanges']} exchanges")
 
         # === STEP 3: Classify with Enhanced Priority ===
         print("\n" + "="*80)
@@ -138,29 +154,9 @@ def main() -> None:
         label_ids = gmail.setup_email_labels()
         print(f"   ✅ Created/verified {len(label_ids)} labels")
 
-        # Apply labels to classified emails
+        # Apply labels right after classification, so they don't depend on the draft prompt
         print("\n🏷️  Applying labels to emails...")
-        for email in emails:
-            classification = email.get('classification', {})
-            requires_response = classification.get('requires_response', False)
-            priority = classification.get('priority', 3)
-
-            # Map to status
-            if requires_response:
-                status = "답장필요"
-            else:
-                status = "답장불필요"
-
-            try:
-                gmail.apply_labels_to_email(
-                    message_id=email['id'],
-                    status=status,
-                    priority=priority,
-                    label_ids=label_ids
-                )
-                print(f"   ✅ {status} | P{priority} - {email['subject'][:40]}...")
-            except Exception as e:
-                print(f"   ⚠️  Failed to label: {email['subject'][:40]}... - {e}")
+        asyncio.run(_apply_labels(async_gmail, emails, label_ids))
 
         # === STEP 4: Generate Drafts ===
         emails_needing_response = [e for e in emails if e.get('classification', {}).get('requires_response')]
@@ -209,50 +205,26 @@ def main() -> None:
         else:
             drafts = classifier.parse_draft_batch(response)
 
-            # Create Gmail drafts (with HTML support)
-            draft_objects = []
-            for email, draft in zip(emails_needing_response, drafts):
-                try:
-                    # Create HTML draft
-                    draft_obj = gmail.create_draft(
-                        thread_id=email["thread_id"],
-                        to=email["sender"],
-                        subject=draft["subject"],
-                        body=draft["body"],
-                        is_html=True,  # NEW: Enable HTML formatting
-                    )
-
-                    draft_objects.append(draft_obj)
-
-                    # Extract draft ID
-                    draft_id = draft_obj.get("id", "")
-                    print(f"   ✅ Draft: {email['subject'][:50]}... (ID: {draft_id[:10]}...)")
-
-                except Exception as e:
-                    print(f"   ⚠️  Failed: {e}")
-                    draft_objects.append(None)  # Placeholder for failed drafts
+        # Gmail draft creation (with HTML support), concurrent on the worker pool
+        draft_objects = []
+        if drafts:
+            print("\n📝 Creating drafts...")
+            draft_objects = asyncio.run(_create_drafts(async_gmail, emails_needing_response, drafts))
 
         # === STEP 5: Update Spreadsheet ===
         print("\n" + "="*80)
         print("STEP 5: UPDATE GOOGLE SHEETS")
         print("="*80)
 
-        print("\n📊 Adding emails to spreadsheet with draft links...")
+        print("\n📊 Adding emails to spreadsheet with drafts...")
 
-        for email in emails_needing_response:
+        rows = []
+        for idx, email in enumerate(emails_needing_response):
             classification = email.get('classification', {})
 
-            # Find corresponding draft object
-            idx = emails_needing_response.index(email)
+            # Find corresponding draft object and content
             draft_obj = draft_objects[idx] if idx < len(draft_objects) else None
-
-            # Extract draft info
-            if draft_obj:
-                draft_id = draft_obj.get("id", "")
-                draft_link = f'=HYPERLINK("https://mail.google.com/mail/#drafts?compose={draft_id}", "열기")'
-            else:
-                draft_id = ""
-                draft_link = ""
+            draft = drafts[idx] if idx < len(drafts) else {}
 
             email_data = {
                 "status": "needs_response",
@@ -264,14 +236,17 @@ def main() -> None:
                 "thread_id": email.get('thread_id', ''),
             }
 
-            sheets.add_email_row(
-                spreadsheet_id,
-                email_data,
-                draft_id=draft_id,
-                draft_link=draft_link,
-            )
+            rows.append({
+                "email_data": email_data,
+                "draft_id": draft_obj.get("id", "") if draft_obj else "",
+                "draft_subject": draft.get("subject", "") if draft_obj else "",
+                "draft_body": draft.get("body", "") if draft_obj else "",
+            })
+
+        # All rows in one buffered write (row cursor kept in memory)
+        sheets.add_email_rows(spreadsheet_id, rows)
 
-        print(f"✅ Added {len(emails_needing_response)} emails with draft links to spreadsheet")
+        print(f"✅ Added {len(emails_needing_response)} emails with drafts to spreadsheet")
 
         # === STEP 5.5: Update Sender Management Tab ===
         print("\n" + "="*80)
@@ -287,16 +262,16 @@ def main() -> None:
         print(f"   → Found {len(all_sender_stats)} senders")
 
         print("\n📝 Updating 발신자 관리 tab...")
-        for sender_email, stats in all_sender_stats.items():
-            sheets.add_or_update_sender(
-                spreadsheet_id,
-                sender_email,
-                stats
-            )
+        # One read (flushes the Emails rows first); changed and new rows are buffered
+        sync = sheets.sync_senders(spreadsheet_id, all_sender_stats)
 
-        print(f"   ✅ Updated {len(all_sender_stats)} senders in 발신자 관리 tab")
+        print(f"   ✅ Updated {sync['updated']}, added {sync['added']} senders in 발신자 관리 tab "
+              f"({sync['unchanged']} unchanged)")
         print("   💡 Review and manually grade senders (VIP/중요/보통/낮음/차단)")
 
+        # 사용자가 시트를 검토하기 전에 버퍼에 남은 쓰기를 모두 기록
+        sheets.flush()
+
         # === STEP 6: Batch Send (Optional) ===
         print("\n" + "="*80)
         print("STEP 6: BATCH SEND FROM SPREADSHEET (OPTIONAL)")
@@ -306,7 +281,8 @@ def main() -> None:
 
         if send_choice == 'y':
             print("\n🔍 Checking spreadsheet for drafts to send...")
-            drafts_to_send = sheets.get_drafts_to_send(spreadsheet_id)
+            # drafts.send only needs the draft ID, so draft bodies (column K) are not read
+            drafts_to_send = sheets.get_drafts_to_send(spreadsheet_id, include_body=False)
 
             if not drafts_to_send:
                 print("   No drafts marked for sending")
@@ -314,50 +290,50 @@ def main() -> None:
                 print(f"   Found {len(drafts_to_send)} drafts marked:")
 
                 for draft_info in drafts_to_send:
-                    print(f"   - {draft_info['subject'][:50]} (to: {draft_info['sender']})")
+                    print(f"   - {draft_info['draft_subject'][:50]} (to: {draft_info['sender']})")
 
                 confirm = input(f"\n⚠️  Send {len(drafts_to_send)} drafts? (yes/no): ").strip().lower()
 
                 if confirm == 'yes':
                     print("\n📤 Sending drafts...")
 
+                    # Concurrent send; journaled so a rerun never sends a draft twice
                     draft_ids = [d['draft_id'] for d in drafts_to_send]
-                    results = gmail.batch_send_drafts(draft_ids)  # NEW: Send existing drafts
+                    results = gmail.batch_send_drafts(draft_ids)
 
                     # Update spreadsheet status and Gmail labels
+                    sent_rows = []
+                    replied = []
                     for result, draft_info in zip(results, drafts_to_send):
                         if result['success']:
-                            # Update Sheets status
-                            sheets.update_email_status(
-                                spreadsheet_id,
-                                draft_info['row_number'],
-                                "답장완료",
-                                uncheck_send_box=True,
-                            )
-
-                            # Update Gmail label (답장필요 → 답장완료)
-                            try:
-                                message_id = result.get('message_id')
-                                if message_id:
-                                    # Remove old labels and apply 답장완료
-                                    gmail.remove_all_classification_labels(message_id, label_ids)
-                                    gmail.apply_labels_to_email(
-                                        message_id=message_id,
-                                        status="답장완료",
-                                        priority=3,  # Keep priority label
-                                        label_ids=label_ids
-                                    )
-                            except Exception as e:
-                                print(f"   ⚠️  Failed to update label: {e}")
-
-                            print(f"   ✅ Sent: {draft_info['subject'][:50]}...")
+                            sent_rows.append(draft_info['row_number'])
+
+                            # Gmail label (답장필요 → 답장완료), applied in bulk below
+                            if result.get('message_id'):
+                                replied.append((result['message_id'], "답장완료", 3))
+
+                            print(f"   ✅ Sent: {draft_info['draft_subject'][:50]}...")
                         else:
                             error_msg = result['error']
-                            print(f"   ❌ Failed: {draft_info['subject'][:50]}... - {error_msg}")
+                            print(f"   ❌ Failed: {draft_info['draft_subject'][:50]}... - {error_msg}")
+
+                    # Sheets status for all sent rows (one batchUpdate)
+                    sheets.update_email_statuses(
+                        spreadsheet_id, sent_rows, "답장완료", uncheck_send_box=True
+                    )
+                    sheets.flush()
+
+                    # Replaces old classification labels with 답장완료 (one batchModify)
+                    failed_labels = gmail.apply_labels_to_emails(replied, label_ids)
+                    if failed_labels:
+                        print(f"   ⚠️  Failed to update label for {len(failed_labels)} sent emails")
 
                     success_count = sum(1 for r in results if r['success'])
                     print(f"\n📧 Successfully sent {success_count}/{len(results)} drafts")
 
+        # 남은 시트 쓰기를 결과 출력 전에 기록 (실패하면 아래 오류 처리로)
+        sheets.flush()
+
         # === STEP 7: Results ===
         print("\n" + "="*80)
         print("RESULTS SUMMARY")
@@ -368,11 +344,79 @@ def main() -> None:
         print(f"\n📊 Spreadsheet: https://docs.google.com/spreadsheets/d/{spreadsheet_id}")
         print("   → Review, edit drafts, and mark emails for batch sending")
 
+        # API quota usage (for tuning concurrency)
+        metrics = gmail.scheduler.get_metrics()
+        print(f"\n⏱️  API calls: {metrics['calls']} | "
+              f"throttled: {metrics['throttled_seconds']:.1f}s | "
+              f"backoff: {metrics['backoff_seconds']:.1f}s ({metrics['retries']} retries)")
+
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # 중간에 종료하거나 오류가 나도 버퍼에 남은 시트 쓰기를 기록
+        if sheets is not None:
+            try:
+                sheets.flush()
+            except Exception as e:
+                print(f"⚠️  Could not write pending spreadsheet updates: {e}")
+
+
+async def _apply_labels(
+    async_gmail: AsyncGmailClient, emails: List[Dict[str, Any]], label_ids: Dict[str, str]
+) -> None:
+    """Apply status/priority labels to all classified emails (batchModify per label set)."""
+    classifications = []
+    for email in emails:
+        classification = email.get('classification', {})
+        requires_response = classification.get('requires_response', False)
+        priority = classification.get('priority', 3)
+
+        # Map to status
+        if requires_response:
+            status = "답장필요"
+        else:
+            status = "답장불필요"
+
+        classifications.append((email['id'], status, priority))
+
+    failed = set(await async_gmail.apply_labels_to_emails(classifications, label_ids))
+
+    for email, (_, status, priority) in zip(emails, classifications):
+        if email['id'] in failed:
+            print(f"   ⚠️  Failed to label: {email['subject'][:40]}...")
+        else:
+            print(f"   ✅ {status} | P{priority} - {email['subject'][:40]}...")
+
+
+async def _create_drafts(
+    async_gmail: AsyncGmailClient, emails: List[Dict[str, Any]], drafts: List[Dict[str, Any]]
+) -> List[Optional[Dict[str, Any]]]:
+    """Create Gmail drafts in bulk, one per thread (None placeholder for failed drafts)."""
+    results = await async_gmail.create_drafts_bulk([
+        {
+            "thread_id": email["thread_id"],
+            "to": email["sender"],
+            "subject": draft["subject"],
+            "body": draft["body"],
+            "is_html": True,
+        }
+        for email, draft in zip(emails, drafts)
+    ])
+
+    draft_objects = []
+    for email, result in zip(emails, results):
+        if result["success"]:
+            action = "Updated" if result["updated"] else "Draft"
+            print(f"   ✅ {action}: {email['subject'][:50]}... (ID: {result['draft_id'][:10]}...)")
+            draft_objects.append(result["draft"])
+        else:
+            print(f"   ⚠️  Failed: {result['error']}")
+            draft_objects.append(None)
+
+    return draft_objects
 
 
 def _display_results(emails: list[dict]) -> None:
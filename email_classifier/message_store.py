@@ -0,0 +1,808 @@
+"""Local SQLite message store for Gmail messages (keyed by message ID)."""
+import json
+import math
+import os.path
+import re
+import sqlite3
+import time
+from email.utils import parseaddr, parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 로컬 메시지 저장소 위치 (email_history_config.json과 같은 프로젝트 루트)
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(__file__), '..', 'email_store.db')
+
+# 저장소 최대 크기 (초과 시 오래 사용하지 않은 메시지부터 삭제)
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024  # 100MB
+
+# 연락처별로 보관하는 본문 샘플 수 / 샘플 길이
+CONTACT_SAMPLES = 5
+CONTACT_SAMPLE_CHARS = 1000
+
+# 최근 활동 지수 감쇠 시간 상수 (τ = 7일 → 일정한 빈도라면 최근 7일 건수와 같은 값)
+RECENCY_TAU_MS = 7 * 24 * 60 * 60 * 1000
+
+# 연락처 인덱스 상태 (messages.contact_indexed)
+_NOT_INDEXED, _INDEXED_NO_BODY, _INDEXED = 0, 1, 2
+
+_ADDRESS_RE = re.compile(r'[\w\.+-]+@[\w\.-]+')
+
+# contacts 테이블에서 읽는 컬럼 (sent_ids / received_ids는 contact_messages로 옮겨진 옛 컬럼)
+_CONTACT_COLUMNS = (
+    "address, name, total_sent, total_received, first_contact, last_contact, "
+    "sent_samples, received_samples, p45_count, recency_score, recency_at"
+)
+
+
+class MessageStore:
+    """
+    Persistent on-disk cache of parsed Gmail messages.
+
+    Gmail message content (headers, body) never changes, so each message is
+    downloaded once and reused across runs. Labels do change and are kept
+    current with history deltas (see GmailClient._sync_store_labels).
+    Thread summaries are cached next to messages, keyed by thread historyId,
+    along with the set of thread IDs that contain a message I sent, the
+    draft last created per thread and a contact index (per address:
+    counts, body samples; message membership in contact_messages).
+
+    Record format:
+        {
+            'id': 'abc123',
+            'thread_id': 't456',
+            'label_ids': ['INBOX', 'UNREAD'],
+            'snippet': '...',
+            'internal_date': 1705300000000 (Gmail internalDate, epoch ms) or None,
+            'headers': [{'name': 'From', 'value': '...'}, ...],
+            'body': 'decoded text' or None (not downloaded yet),
+            'labels_stale': True if label_ids may be outdated (get_many only),
+        }
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open (or create) the SQLite store."""
+        self.path = path
+        self.max_bytes = max_bytes
+        # 내 주소 (기본 + send-as 별칭, GmailClient가 설정): 받은 메일 집계에서 제외
+        self.own_addresses: set = set()
+        self.conn = sqlite3.connect(path)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create tables if they don't exist."""
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                id TEXT PRIMARY KEY,
+                thread_id TEXT NOT NULL,
+                label_ids TEXT NOT NULL,
+                snippet TEXT NOT NULL,
+                headers TEXT NOT NULL,
+                body TEXT,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_last_access ON messages (last_access);
+            CREATE TABLE IF NOT EXISTS threads (
+                id TEXT PRIMARY KEY,
+                history_id TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sent_threads (
+                thread_id TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS contacts (
+                address TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                sent_ids TEXT NOT NULL,        -- 옛 형식 (항상 '[]', contact_messages 사용)
+                received_ids TEXT NOT NULL,    -- 옛 형식 (항상 '[]')
+                total_sent INTEGER NOT NULL,
+                total_received INTEGER NOT NULL,
+                first_contact INTEGER,
+                last_contact INTEGER,
+                sent_samples TEXT NOT NULL,
+                received_samples TEXT NOT NULL,
+                p45_count INTEGER NOT NULL DEFAULT 0,
+                recency_score REAL NOT NULL DEFAULT 0,
+                recency_at INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS contact_messages (
+                address TEXT NOT NULL,
+                message_id TEXT NOT NULL,
+                direction TEXT NOT NULL,
+                PRIMARY KEY (address, message_id)
+            );
+            CREATE TABLE IF NOT EXISTS thread_drafts (
+                thread_id TEXT PRIMARY KEY,
+                draft_id TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS classified (
+                message_id TEXT PRIMARY KEY,
+                address TEXT NOT NULL,
+                priority INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+
+        # 기존 저장소 마이그레이션: 나중에 추가된 컬럼
+        self._add_column("messages", "contact_indexed", "INTEGER NOT NULL DEFAULT 0")
+        self._add_column("messages", "internal_date", "INTEGER")
+        self._add_column("messages", "labels_stale", "INTEGER NOT NULL DEFAULT 0")
+        self._add_column("contacts", "p45_count", "INTEGER NOT NULL DEFAULT 0")
+        self._add_column("contacts", "recency_score", "REAL NOT NULL DEFAULT 0")
+        self._add_column("contacts", "recency_at", "INTEGER NOT NULL DEFAULT 0")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_messages_contact_indexed ON messages (contact_indexed)"
+        )
+        self._migrate_contact_ids()
+        self._create_size_counter()
+        self.conn.commit()
+
+    def _create_size_counter(self) -> None:
+        """Keep SUM(messages.size) in meta.total_size, updated by triggers on every write."""
+        if self.get_meta("total_size") is None:
+            # 기존 저장소: 한 번만 전체 합계 계산
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM messages").fetchone()[0]
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('total_size', ?)", (str(total),))
+
+        self.conn.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS messages_size_insert AFTER INSERT ON messages BEGIN
+                UPDATE meta SET value = CAST(value AS INTEGER) + NEW.size WHERE key = 'total_size';
+            END;
+            CREATE TRIGGER IF NOT EXISTS messages_size_update AFTER UPDATE OF size ON messages BEGIN
+                UPDATE meta SET value = CAST(value AS INTEGER) + NEW.size - OLD.size WHERE key = 'total_size';
+            END;
+            CREATE TRIGGER IF NOT EXISTS messages_size_delete AFTER DELETE ON messages BEGIN
+                UPDATE meta SET value = CAST(value AS INTEGER) - OLD.size WHERE key = 'total_size';
+            END;
+            """
+        )
+
+    def _migrate_contact_ids(self) -> None:
+        """Move message IDs from the old contacts JSON arrays into contact_messages."""
+        rows = self.conn.execute(
+            "SELECT address, sent_ids, received_ids FROM contacts "
+            "WHERE sent_ids != '[]' OR received_ids != '[]'"
+        ).fetchall()
+        for address, sent_json, received_json in rows:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO contact_messages (address, message_id, direction) VALUES (?, ?, ?)",
+                [(address, msg_id, "sent") for msg_id in json.loads(sent_json)]
+                + [(address, msg_id, "received") for msg_id in json.loads(received_json)],
+            )
+        if rows:
+            self.conn.execute("UPDATE contacts SET sent_ids = '[]', received_ids = '[]'")
+
+    def _add_column(self, table: str, column: str, declaration: str) -> None:
+        """Add a column to an existing table if it's missing."""
+        columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+    # ===== 메시지 조회/저장 =====
+
+    def get_many(self, message_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached records for the given message IDs.
+
+        Returns:
+            Dict mapping message ID to record (IDs not in the store are omitted)
+        """
+        ids = list(dict.fromkeys(message_ids))
+        records: Dict[str, Dict[str, Any]] = {}
+
+        # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT id, thread_id, label_ids, snippet, headers, body, internal_date, labels_stale "
+                f"FROM messages WHERE id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+
+            for row in rows:
+                records[row[0]] = {
+                    "id": row[0],
+                    "thread_id": row[1],
+                    "label_ids": json.loads(row[2]),
+                    "snippet": row[3],
+                    "headers": json.loads(row[4]),
+                    "body": row[5],
+                    "internal_date": row[6],
+                    "labels_stale": bool(row[7]),
+                }
+
+        if records:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE messages SET last_access = ? WHERE id = ?",
+                [(now, msg_id) for msg_id in records],
+            )
+            self.conn.commit()
+
+        return records
+
+    def put_many(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert or replace records, update the contact index, then evict if
+        the store is over max_bytes.
+
+        A record without a body never overwrites a stored body.
+        """
+        if not records:
+            return
+
+        now = time.time()
+        rows = []
+        for record in records:
+            headers_json = json.dumps(record["headers"], ensure_ascii=False)
+            body = record.get("body")
+            size = len(headers_json) + len(record.get("snippet", "")) + len(body or "")
+            rows.append((
+                record["id"],
+                record.get("thread_id", ""),
+                json.dumps(record.get("label_ids", [])),
+                record.get("snippet", ""),
+                headers_json,
+                body,
+                record.get("internal_date"),
+                size,
+                now,
+            ))
+
+        self.conn.executemany(
+            """
+            INSERT INTO messages (
+                id, thread_id, label_ids, snippet, headers, body, internal_date, size, last_access
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                thread_id = excluded.thread_id,
+                label_ids = excluded.label_ids,
+                snippet = excluded.snippet,
+                headers = excluded.headers,
+                body = COALESCE(excluded.body, messages.body),
+                internal_date = COALESCE(excluded.internal_date, messages.internal_date),
+                size = MAX(excluded.size, messages.size),
+                last_access = excluded.last_access,
+                labels_stale = 0
+            """,
+            rows,
+        )
+        self.conn.commit()
+
+        self.index_contacts()
+        self.evict()
+
+    # ===== 스레드 요약 (thread historyId 기준 캐시) =====
+
+    def get_threads(self, thread_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached thread summaries (see GmailClient.get_thread_summaries).
+
+        Returns:
+            Dict mapping thread ID to summary (summary['history_id'] is the
+            thread historyId it was built from)
+        """
+        ids = list(dict.fromkeys(thread_ids))
+        summaries: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT id, summary FROM threads WHERE id IN ({placeholders})", chunk
+            ).fetchall()
+            for thread_id, summary in rows:
+                summaries[thread_id] = json.loads(summary)
+
+        if summaries:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE threads SET last_access = ? WHERE id = ?",
+                [(now, thread_id) for thread_id in summaries],
+            )
+            self.conn.commit()
+
+        return summaries
+
+    def put_threads(self, summaries: List[Dict[str, Any]]) -> None:
+        """Insert or replace thread summaries (keyed by summary['thread_id'])."""
+        if not summaries:
+            return
+
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO threads (id, history_id, summary, last_access) VALUES (?, ?, ?, ?)",
+            [
+                (s["thread_id"], s["history_id"], json.dumps(s, ensure_ascii=False), now)
+                for s in summaries
+            ],
+        )
+        self.conn.commit()
+
+    # ===== 보낸 메일 스레드 인덱스 (답장 여부 확인) =====
+
+    def add_sent_threads(self, thread_ids: Iterable[str]) -> None:
+        """Record threads that contain at least one message I sent."""
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO sent_threads (thread_id) VALUES (?)",
+            [(thread_id,) for thread_id in thread_ids if thread_id],
+        )
+        self.conn.commit()
+
+    def get_sent_threads(self, thread_ids: Iterable[str]) -> set:
+        """Get the subset of thread IDs that contain a message I sent."""
+        ids = list(dict.fromkeys(thread_ids))
+        found = set()
+
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT thread_id FROM sent_threads WHERE thread_id IN ({placeholders})", chunk
+            ).fetchall()
+            found.update(row[0] for row in rows)
+
+        return found
+
+    # ===== 스레드별 초안 (초안 중복 생성 방지) =====
+
+    def get_thread_drafts(self, thread_ids: Iterable[str]) -> Dict[str, str]:
+        """Get the draft ID last created for each thread (threads without one are omitted)."""
+        ids = list(dict.fromkeys(thread_ids))
+        drafts: Dict[str, str] = {}
+
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT thread_id, draft_id FROM thread_drafts WHERE thread_id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            drafts.update(rows)
+
+        return drafts
+
+    def put_thread_drafts(self, drafts: Dict[str, str]) -> None:
+        """Record the draft ID created for each thread (thread ID → draft ID)."""
+        if not drafts:
+            return
+
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO thread_drafts (thread_id, draft_id, updated_at) VALUES (?, ?, ?)",
+            [(thread_id, draft_id, now) for thread_id, draft_id in drafts.items()],
+        )
+        self.conn.commit()
+
+    # ===== 연락처 인덱스 (주소별 주고받은 메일) =====
+
+    def index_contacts(self) -> int:
+        """
+        Add messages not yet reflected in the contact index.
+
+        Messages labeled SENT count as sent to each To/Cc address; all others
+        as received from the From address. Drafts and messages from
+        own_addresses without a SENT label are skipped. A message seen
+        earlier without a body contributes its body sample once the body is
+        downloaded.
+
+        Membership is one contact_messages row per (address, message), so
+        each message updates its contacts in O(1): the counters move only
+        when that row is new (a message re-downloaded after clear() is not
+        counted twice).
+
+        Returns:
+            Number of messages indexed
+        """
+        rows = self.conn.execute(
+            "SELECT id, label_ids, headers, body, internal_date, contact_indexed FROM messages "
+            "WHERE contact_indexed = ? OR (contact_indexed = ? AND body IS NOT NULL)",
+            (_NOT_INDEXED, _INDEXED_NO_BODY),
+        ).fetchall()
+        if not rows:
+            return 0
+
+        contacts: Dict[str, Dict[str, Any]] = {}
+        states = []
+
+        for msg_id, label_json, headers_json, body, internal_date, state in rows:
+            headers = json.loads(headers_json)
+            label_ids = json.loads(label_json)
+
+            def _header(name: str) -> str:
+                return next((h["value"] for h in headers if h["name"].lower() == name), "")
+
+            is_sent = "SENT" in label_ids
+            if is_sent:
+                addresses = _ADDRESS_RE.findall(_header("to")) + _ADDRESS_RE.findall(_header("cc"))
+                name = ""
+            else:
+                addresses = _ADDRESS_RE.findall(_header("from"))[:1]
+                name = parseaddr(_header("from"))[0]
+
+            # 내 초안, SENT 라벨 없이 저장된 내 메일(별칭 등)은 받은 메일로 세지 않음
+            if "DRAFT" in label_ids or (
+                not is_sent and addresses and addresses[0].lower() in self.own_addresses
+            ):
+                states.append((_INDEXED, msg_id))
+                continue
+
+            # internalDate 컬럼 추가 전에 저장된 메시지만 Date 헤더로 대체
+            timestamp = internal_date or _parse_date(_header("date"))
+            sample = None
+            # 보낸 메일은 짧은 회신(50자 이하)을 샘플로 쓰지 않음 (문체 학습용)
+            if body is not None and (not is_sent or len(body.strip()) > 50):
+                sample = {
+                    "id": msg_id,
+                    "date": timestamp or 0,
+                    "subject": _header("subject"),
+                    "body": body[:CONTACT_SAMPLE_CHARS],
+                }
+
+            for address in dict.fromkeys(a.lower() for a in addresses):
+                contact = contacts.get(address) or self._load_contact(address)
+                contacts[address] = contact
+                if name and not contact["name"]:
+                    contact["name"] = name
+
+                if state == _NOT_INDEXED:
+                    inserted = self.conn.execute(
+                        "INSERT OR IGNORE INTO contact_messages (address, message_id, direction) "
+                        "VALUES (?, ?, ?)",
+                        (address, msg_id, "sent" if is_sent else "received"),
+                    ).rowcount
+                    if inserted == 1:  # 저장소 초기화 후 다시 받은 메일은 중복 집계하지 않음
+                        contact["total_sent" if is_sent else "total_received"] += 1
+                        if timestamp:
+                            contact["first_contact"] = min(contact["first_contact"] or timestamp, timestamp)
+                            contact["last_contact"] = max(contact["last_contact"] or timestamp, timestamp)
+                            _add_recency_event(contact, timestamp)
+
+                if sample:
+                    samples = contact["sent_samples"] if is_sent else contact["received_samples"]
+                    if all(s["id"] != msg_id for s in samples):
+                        samples.append(sample)
+                        samples.sort(key=lambda s: s["date"], reverse=True)
+                        del samples[CONTACT_SAMPLES:]
+
+            states.append((_INDEXED if body is not None else _INDEXED_NO_BODY, msg_id))
+
+        # p45_count는 record_priorities()가 관리하므로 덮어쓰지 않음
+        self.conn.executemany(
+            """
+            INSERT INTO contacts (
+                address, name, sent_ids, received_ids, total_sent, total_received,
+                first_contact, last_contact, sent_samples, received_samples,
+                recency_score, recency_at
+            ) VALUES (?, ?, '[]', '[]', ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(address) DO UPDATE SET
+                name = excluded.name,
+                total_sent = excluded.total_sent,
+                total_received = excluded.total_received,
+                first_contact = excluded.first_contact,
+                last_contact = excluded.last_contact,
+                sent_samples = excluded.sent_samples,
+                received_samples = excluded.received_samples,
+                recency_score = excluded.recency_score,
+                recency_at = excluded.recency_at
+            """,
+            [
+                (
+                    c["address"], c["name"],
+                    c["total_sent"], c["total_received"],
+                    c["first_contact"], c["last_contact"],
+                    json.dumps(c["sent_samples"], ensure_ascii=False),
+                    json.dumps(c["received_samples"], ensure_ascii=False),
+                    c["recency_score"], c["recency_at"],
+                )
+                for c in contacts.values()
+            ],
+        )
+        self.conn.executemany("UPDATE messages SET contact_indexed = ? WHERE id = ?", states)
+        self.conn.commit()
+
+        return len(rows)
+
+    def record_priorities(self, classifications: List[Tuple[str, str, int]]) -> None:
+        """
+        Record classification priorities and update each sender's P4-5 count.
+
+        Re-recording a message only adjusts the count if its priority crossed
+        the P4 threshold, so repeated runs don't double count. A sender not
+        yet in the contact index gets a contact row, so the count is kept
+        when index_contacts() adds its messages later.
+
+        Args:
+            classifications: (message_id, sender address, priority) per email
+        """
+        deltas: Dict[str, int] = {}
+
+        for message_id, address, priority in classifications:
+            address = address.lower()
+            row = self.conn.execute(
+                "SELECT priority FROM classified WHERE message_id = ?", (message_id,)
+            ).fetchone()
+            was_high = row is not None and row[0] >= 4
+            is_high = priority >= 4
+            if is_high != was_high:
+                deltas[address] = deltas.get(address, 0) + (1 if is_high else -1)
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO classified (message_id, address, priority) VALUES (?, ?, ?)",
+                (message_id, address, priority),
+            )
+
+        # 아직 연락처 인덱스에 없는 발신자도 행을 만들어 집계가 누락되지 않게 함
+        self.conn.executemany(
+            """
+            INSERT INTO contacts (
+                address, name, sent_ids, received_ids, total_sent, total_received,
+                sent_samples, received_samples, p45_count
+            ) VALUES (:address, '', '[]', '[]', 0, 0, '[]', '[]', MAX(0, :delta))
+            ON CONFLICT(address) DO UPDATE SET
+                p45_count = MAX(0, contacts.p45_count + :delta)
+            """,
+            [{"address": address, "delta": delta} for address, delta in deltas.items()],
+        )
+        self.conn.commit()
+
+    def get_sender_stats(self, now_ms: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get aggregate stats for every contact I received mail from (one query).
+
+        Args:
+            now_ms: Reference time for recency (default: now)
+
+        Returns:
+            Dict mapping address to stats (same keys as GmailClient.collect_all_sender_stats)
+        """
+        from datetime import datetime
+
+        now_ms = now_ms or int(time.time() * 1000)
+        rows = self.conn.execute(
+            "SELECT address, name, total_sent, total_received, p45_count, "
+            "last_contact, recency_score, recency_at FROM contacts WHERE total_received > 0"
+        ).fetchall()
+
+        stats = {}
+        for address, name, sent, received, p45, last_contact, score, score_at in rows:
+            if address in self.own_addresses:
+                continue  # 내 주소 제외 필터 이전에 집계된 저장소
+            stats[address] = {
+                "name": name,
+                "total_sent": sent,
+                "total_received": received,
+                "p45_count": p45,
+                "total_emails": received,
+                # 지수 감쇠 활동량 (τ=7일), 최근 7일 건수와 같은 척도
+                "recent_7days": round(_decayed(score, score_at, now_ms), 1),
+                "last_contact_date": (
+                    datetime.fromtimestamp(last_contact / 1000).strftime('%Y-%m-%d')
+                    if last_contact else ""
+                ),
+            }
+
+        return stats
+
+    def get_contacts(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get contact index entries by address (one query).
+
+        Returns:
+            Dict mapping lowercase address to contact:
+            {
+                'address': 'a@example.com',
+                'name': 'Alice',
+                'total_sent': 3, 'total_received': 5,
+                'first_contact': 1700000000000, 'last_contact': 1736000000000,  # epoch ms
+                'sent_samples': [{'id', 'date', 'subject', 'body'}, ...],      # newest first
+                'received_samples': [...],
+            }
+            (addresses never seen are omitted)
+        """
+        ids = list(dict.fromkeys(a.lower() for a in addresses))
+        contacts: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT {_CONTACT_COLUMNS} FROM contacts WHERE address IN ({placeholders})", chunk
+            ).fetchall()
+            for row in rows:
+                contacts[row[0]] = self._contact_from_row(row)
+
+        return contacts
+
+    def _load_contact(self, address: str) -> Dict[str, Any]:
+        """Load one contact, or an empty entry if the address is new."""
+        row = self.conn.execute(
+            f"SELECT {_CONTACT_COLUMNS} FROM contacts WHERE address = ?", (address,)
+        ).fetchone()
+        if row is not None:
+            return self._contact_from_row(row)
+
+        return {
+            "address": address,
+            "name": "",
+            "total_sent": 0,
+            "total_received": 0,
+            "first_contact": None,
+            "last_contact": None,
+            "sent_samples": [],
+            "received_samples": [],
+            "p45_count": 0,
+            "recency_score": 0.0,
+            "recency_at": 0,
+        }
+
+    def _contact_from_row(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Convert a contacts row (_CONTACT_COLUMNS) to a dict."""
+        return {
+            "address": row[0],
+            "name": row[1],
+            "total_sent": row[2],
+            "total_received": row[3],
+            "first_contact": row[4],
+            "last_contact": row[5],
+            "sent_samples": json.loads(row[6]),
+            "received_samples": json.loads(row[7]),
+            "p45_count": row[8],
+            "recency_score": row[9],
+            "recency_at": row[10],
+        }
+
+    # ===== 라벨 갱신 (history delta / 자체 라벨 변경) =====
+
+    def update_labels(
+        self,
+        message_id: str,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Apply a label change to a cached message (no-op if not cached)."""
+        self.update_labels_many([message_id], add, remove)
+
+    def update_labels_many(
+        self,
+        message_ids: Iterable[str],
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> None:
+        """Apply the same label change to several cached messages (one commit)."""
+        add_ids = list(add)
+        remove_ids = set(remove)
+        updates = []
+
+        for message_id in message_ids:
+            row = self.conn.execute(
+                "SELECT label_ids FROM messages WHERE id = ?", (message_id,)
+            ).fetchone()
+            if row is None:
+                continue
+
+            labels = [lid for lid in json.loads(row[0]) if lid not in remove_ids]
+            for lid in add_ids:
+                if lid not in labels:
+                    labels.append(lid)
+            updates.append((json.dumps(labels), message_id))
+
+        if updates:
+            self.conn.executemany("UPDATE messages SET label_ids = ? WHERE id = ?", updates)
+            self.conn.commit()
+
+    def set_labels_many(self, labels: Dict[str, List[str]]) -> None:
+        """Replace cached label IDs with ones just read from Gmail (clears labels_stale)."""
+        self.conn.executemany(
+            "UPDATE messages SET label_ids = ?, labels_stale = 0 WHERE id = ?",
+            [(json.dumps(label_ids), msg_id) for msg_id, label_ids in labels.items()],
+        )
+        self.conn.commit()
+
+    def mark_labels_stale(self) -> None:
+        """
+        Flag every cached message's labels as outdated (history can't be replayed).
+
+        Headers and bodies stay cached; labels are re-read on next access.
+        The sent-thread index is dropped and rebuilt on next use.
+        """
+        self.conn.execute("UPDATE messages SET labels_stale = 1")
+        self.conn.execute("DELETE FROM sent_threads")
+        self.conn.execute("DELETE FROM meta WHERE key = 'sent_index_built'")
+        self.conn.commit()
+
+    def delete(self, message_ids: Iterable[str]) -> None:
+        """Remove messages (e.g. permanently deleted in Gmail)."""
+        self.conn.executemany(
+            "DELETE FROM messages WHERE id = ?", [(msg_id,) for msg_id in message_ids]
+        )
+        self.conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached messages, thread summaries and the sent-thread index."""
+        self.conn.execute("DELETE FROM messages")
+        self.conn.execute("DELETE FROM threads")
+        # 보낸 메일 인덱스도 history로 이어갈 수 없으므로 다음 사용 시 재구성
+        self.conn.execute("DELETE FROM sent_threads")
+        self.conn.execute("DELETE FROM meta WHERE key = 'sent_index_built'")
+        self.conn.commit()
+
+    # ===== 메타데이터 (history 체크포인트 등) =====
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Get a metadata value."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Set a metadata value."""
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+        self.conn.commit()
+
+    # ===== 용량 관리 =====
+
+    def evict(self) -> int:
+        """
+        Evict least recently used messages until the store fits in max_bytes.
+
+        Trims down to 90% of max_bytes so eviction doesn't run on every insert.
+        The store size is the running total in meta (no table scan unless
+        the store is over budget).
+
+        Returns:
+            Number of evicted messages
+        """
+        total = int(self.get_meta("total_size") or 0)
+        if total <= self.max_bytes:
+            return 0
+
+        target = int(self.max_bytes * 0.9)
+        evict_ids = []
+        for msg_id, size in self.conn.execute(
+            "SELECT id, size FROM messages ORDER BY last_access ASC"
+        ):
+            if total <= target:
+                break
+            evict_ids.append(msg_id)
+            total -= size
+
+        self.delete(evict_ids)
+        return len(evict_ids)
+
+
+def _parse_date(date_header: str) -> Optional[int]:
+    """Parse a Date header to epoch milliseconds (None if malformed; legacy records only)."""
+    try:
+        return int(parsedate_to_datetime(date_header).timestamp() * 1000)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _add_recency_event(contact: Dict[str, Any], timestamp: int) -> None:
+    """Add one message at `timestamp` to the contact's decayed activity counter (O(1))."""
+    if timestamp >= contact["recency_at"]:
+        contact["recency_score"] = _decayed(contact["recency_score"], contact["recency_at"], timestamp) + 1
+        contact["recency_at"] = timestamp
+    else:
+        # 기준 시각보다 오래된 메일은 그만큼 감쇠된 값만 더함
+        contact["recency_score"] += math.exp(-(contact["recency_at"] - timestamp) / RECENCY_TAU_MS)
+
+
+def _decayed(score: float, score_at: int, now_ms: int) -> float:
+    """Value at `now_ms` of a counter that was `score` at `score_at`."""
+    if not score:
+        return 0.0
+    return score * math.exp(-max(0, now_ms - score_at) / RECENCY_TAU_MS)
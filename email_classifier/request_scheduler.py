@@ -0,0 +1,326 @@
+"""Quota-aware request scheduler for Gmail/Sheets API calls (token bucket + backoff)."""
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+# Gmail quota units per method
+# See: https://developers.google.com/gmail/api/reference/quota
+GMAIL_QUOTA_UNITS = {
+    "gmail.users.getProfile": 1,
+    "gmail.users.history.list": 2,
+    "gmail.users.labels.list": 1,
+    "gmail.users.labels.get": 1,
+    "gmail.users.labels.create": 5,
+    "gmail.users.messages.list": 5,
+    "gmail.users.messages.get": 5,
+    "gmail.users.messages.modify": 5,
+    "gmail.users.messages.batchModify": 50,
+    "gmail.users.messages.send": 100,
+    "gmail.users.threads.list": 10,
+    "gmail.users.threads.get": 10,
+    "gmail.users.drafts.list": 5,
+    "gmail.users.drafts.get": 5,
+    "gmail.users.drafts.create": 10,
+    "gmail.users.drafts.update": 15,
+    "gmail.users.drafts.send": 100,
+    "gmail.users.settings.sendAs.list": 1,
+}
+DEFAULT_GMAIL_UNITS = 5
+
+# Gmail: 사용자당 초당 250 quota units
+GMAIL_UNITS_PER_SECOND = 250
+
+# 메일 발송은 quota와 별도로 발송 한도(일일 한도, 짧은 시간 대량 발송 차단)가 있어 더 낮게 제한
+GMAIL_SEND_METHODS = {"gmail.users.messages.send", "gmail.users.drafts.send"}
+GMAIL_SENDS_PER_MINUTE = 20
+GMAIL_SEND_BURST = 5
+
+# Sheets: 사용자당 분당 읽기 60회, 쓰기 60회 (요청 1회 = 1 unit)
+SHEETS_REQUESTS_PER_MINUTE = 60
+SHEETS_READ_METHODS = {
+    "sheets.spreadsheets.get",
+    "sheets.spreadsheets.values.get",
+    "sheets.spreadsheets.values.batchGet",
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# 403이지만 재시도 가능한 rate limit 사유
+RETRYABLE_403_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+# 멱등이 아닌 메서드: 5xx/타임아웃은 서버가 이미 처리했을 수 있으므로 재시도하지 않음
+# (429 / rate limit 403은 처리 전에 거절된 것이므로 재시도)
+NON_IDEMPOTENT_METHODS = {
+    "gmail.users.messages.send",
+    "gmail.users.drafts.send",
+    "gmail.users.drafts.create",
+    "gmail.users.labels.create",
+    "sheets.spreadsheets.create",
+    "sheets.spreadsheets.values.append",
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket (rate tokens/sec, up to capacity tokens)."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float) -> float:
+        """
+        Take tokens, sleeping until enough are available.
+
+        Requests larger than capacity are allowed once the bucket is full.
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+
+                wait = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+class RequestScheduler:
+    """
+    Shared rate limiter and retry policy for Gmail and Sheets requests.
+
+    Knows the quota cost of each API method, throttles with one token bucket
+    per quota (Gmail units/sec, Gmail sends/min, Sheets reads/min, Sheets writes/min) and
+    retries 429/5xx responses with jittered exponential backoff. Non-idempotent
+    methods (NON_IDEMPOTENT_METHODS, e.g. drafts.send) are retried only when
+    rate limited, never after a 5xx or transport error.
+
+    Plug it into a service with build(..., requestBuilder=scheduler.request_builder)
+    so every request.execute() goes through the scheduler. Batch requests
+    call acquire() for their item count explicitly.
+
+    Example:
+        scheduler = get_default_scheduler()
+        service = build("gmail", "v1", credentials=creds, requestBuilder=scheduler.request_builder)
+        ...
+        print(scheduler.get_metrics())
+        # {'calls': 42, 'throttled_seconds': 1.3, 'backoff_seconds': 2.1, 'retries': 1, ...}
+    """
+
+    def __init__(
+        self,
+        gmail_units_per_second: float = GMAIL_UNITS_PER_SECOND,
+        sheets_requests_per_minute: float = SHEETS_REQUESTS_PER_MINUTE,
+        gmail_sends_per_minute: float = GMAIL_SENDS_PER_MINUTE,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            gmail_units_per_second: Gmail per-user quota units per second
+            sheets_requests_per_minute: Sheets per-user requests per minute (read and write each)
+            gmail_sends_per_minute: Max messages.send/drafts.send calls per minute
+            max_retries: Max retries for retryable errors
+            base_delay: First backoff delay in seconds (doubles each retry)
+            max_delay: Backoff delay cap in seconds
+        """
+        sheets_rate = sheets_requests_per_minute / 60.0
+        self.buckets = {
+            "gmail": TokenBucket(gmail_units_per_second, gmail_units_per_second),
+            "sheets_read": TokenBucket(sheets_rate, sheets_requests_per_minute),
+            "sheets_write": TokenBucket(sheets_rate, sheets_requests_per_minute),
+            "gmail_send": TokenBucket(gmail_sends_per_minute / 60.0, GMAIL_SEND_BURST),
+        }
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            "calls": 0,
+            "retries": 0,
+            "throttled_seconds": 0.0,
+            "backoff_seconds": 0.0,
+            "quota_units": defaultdict(float),
+            "by_method": defaultdict(int),
+        }
+
+    # ===== 비용 계산 =====
+
+    def cost(self, method_id: Optional[str]) -> Tuple[str, float]:
+        """
+        Get (bucket name, units) for an API method ID.
+
+        Args:
+            method_id: Discovery method ID (e.g. "gmail.users.messages.get")
+        """
+        method_id = method_id or ""
+        if method_id.startswith("sheets."):
+            bucket = "sheets_read" if method_id in SHEETS_READ_METHODS else "sheets_write"
+            return bucket, 1
+
+        return "gmail", GMAIL_QUOTA_UNITS.get(method_id, DEFAULT_GMAIL_UNITS)
+
+    def acquire(self, method_id: Optional[str], count: int = 1) -> float:
+        """
+        Reserve quota for `count` calls of a method (used for batch requests).
+
+        Returns:
+            Seconds spent throttled
+        """
+        bucket, units = self.cost(method_id)
+        waited = self.buckets[bucket].acquire(units * count)
+        if method_id in GMAIL_SEND_METHODS:
+            waited += self.buckets["gmail_send"].acquire(count)
+
+        with self._metrics_lock:
+            self._metrics["calls"] += count
+            self._metrics["throttled_seconds"] += waited
+            self._metrics["quota_units"][bucket] += units * count
+            self._metrics["by_method"][method_id or "unknown"] += count
+
+        return waited
+
+    # ===== 재시도 =====
+
+    def is_retryable(self, error: Optional[BaseException], method_id: Optional[str] = None) -> bool:
+        """
+        Check if an error is a rate limit / transient server error worth retrying.
+
+        Args:
+            error: Exception raised by the call
+            method_id: Discovery method ID; non-idempotent methods are retried
+                       only on rate limits (the request was rejected unprocessed)
+        """
+        if method_id in NON_IDEMPOTENT_METHODS:
+            return self.is_rate_limited(error)
+
+        if isinstance(error, HttpError):
+            return error.resp.status in RETRYABLE_STATUS or self.is_rate_limited(error)
+
+        return isinstance(error, (ConnectionError, TimeoutError))
+
+    def is_rate_limited(self, error: Optional[BaseException]) -> bool:
+        """Check if an error is a 429 or rate-limit 403."""
+        if not isinstance(error, HttpError):
+            return False
+
+        status = error.resp.status
+        if status == 429:
+            return True
+        if status == 403:
+            content = error.content.decode("utf-8", errors="replace") if error.content else ""
+            return any(reason in content for reason in RETRYABLE_403_REASONS)
+        return False
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Sleep before retry `attempt` (0-based) with jittered exponential backoff.
+
+        Honors a Retry-After header when the server sends one.
+
+        Returns:
+            Seconds slept
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(delay / 2, delay)  # jitter
+
+        if isinstance(error, HttpError):
+            retry_after = error.resp.get("retry-after")
+            if retry_after and str(retry_after).isdigit():
+                delay = max(delay, float(retry_after))
+
+        time.sleep(delay)
+
+        with self._metrics_lock:
+            self._metrics["retries"] += 1
+            self._metrics["backoff_seconds"] += delay
+
+        return delay
+
+    def run(self, method_id: Optional[str], call: Callable[[], Any]) -> Any:
+        """
+        Run an API call under rate limiting, retrying retryable errors.
+
+        Args:
+            method_id: Discovery method ID used for quota cost
+            call: Zero-argument function performing the HTTP call
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire(method_id)
+            try:
+                return call()
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_retryable(e, method_id):
+                    raise
+                self.backoff(attempt, e)
+
+    # ===== googleapiclient 연동 =====
+
+    def request_builder(self, *args: Any, **kwargs: Any) -> "ScheduledHttpRequest":
+        """requestBuilder for googleapiclient.discovery.build()."""
+        request = ScheduledHttpRequest(*args, **kwargs)
+        request.scheduler = self
+        return request
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get throttling metrics.
+
+        Returns:
+            Dict with calls, retries, throttled_seconds (token bucket waits),
+            backoff_seconds (retry sleeps), quota_units per bucket, calls by_method
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+            metrics["quota_units"] = dict(self._metrics["quota_units"])
+            metrics["by_method"] = dict(self._metrics["by_method"])
+        return metrics
+
+
+class ScheduledHttpRequest(HttpRequest):
+    """HttpRequest whose execute() goes through a RequestScheduler."""
+
+    scheduler: Optional[RequestScheduler] = None
+
+    def execute(self, http: Any = None, num_retries: int = 0) -> Any:
+        """Execute with rate limiting and retries (num_retries is handled by the scheduler)."""
+        execute = super().execute
+        if self.scheduler is None:
+            return execute(http=http, num_retries=num_retries)
+        return self.scheduler.run(self.methodId, lambda: execute(http=http))
+
+
+_default_scheduler: Optional[RequestScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> RequestScheduler:
+    """Get the process-wide scheduler shared by GmailClient and SheetsClient."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler()
+        return _default_scheduler
@@ -0,0 +1,106 @@
+"""Append-only journal of draft sends (draft ID → pending/sent/failed)."""
+import json
+import os.path
+import time
+from typing import Any, Dict, Optional
+
+# 발송 기록 저장 위치 (email_store.db와 같은 프로젝트 루트)
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.dirname(__file__), '..', 'email_send_journal.jsonl')
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+
+class SendJournal:
+    """
+    Local append-only record of draft sends, so an interrupted run can resume.
+
+    Every send writes a 'pending' line before drafts.send is called and a
+    'sent' (with the message ID) or 'failed' line after it returns. Lines are
+    flushed and fsynced one by one, so a crash leaves at most the in-flight
+    drafts in 'pending'. The latest line per draft ID wins.
+
+    Example:
+        journal = SendJournal()
+        journal.record(draft_id, "pending")
+        sent = gmail.send_draft(draft_id)
+        journal.record(draft_id, "sent", message_id=sent["id"], thread_id=sent["threadId"])
+        journal.get(draft_id)["status"]  # 'sent'
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH) -> None:
+        """
+        Initialize journal (the file is read on first use).
+
+        Args:
+            path: JSONL file, one entry per line
+        """
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None  # draft ID → latest entry
+
+    def get(self, draft_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest entry for a draft.
+
+        Returns:
+            {'draft_id', 'status', 'message_id', 'thread_id', 'error', 'at'} or None if never sent
+        """
+        return self._load().get(draft_id)
+
+    def record(
+        self,
+        draft_id: str,
+        status: str,
+        message_id: Optional[str] = None,
+        thread_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Append an entry and flush it to disk before returning.
+
+        Args:
+            draft_id: Gmail draft ID
+            status: 'pending', 'sent' or 'failed'
+            message_id: Sent message ID (for 'sent')
+            thread_id: Sent message thread ID (for 'sent')
+            error: Error message (for 'failed')
+
+        Returns:
+            The recorded entry
+        """
+        entry = {
+            "draft_id": draft_id,
+            "status": status,
+            "message_id": message_id,
+            "thread_id": thread_id,
+            "error": error,
+            "at": time.time(),
+        }
+
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._load()[draft_id] = entry
+        return entry
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Replay the journal file into memory."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if not os.path.exists(self.path):
+            return self._entries
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._entries[entry["draft_id"]] = entry
+                except (ValueError, KeyError, TypeError):
+                    continue  # 기록 중 중단된 마지막 줄은 무시
+
+        return self._entries
@@ -7,6 +7,10 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from .request_scheduler import RequestScheduler, get_default_scheduler
+from .sheets_write_buffer import SheetsWriteBuffer
 
 
 def strip_html(text: str) -> str:
@@ -43,6 +47,40 @@ def strip_html(text: str) -> str:
 
     return clean.strip()
 
+def _cell_str(value: Any) -> str:
+    """Normalize a cell value the way Sheets displays it (for change detection)."""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+# 탭 구조 조회 시 필요한 필드만 요청 (셀 서식/데이터 제외)
+SCHEMA_FIELDS = "sheets.properties(sheetId,title,gridProperties(rowCount,columnCount,frozenRowCount))"
+
+# 처리 이력 스프레드시트 ID 저장 위치 (프로젝트 루트)
+HISTORY_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'email_history_config.json')
+
+# 신규 메일 / 처리 이력 탭 헤더 (Email Tracker 형식 16열 - 답장여부 포함)
+TRACKER_HEADERS = [
+    "상태",              # A: 답장필요/불필요/완료
+    "우선순위",          # B: 1-5
+    "라벨",              # C: Gmail labels
+    "제목",              # D: 이메일 제목
+    "발신자",            # E: 발신자
+    "받은CC",            # F: CC 수신자
+    "받은시간",          # G: Gmail Date 헤더
+    "내용미리보기",      # H: 본문 미리보기 (300자)
+    "AI요약",            # I: AI 요약
+    "초안(제목)",        # J: 답장 초안 제목
+    "초안(내용)",        # K: 답장 초안 내용
+    "보낼CC",            # L: 발송 시 CC
+    "전송예정",          # M: 체크박스
+    "답장여부",          # N: 답장함/미답장
+    "Draft ID",         # O: Gmail Draft ID
+    "Thread ID",        # P: Gmail Thread ID
+]
+
 # Gmail + Sheets 통합 스코프
 SCOPES = [
     "https://www.googleapis.com/auth/gmail.readonly",
@@ -56,10 +94,31 @@ SCOPES = [
 class SheetsClient:
     """Google Sheets API client for email management."""
 
-    def __init__(self) -> None:
-        """Initialize Sheets client with OAuth."""
+    # 프로세스 단위 스키마 캐시: 스프레드시트 ID → {탭 이름: sheetId}
+    _schema_cache: Dict[str, Dict[str, int]] = {}
+
+    def __init__(self, scheduler: Optional[RequestScheduler] = None) -> None:
+        """
+        Initialize Sheets client with OAuth.
+
+        Args:
+            scheduler: Rate limiter/retry policy (defaults to the scheduler shared with GmailClient)
+        """
         self.creds = self._get_credentials()
-        self.service = build("sheets", "v4", credentials=self.creds)
+        # 모든 요청은 quota 스케줄러를 거침 (분당 읽기/쓰기 한도 + 429/5xx 재시도)
+        self.scheduler = scheduler or get_default_scheduler()
+        self.service = build(
+            "sheets", "v4", credentials=self.creds, requestBuilder=self.scheduler.request_builder
+        )
+        # (스프레드시트, 탭) → 다음 빈 행 (처음 한 번만 A열을 읽음)
+        self._row_cursors: Dict[Tuple[str, str], int] = {}
+        # 처리 이력 인덱스: Thread ID → (행 번호, 상태). 실행당 한 번만 A/P열을 읽음
+        self._history_index: Optional[Dict[str, Tuple[int, str]]] = None
+        self._history_next_row = 2
+        # 셀/범위 쓰기는 모아서 스프레드시트별 values.batchUpdate 한 번으로 기록
+        # 일괄 메서드(add_email_rows, sync_senders 등) 사용 후에는 flush() (또는 with 블록)를 호출해야 기록됨
+        # 단건 메서드(add_email_row, add_to_history 등)는 바로 기록
+        self.write_buffer = SheetsWriteBuffer(self.service)
 
     def _get_credentials(self) -> Credentials:
         """Get or create OAuth credentials with Sheets scope."""
@@ -125,6 +184,7 @@ class SheetsClient:
         )
 
         spreadsheet_id = spreadsheet.get("spreadsheetId")
+        self._schema_cache[spreadsheet_id] = {"Emails": 0, "발신자 관리": 1}
 
         # Initialize headers (v0.5.2 schema)
         headers = [
@@ -424,6 +484,9 @@ class SheetsClient:
         # Initialize 발신자 관리 tab
         self._initialize_sender_management_tab(spreadsheet_id)
 
+        # 새 시트는 헤더만 있으므로 빈 행을 읽을 필요 없음
+        self._row_cursors[(spreadsheet_id, "Emails")] = 2
+
         return spreadsheet_id
 
     def add_email_row(
@@ -438,6 +501,8 @@ class SheetsClient:
         """
         Add email to spreadsheet (v0.5.2 schema).
 
+        The row is written right away; use add_email_rows() to buffer many rows.
+
         Args:
             spreadsheet_id: Target spreadsheet ID
             email_data: Email metadata (subject, sender, body, cc, labels, etc.)
@@ -446,6 +511,81 @@ class SheetsClient:
             draft_body: Draft reply body content
             ai_summary: AI-generated summary of the email (5 lines max)
         """
+        self.add_email_rows(spreadsheet_id, [{
+            "email_data": email_data,
+            "draft_id": draft_id,
+            "draft_subject": draft_subject,
+            "draft_body": draft_body,
+            "ai_summary": ai_summary,
+        }])
+        self._flush_spreadsheet(spreadsheet_id)
+
+    def add_email_rows(self, spreadsheet_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Add many emails to the Emails tab with a single buffered write (v0.5.2 schema).
+
+        The next empty row is read once per spreadsheet (column A) and then
+        tracked in memory, so later calls don't re-read the tab. Rows are
+        written on the next flush().
+
+        Args:
+            spreadsheet_id: Target spreadsheet ID
+            rows: Dicts with 'email_data' and optional 'draft_id', 'draft_subject',
+                  'draft_body', 'ai_summary' (same meaning as add_email_row)
+
+        Example:
+            sheets.add_email_rows(spreadsheet_id, [
+                {'email_data': email_data, 'draft_id': 'r123...', 'draft_subject': 'Re: ...', 'draft_body': '...'},
+            ])
+        """
+        if not rows:
+            return
+
+        values = [
+            self._email_row(
+                row["email_data"],
+                draft_id=row.get("draft_id", ""),
+                draft_subject=row.get("draft_subject", ""),
+                draft_body=row.get("draft_body", ""),
+                ai_summary=row.get("ai_summary", ""),
+            )
+            for row in rows
+        ]
+
+        # Explicit rows instead of append to avoid empty row issues
+        self._put_rows(spreadsheet_id, "Emails", "O", values)
+
+    def _next_row(self, spreadsheet_id: str, tab: str) -> int:
+        """Get the next empty row of a tab (reads column A only the first time)."""
+        key = (spreadsheet_id, tab)
+        if key not in self._row_cursors:
+            # Find next empty row (after row 1 header)
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=f"{tab}!A:A",
+            ).execute()
+            existing_rows = len(result.get("values", []))
+            self._row_cursors[key] = max(2, existing_rows + 1)  # At least row 2
+
+        return self._row_cursors[key]
+
+    def _put_rows(self, spreadsheet_id: str, tab: str, last_col: str, values: List[List[Any]]) -> None:
+        """Buffer rows at the tab's next empty row and advance its row cursor."""
+        next_row = self._next_row(spreadsheet_id, tab)
+        last_row = next_row + len(values) - 1
+
+        self._put(spreadsheet_id, f"{tab}!A{next_row}:{last_col}{last_row}", values)
+        self._row_cursors[(spreadsheet_id, tab)] = last_row + 1
+
+    def _email_row(
+        self,
+        email_data: Dict[str, Any],
+        draft_id: str = "",
+        draft_subject: str = "",
+        draft_body: str = "",
+        ai_summary: str = "",
+    ) -> List[Any]:
+        """Build one Emails tab row (columns A-O)."""
         # 상태 매핑
         status_map = {
             "needs_response": "답장필요",
@@ -467,7 +607,7 @@ class SheetsClient:
         # 전송예정 체크박스: 초안이 있으면 기본 TRUE
         send_checkbox = True if (draft_id and draft_body) else False
 
-        row = [
+        return [
             status,                                          # A: 상태
             email_data.get("priority", 3),                   # B: 우선순위
             labels_str,                                      # C: 라벨
@@ -485,23 +625,9 @@ class SheetsClient:
             email_data.get("thread_id", ""),                 # O: Hidden
         ]
 
-        # Find next empty row (after row 1 header)
-        result = self.service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range="Emails!A:A",
-        ).execute()
-        existing_rows = len(result.get("values", []))
-        next_row = max(2, existing_rows + 1)  # At least row 2
-
-        # Use update instead of append to avoid empty row issues
-        self.service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=f"Emails!A{next_row}:O{next_row}",
-            valueInputOption="USER_ENTERED",
-            body={"values": [row]},
-        ).execute()
-
-    def get_drafts_to_send(self, spreadsheet_id: str) -> List[Dict[str, Any]]:
+    def get_drafts_to_send(
+        self, spreadsheet_id: str, include_body: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Get draft IDs for emails marked for sending (v0.5.2 schema).
 
@@ -509,8 +635,14 @@ class SheetsClient:
         - Column M (전송예정) is checked (TRUE)
         - Column N (Draft ID) is not empty
 
+        Only columns E, J, L, M and N are read (one column-major
+        values.batchGet). Draft bodies (column K) are fetched afterwards for
+        the selected rows only, in a second batchGet.
+
         Args:
             spreadsheet_id: Spreadsheet ID
+            include_body: If False, skip the column K read ('draft_body' is '');
+                          drafts.send only needs the draft ID
 
         Returns:
             List of dicts with draft_id, draft_subject, draft_body, sender, cc, row_number
@@ -527,37 +659,92 @@ class SheetsClient:
                 }
             ]
         """
-        result = (
-            self.service.spreadsheets()
-            .values()
-            .get(spreadsheetId=spreadsheet_id, range="Emails!A2:O")
-            .execute()
+        self._flush_spreadsheet(spreadsheet_id)  # 버퍼에 남은 쓰기부터 반영
+
+        # 필요한 열만 읽음 (K열 초안 본문 제외)
+        senders, subjects, send_ccs, checkboxes, draft_ids = self._get_columns(
+            spreadsheet_id,
+            ["Emails!E2:E", "Emails!J2:J", "Emails!L2:L", "Emails!M2:M", "Emails!N2:N"],
         )
 
-        rows = result.get("values", [])
-        drafts_to_send = []
+        def cell(column: List[Any], index: int) -> Any:
+            return column[index] if index < len(column) else ""
 
-        for i, row in enumerate(rows, start=2):  # Row 2 = first data row
-            # Ensure row has enough columns
-            if len(row) < 14:
-                continue
+        drafts_to_send = []
 
-            send_checkbox = row[12] if len(row) > 12 else ""  # Column M (전송예정)
-            draft_id = row[13] if len(row) > 13 else ""       # Column N (Draft ID)
+        for index, draft_id in enumerate(draft_ids):
+            send_checkbox = cell(checkboxes, index)  # Column M (전송예정)
 
             # Check if marked for sending
             if send_checkbox in ["TRUE", "True", True, "true"] and draft_id:
                 drafts_to_send.append({
                     "draft_id": draft_id,
-                    "draft_subject": row[9] if len(row) > 9 else "",   # Column J
-                    "draft_body": row[10] if len(row) > 10 else "",    # Column K
-                    "sender": row[4] if len(row) > 4 else "",          # Column E
-                    "send_cc": row[11] if len(row) > 11 else "",       # Column L
-                    "row_number": i,
+                    "draft_subject": cell(subjects, index),   # Column J
+                    "draft_body": "",                         # Column K (below)
+                    "sender": cell(senders, index),           # Column E
+                    "send_cc": cell(send_ccs, index),         # Column L
+                    "row_number": index + 2,                  # Row 2 = first data row
                 })
 
+        if include_body and drafts_to_send:
+            bodies = self._get_cells_by_row(
+                spreadsheet_id, "Emails", "K", [d["row_number"] for d in drafts_to_send]
+            )
+            for draft in drafts_to_send:
+                draft["draft_body"] = bodies.get(draft["row_number"], "")
+
         return drafts_to_send
 
+    def _get_columns(self, spreadsheet_id: str, ranges: List[str]) -> List[List[Any]]:
+        """
+        Read single-column ranges in one column-major values.batchGet.
+
+        Values are unformatted (checkboxes as booleans, numbers as numbers).
+
+        Returns:
+            One list of cell values per range (trailing empty cells omitted)
+        """
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            majorDimension="COLUMNS",
+            valueRenderOption="UNFORMATTED_VALUE",
+        ).execute()
+
+        value_ranges = result.get("valueRanges", [])
+        columns = []
+        for i in range(len(ranges)):
+            values = value_ranges[i].get("values", []) if i < len(value_ranges) else []
+            columns.append(values[0] if values else [])
+        return columns
+
+    def _get_cells_by_row(
+        self, spreadsheet_id: str, tab: str, column: str, row_numbers: List[int]
+    ) -> Dict[int, Any]:
+        """
+        Read one column for the given rows only (consecutive rows share a range).
+
+        Returns:
+            Dict mapping row number to cell value
+        """
+        # 연속된 행은 하나의 범위로 묶음
+        spans: List[List[int]] = []
+        for row_number in sorted(set(row_numbers)):
+            if spans and spans[-1][1] == row_number - 1:
+                spans[-1][1] = row_number
+            else:
+                spans.append([row_number, row_number])
+
+        columns = self._get_columns(
+            spreadsheet_id, [f"{tab}!{column}{start}:{column}{end}" for start, end in spans]
+        )
+
+        cells = {}
+        for (start, _), values in zip(spans, columns):
+            for offset, value in enumerate(values):
+                cells[start + offset] = value
+        return cells
+
     # Keep old function for backward compatibility
     def get_emails_to_send(self, spreadsheet_id: str) -> List[Dict[str, Any]]:
         """
@@ -584,28 +771,40 @@ class SheetsClient:
         """
         Update email status after sending (v0.5.2 schema).
 
+        Both cells are written in one values.batchUpdate. To update many
+        rows, use update_email_statuses() (buffered).
+
         Args:
             spreadsheet_id: Spreadsheet ID
             row_number: Row number to update (2 = first data row)
             new_status: New status (e.g., '답장완료')
             uncheck_send_box: If True, uncheck '전송예정' checkbox (column M)
         """
-        # Update status (column A)
-        self.service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=f"Emails!A{row_number}",
-            valueInputOption="RAW",
-            body={"values": [[new_status]]},
-        ).execute()
+        self.update_email_statuses(spreadsheet_id, [row_number], new_status, uncheck_send_box)
+        self._flush_spreadsheet(spreadsheet_id)
 
-        # Uncheck send box (column M - 전송예정)
-        if uncheck_send_box:
-            self.service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=f"Emails!M{row_number}",
-                valueInputOption="RAW",
-                body={"values": [[False]]},
-            ).execute()
+    def update_email_statuses(
+        self,
+        spreadsheet_id: str,
+        row_numbers: List[int],
+        new_status: str = "답장완료",
+        uncheck_send_box: bool = True
+    ) -> None:
+        """
+        Update status of many rows after sending (buffered, see flush()).
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            row_numbers: Row numbers to update (2 = first data row)
+            new_status: New status (e.g., '답장완료')
+            uncheck_send_box: If True, uncheck '전송예정' checkbox (column M)
+        """
+        for row_number in row_numbers:
+            # Status (column A)
+            self._put(spreadsheet_id, f"Emails!A{row_number}", [[new_status]])
+            # Uncheck send box (column M - 전송예정)
+            if uncheck_send_box:
+                self._put(spreadsheet_id, f"Emails!M{row_number}", [[False]])
 
     def batch_update_emails(
         self, spreadsheet_id: str, emails: List[Dict[str, Any]]
@@ -657,15 +856,7 @@ class SheetsClient:
         Internal helper called by create_email_tracker().
         """
         # Get sheet ID for 발신자 관리 tab
-        spreadsheet = self.service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id
-        ).execute()
-
-        sender_sheet_id = None
-        for sheet in spreadsheet['sheets']:
-            if sheet['properties']['title'] == '발신자 관리':
-                sender_sheet_id = sheet['properties']['sheetId']
-                break
+        sender_sheet_id = self._get_schema(spreadsheet_id).get('발신자 관리')
 
         if sender_sheet_id is None:
             return  # Tab doesn't exist, skip
@@ -811,6 +1002,9 @@ class SheetsClient:
         """
         Add or update a sender in the 발신자 관리 tab.
 
+        The row is written right away. For many senders use sync_senders(),
+        which reads the tab only once and buffers its writes.
+
         Args:
             spreadsheet_id: Spreadsheet ID
             sender_email: Sender email address
@@ -820,27 +1014,86 @@ class SheetsClient:
                 - total_received: Received count
                 - p45_count: Count of P4-5 emails
                 - total_emails: Total emails from sender
-                - recent_7days: Recent activity count
+                - recent_7days: Recent activity (time-decayed message count)
                 - last_contact_date: Last contact date string
         """
-        # Calculate auto score
-        auto_score = self._calculate_sender_auto_score(sender_stats)
+        self.sync_senders(spreadsheet_id, {sender_email: sender_stats})
+        self._flush_spreadsheet(spreadsheet_id)
 
-        # Check if sender already exists
+    def sync_senders(
+        self,
+        spreadsheet_id: str,
+        all_sender_stats: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        Merge sender stats into the 발신자 관리 tab with one read.
+
+        The tab is read once into an address → row index. Existing senders
+        keep their manual grade (D) and memo (L); only rows whose values
+        actually change are rewritten, and new senders are added below the
+        last row. Both go through the write buffer (see flush()).
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            all_sender_stats: Dict mapping sender email to stats
+                              (same keys as add_or_update_sender)
+
+        Returns:
+            Dict with counts: {'updated': 3, 'added': 2, 'unchanged': 40}
+
+        Example:
+            stats = gmail.collect_all_sender_stats(classified_emails=emails)
+            result = sheets.sync_senders(spreadsheet_id, stats)
+        """
+        # Snapshot of the tab (one read, after pending writes are flushed)
+        self._flush_spreadsheet(spreadsheet_id)
         result = self.service.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
             range="발신자 관리!A2:L",
         ).execute()
+        snapshot = result.get("values", [])
+
+        # 주소는 대소문자 구분 없이 매칭 (message_store 키는 소문자)
+        index: Dict[str, Tuple[int, List[Any]]] = {}
+        for i, row in enumerate(snapshot, start=2):
+            address = str(row[0]).strip().lower() if row and row[0] else ""
+            if address and address not in index:
+                index[address] = (i, row)
+
+        updated = 0
+        new_rows = []
+        unchanged = 0
+
+        for sender_email, sender_stats in all_sender_stats.items():
+            row_index, sender_row = index.get(sender_email.strip().lower(), (None, None))
+            # 기존 행은 시트에 입력된 주소 표기를 유지
+            new_row = self._sender_row(sender_row[0] if sender_row else sender_email, sender_stats, sender_row)
+
+            if row_index is None:
+                new_rows.append(new_row)
+            elif [_cell_str(v) for v in new_row] != [_cell_str(v) for v in (sender_row + [""] * 12)[:12]]:
+                # Changed rows only
+                self._put(spreadsheet_id, f"발신자 관리!A{row_index}:L{row_index}", [new_row])
+                updated += 1
+            else:
+                unchanged += 1
 
-        rows = result.get("values", [])
-        sender_row = None
-        row_index = None
+        if new_rows:
+            # New senders below the last row of the snapshot
+            self._row_cursors[(spreadsheet_id, "발신자 관리")] = len(snapshot) + 2
+            self._put_rows(spreadsheet_id, "발신자 관리", "L", new_rows)
 
-        for i, row in enumerate(rows, start=2):
-            if row and row[0] == sender_email:
-                sender_row = row
-                row_index = i
-                break
+        return {"updated": updated, "added": len(new_rows), "unchanged": unchanged}
+
+    def _sender_row(
+        self,
+        sender_email: str,
+        sender_stats: Dict[str, Any],
+        sender_row: Optional[List[Any]] = None,
+    ) -> List[Any]:
+        """Build one 발신자 관리 row (A-L), keeping manual grade (D) and memo (L) of an existing row."""
+        # Calculate auto score
+        auto_score = self._calculate_sender_auto_score(sender_stats)
 
         # Prepare row data
         name = sender_stats.get("name", "")
@@ -854,7 +1107,7 @@ class SheetsClient:
 
         memo = sender_row[11] if (sender_row and len(sender_row) > 11) else ""
 
-        new_row = [
+        return [
             sender_email,                             # A
             name,                                      # B
             auto_score,                                # C
@@ -869,23 +1122,6 @@ class SheetsClient:
             memo,                                      # L
         ]
 
-        if row_index:
-            # Update existing row
-            self.service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=f"발신자 관리!A{row_index}:L{row_index}",
-                valueInputOption="USER_ENTERED",
-                body={"values": [new_row]},
-            ).execute()
-        else:
-            # Append new row
-            self.service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range="발신자 관리!A:L",
-                valueInputOption="USER_ENTERED",
-                body={"values": [new_row]},
-            ).execute()
-
     def _calculate_sender_auto_score(self, stats: Dict[str, Any]) -> int:
         """
         Calculate automatic sender importance score (0-100).
@@ -894,7 +1130,10 @@ class SheetsClient:
         - High priority ratio (40%): % of P4-5 emails
         - Interaction frequency (30%): weighted_exchanges = (sent × 2) + received
         - Sent weight (20%): ratio of sent vs received
-        - Recency (10%): last 7 days activity
+        - Recency (10%): decayed activity (τ = 7 days, ≈ messages in the last 7 days)
+
+        Stats come from the message store's per-sender aggregates
+        (GmailClient.collect_all_sender_stats), so scoring never rescans mail.
 
         Args:
             stats: Sender statistics
@@ -978,6 +1217,8 @@ class SheetsClient:
         """
         Get sender importance scores from 발신자 관리 tab.
 
+        Only the email (A) and final score (E) columns are read.
+
         Returns:
             Dict mapping sender email to final score (0-100)
 
@@ -988,27 +1229,61 @@ class SheetsClient:
                 'spam@example.com': 0,
             }
         """
-        result = self.service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range="발신자 관리!A2:E",
-        ).execute()
+        self._flush_spreadsheet(spreadsheet_id)
 
-        rows = result.get("values", [])
-        scores = {}
+        emails, final_scores = self._get_columns(
+            spreadsheet_id, ["발신자 관리!A2:A", "발신자 관리!E2:E"]
+        )
+        # 뒤쪽 빈 셀은 응답에서 빠지므로 이메일 수만큼 채움 (빈 점수 → 0)
+        final_scores = final_scores + [""] * (len(emails) - len(final_scores))
 
-        for row in rows:
-            if len(row) >= 5:
-                sender_email = row[0]
-                final_score = row[4]
+        scores = {}
 
-                # Convert to int
-                try:
-                    scores[sender_email] = int(final_score)
-                except (ValueError, TypeError):
-                    scores[sender_email] = 0
+        for sender_email, final_score in zip(emails, final_scores):
+            # Convert to int
+            try:
+                scores[sender_email] = int(final_score)
+            except (ValueError, TypeError):
+                scores[sender_email] = 0
 
         return scores
 
+    def get_blocked_senders(self, spreadsheet_id: str) -> List[str]:
+        """
+        Get senders manually graded 차단 in the 발신자 관리 tab.
+
+        Only the manual grade (D) counts: a blank or non-numeric final score
+        (E) is not a block. Only columns A and D are read.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+
+        Returns:
+            Sender addresses (lowercased); empty if the tab doesn't exist
+
+        Example:
+            blocked = sheets.get_blocked_senders(spreadsheet_id)
+            emails = gmail.get_recent_emails(blocked_senders=blocked)
+        """
+        self._flush_spreadsheet(spreadsheet_id)
+
+        try:
+            emails, grades = self._get_columns(
+                spreadsheet_id, ["발신자 관리!A2:A", "발신자 관리!D2:D"]
+            )
+        except HttpError as e:
+            if self._is_missing_tab_error(e):
+                return []  # 발신자 관리 탭이 없는 시트
+            raise
+        # 뒤쪽 빈 셀은 응답에서 빠지므로 이메일 수만큼 채움
+        grades = grades + [""] * (len(emails) - len(grades))
+
+        return [
+            str(sender_email).strip().lower()
+            for sender_email, grade in zip(emails, grades)
+            if sender_email and str(grade).strip() == "차단"
+        ]
+
     # ===== 이메일 이력 관리 (누적 시트) =====
 
     # 고정된 이력 스프레드시트 ID (최초 생성 후 재사용)
@@ -1019,29 +1294,46 @@ class SheetsClient:
         Get existing history spreadsheet or create new one.
 
         Returns:
-            History spreadsheet ID
+            History spreadsheet ID (resolved once per process)
         """
-        import os
         import json
 
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'email_history_config.json')
-
-        # 기존 설정 파일에서 ID 로드
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                if config.get('history_spreadsheet_id'):
-                    return config['history_spreadsheet_id']
+        spreadsheet_id = self._load_history_spreadsheet_id()
+        if spreadsheet_id:
+            return spreadsheet_id
 
         # 새로 생성
         spreadsheet_id = self._create_history_spreadsheet()
 
         # 설정 파일에 저장
-        with open(config_path, 'w') as f:
+        with open(HISTORY_CONFIG_PATH, 'w') as f:
             json.dump({'history_spreadsheet_id': spreadsheet_id}, f)
 
+        SheetsClient.HISTORY_SPREADSHEET_ID = spreadsheet_id
         return spreadsheet_id
 
+    def _load_history_spreadsheet_id(self) -> Optional[str]:
+        """
+        Get the history spreadsheet ID, reading email_history_config.json once per process.
+
+        Returns:
+            Spreadsheet ID, or None if the history sheet hasn't been created yet
+        """
+        import os
+        import json
+
+        if SheetsClient.HISTORY_SPREADSHEET_ID:
+            return SheetsClient.HISTORY_SPREADSHEET_ID
+
+        # 기존 설정 파일에서 ID 로드
+        if os.path.exists(HISTORY_CONFIG_PATH):
+            with open(HISTORY_CONFIG_PATH, 'r') as f:
+                config = json.load(f)
+                if config.get('history_spreadsheet_id'):
+                    SheetsClient.HISTORY_SPREADSHEET_ID = config['history_spreadsheet_id']
+
+        return SheetsClient.HISTORY_SPREADSHEET_ID
+
     def _create_history_spreadsheet(self) -> str:
         """
         Create a new history spreadsheet for cumulative email tracking.
@@ -1078,39 +1370,19 @@ class SheetsClient:
 
         spreadsheet_id = spreadsheet.get("spreadsheetId")
 
-        # Email Tracker 형식 헤더 (16열 - 답장여부 추가)
-        headers = [
-            "상태",              # A: 답장필요/불필요/완료
-            "우선순위",          # B: 1-5
-            "라벨",              # C: Gmail labels
-            "제목",              # D: 이메일 제목
-            "발신자",            # E: 발신자
-            "받은CC",            # F: CC 수신자
-            "받은시간",          # G: Gmail Date 헤더
-            "내용미리보기",      # H: 본문 미리보기 (300자)
-            "AI요약",            # I: AI 요약
-            "초안(제목)",        # J: 답장 초안 제목
-            "초안(내용)",        # K: 답장 초안 내용
-            "보낼CC",            # L: 발송 시 CC
-            "전송예정",          # M: 체크박스
-            "답장여부",          # N: 답장함/미답장
-            "Draft ID",         # O: Gmail Draft ID
-            "Thread ID",        # P: Gmail Thread ID
-        ]
-
         # 두 탭 모두에 헤더 설정
         self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range="신규 메일!A1:P1",
             valueInputOption="RAW",
-            body={"values": [headers]},
+            body={"values": [TRACKER_HEADERS]},
         ).execute()
 
         self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range="처리 이력!A1:P1",
             valueInputOption="RAW",
-            body={"values": [headers]},
+            body={"values": [TRACKER_HEADERS]},
         ).execute()
 
         # 헤더 포맷팅 및 조건부 서식 (두 탭 모두)
@@ -1122,6 +1394,7 @@ class SheetsClient:
             spreadsheetId=spreadsheet_id, body={"requests": requests}
         ).execute()
 
+        self._schema_cache[spreadsheet_id] = {"신규 메일": 0, "처리 이력": 1}
         return spreadsheet_id
 
     def _get_history_tab_format_requests(self, sheet_id: int) -> List[dict]:
@@ -1194,21 +1467,78 @@ class SheetsClient:
         self,
         email_data: dict,
         classification: dict,
-        replied: bool,
+        replied: Optional[bool] = None,
+        flush: bool = True,
     ) -> str:
         """
         Add or update processed email in history sheet (Email Tracker 15-column format).
 
+        Rows are looked up in the in-memory Thread ID index (see
+        _load_history_index), so the sheet itself is not re-read per email.
+
         Args:
             email_data: Email data dict with id, subject, sender, date, cc, body, thread_id, labels
             classification: Classification result with priority, summary, draft_subject, draft_body, etc.
-            replied: Whether user has replied
+            replied: Whether user has replied (default: email_data['replied'] from
+                     GmailClient's sent-thread index)
+            flush: If True (default), write the history spreadsheet's buffered rows
+                   now; pass False in loops and call flush_history() once at the end
 
         Returns:
             'added' if new, 'updated' if existing was updated, 'unchanged' if same
         """
         history_id = self.get_or_create_history_sheet()
-        thread_id = email_data.get('thread_id', '')
+        status, row = self._tracker_row(email_data, classification, replied)
+
+        result = self._queue_history_row(history_id, email_data.get('thread_id', ''), status, row)
+
+        if flush:
+            self.flush_history()
+        return result
+
+    def _queue_history_row(self, history_id: str, thread_id: str, status: str, row: List[Any]) -> str:
+        """
+        Buffer a 처리 이력 row and update the Thread ID index in place.
+
+        Returns:
+            'added', 'updated' or 'unchanged' (same status → nothing queued)
+        """
+        # 기존 행 찾기 (Thread ID 인덱스)
+        existing_row = self._find_history_row(history_id, thread_id)
+
+        if existing_row:
+            # 기존 데이터와 비교
+            if existing_row['status'] == status:
+                return 'unchanged'
+            row_number = existing_row['row_number']
+            result = 'updated'
+        else:
+            # 신규 추가 (인덱스가 다음 빈 행을 알고 있음)
+            row_number = self._history_next_row
+            self._history_next_row += 1
+            result = 'added'
+
+        if thread_id:
+            self._history_index[thread_id] = (row_number, status)
+        self._put(history_id, f"처리 이력!A{row_number}:P{row_number}", [row])
+        return result
+
+    def _tracker_row(
+        self, email_data: dict, classification: dict, replied: Optional[bool] = None
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build one row for the 신규 메일 / 처리 이력 tabs (Email Tracker 16-column format).
+
+        Args:
+            email_data: Email data dict
+            classification: Classification result
+            replied: Whether user has replied (default: email_data['replied'])
+
+        Returns:
+            (status, row)
+        """
+        if replied is None:
+            replied = bool(email_data.get('replied'))
 
         # 상태 결정
         if replied:
@@ -1247,87 +1577,83 @@ class SheetsClient:
             False,                                          # M: 전송예정
             reply_status,                                   # N: 답장여부
             '',                                             # O: Draft ID
-            thread_id,                                      # P: Thread ID
+            email_data.get('thread_id', ''),                # P: Thread ID
         ]
 
-        # 기존 행 찾기 (Thread ID로 검색)
-        existing_row = self._find_history_row(history_id, thread_id)
+        return status, row
 
-        if existing_row:
-            # 기존 데이터와 비교
-            old_status = existing_row.get('status', '')
+    def flush_history(self) -> int:
+        """
+        Write all buffered rows of the history spreadsheet in one values.batchUpdate.
 
-            if old_status == status:
-                return 'unchanged'
+        Returns:
+            Number of ranges written
+        """
+        if not SheetsClient.HISTORY_SPREADSHEET_ID:
+            return 0  # 아직 이력 시트를 쓰지 않음
 
-            # 업데이트
-            self.service.spreadsheets().values().update(
-                spreadsheetId=history_id,
-                range=f"처리 이력!A{existing_row['row_number']}:P{existing_row['row_number']}",
-                valueInputOption="USER_ENTERED",
-                body={"values": [row]},
-            ).execute()
-            return 'updated'
-        else:
-            # 신규 추가
-            self.service.spreadsheets().values().append(
-                spreadsheetId=history_id,
-                range="처리 이력!A:P",
-                valueInputOption="USER_ENTERED",
-                insertDataOption="INSERT_ROWS",
-                body={"values": [row]},
-            ).execute()
-            return 'added'
+        return self._flush_spreadsheet(SheetsClient.HISTORY_SPREADSHEET_ID)
 
     def _find_history_row(self, history_id: str, thread_id: str) -> Optional[Dict[str, Any]]:
         """
         Find existing row in history by Thread ID (column P, index 15).
 
         Returns:
-            Dict with row data and row_number, or None if not found
+            Dict with row_number and status, or None if not found
         """
-        if not thread_id:
+        index = self._load_history_index(history_id)
+        if not thread_id or thread_id not in index:
             return None
 
-        result = self.service.spreadsheets().values().get(
+        row_number, status = index[thread_id]
+        return {'row_number': row_number, 'status': status}
+
+    def _load_history_index(self, history_id: str) -> Dict[str, Tuple[int, str]]:
+        """
+        Load the Thread ID → (row number, status) index of 처리 이력 (once per client).
+
+        Only the status (A) and Thread ID (P) columns are downloaded, in one
+        values.batchGet. The index is kept current as rows are queued.
+        """
+        if self._history_index is not None:
+            return self._history_index
+
+        result = self.service.spreadsheets().values().batchGet(
             spreadsheetId=history_id,
-            range="처리 이력!A:P",
+            ranges=["처리 이력!A2:A", "처리 이력!P2:P"],
         ).execute()
+        status_rows, thread_rows = (
+            vr.get("values", []) for vr in result.get("valueRanges", [{}, {}])
+        )
 
-        rows = result.get("values", [])
-
-        for i, row in enumerate(rows[1:], start=2):  # Skip header, row 2 = first data
-            if len(row) >= 16 and row[15] == thread_id:  # Column P = Thread ID (index 15)
-                return {
-                    'row_number': i,
-                    'status': row[0] if len(row) > 0 else '',
-                }
+        index: Dict[str, Tuple[int, str]] = {}
+        for i, row in enumerate(thread_rows, start=2):  # row 2 = first data
+            if row and row[0] and row[0] not in index:
+                status = status_rows[i - 2][0] if i - 2 < len(status_rows) and status_rows[i - 2] else ''
+                index[row[0]] = (i, status)
 
-        return None
+        self._history_index = index
+        self._history_next_row = 2 + max(len(status_rows), len(thread_rows))
+        return index
 
-    def _check_history_exists(self, history_id: str, message_id: str) -> bool:
+    def _check_history_exists(self, history_id: str, thread_id: str) -> bool:
         """
-        Check if message already exists in history.
+        Check if a thread already exists in history.
+
+        The history sheet is keyed by Thread ID (column P); it has no message
+        ID column (this used to read column K, the draft body).
 
         Args:
             history_id: History spreadsheet ID
-            message_id: Gmail message ID to check
+            thread_id: Gmail thread ID to check
 
         Returns:
             True if exists, False otherwise
         """
-        if not message_id:
+        if not thread_id:
             return False
 
-        result = self.service.spreadsheets().values().get(
-            spreadsheetId=history_id,
-            range="처리 이력!K:K",  # Message ID 컬럼
-        ).execute()
-
-        rows = result.get("values", [])
-        existing_ids = [row[0] for row in rows if row]
-
-        return message_id in existing_ids
+        return thread_id in self._load_history_index(history_id)
 
     def get_history_spreadsheet_url(self) -> str:
         """
@@ -1336,17 +1662,9 @@ class SheetsClient:
         Returns:
             Spreadsheet URL or empty string if not created yet
         """
-        import os
-        import json
-
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'email_history_config.json')
-
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                sheet_id = config.get('history_spreadsheet_id', '')
-                if sheet_id:
-                    return f"https://docs.google.com/spreadsheets/d/{sheet_id}"
+        sheet_id = self._load_history_spreadsheet_id()
+        if sheet_id:
+            return f"https://docs.google.com/spreadsheets/d/{sheet_id}"
 
         return ""
 
@@ -1361,14 +1679,115 @@ class SheetsClient:
             Dict mapping tab name to sheet ID
             e.g., {'신규 메일': 123456, '처리 이력': 0}
         """
-        spreadsheet = self.service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id
-        ).execute()
+        return dict(self._get_schema(spreadsheet_id))
 
-        return {
-            sheet['properties']['title']: sheet['properties']['sheetId']
-            for sheet in spreadsheet['sheets']
-        }
+    # ===== 스키마 캐시 (탭 이름 → sheetId) =====
+
+    def _get_schema(self, spreadsheet_id: str) -> Dict[str, int]:
+        """
+        Get tab title → sheetId for a spreadsheet (one narrow spreadsheets.get per process).
+
+        Only sheet properties are requested (SCHEMA_FIELDS), not cell data or formats.
+        """
+        if spreadsheet_id not in self._schema_cache:
+            spreadsheet = self.service.spreadsheets().get(
+                spreadsheetId=spreadsheet_id, fields=SCHEMA_FIELDS
+            ).execute()
+            self._schema_cache[spreadsheet_id] = {
+                sheet['properties']['title']: sheet['properties']['sheetId']
+                for sheet in spreadsheet.get('sheets', [])
+            }
+        return self._schema_cache[spreadsheet_id]
+
+    def _invalidate_schema(self, spreadsheet_id: str) -> None:
+        """Drop cached tab layout (and row positions) of a spreadsheet."""
+        self._schema_cache.pop(spreadsheet_id, None)
+        for key in [k for k in self._row_cursors if k[0] == spreadsheet_id]:
+            del self._row_cursors[key]
+
+    def _is_missing_tab_error(self, error: BaseException) -> bool:
+        """Check if a Sheets error means the range's tab doesn't exist."""
+        if not isinstance(error, HttpError) or error.resp.status != 400:
+            return False
+        content = error.content.decode("utf-8", errors="replace") if error.content else ""
+        return "Unable to parse range" in content
+
+    def _write_new_emails_tab(self, spreadsheet_id: str, write: Any) -> Any:
+        """
+        Run a write to the '신규 메일' tab, recreating the tab once if it was deleted.
+
+        The cached schema may say the tab exists after a user deleted it; the
+        failed write invalidates the cache and the tab is ensured again.
+        """
+        self.ensure_new_emails_tab_exists(spreadsheet_id)
+        try:
+            return write()
+        except HttpError as e:
+            if not self._is_missing_tab_error(e):
+                raise
+            self._invalidate_schema(spreadsheet_id)
+            self.ensure_new_emails_tab_exists(spreadsheet_id)
+            return write()
+
+    # ===== 쓰기 버퍼 (write-behind) =====
+
+    def flush(self) -> int:
+        """
+        Write all buffered cell/range updates, one values.batchUpdate per spreadsheet.
+
+        The bulk mutators (add_email_rows, update_email_statuses,
+        sync_senders, add_to_history(flush=False)) only buffer their writes;
+        single-item mutators (add_email_row, update_email_status,
+        add_or_update_sender, add_to_new_emails, add_email_to_both_tabs)
+        write through. The buffer is flushed when a write finds too many
+        pending ranges or an old pending write (see SheetsWriteBuffer),
+        before this client reads a spreadsheet back, and on exiting a `with`
+        block. There is no background timer or exit hook: after bulk writes,
+        call flush() at the end of a run.
+
+        Returns:
+            Number of ranges written
+
+        Example:
+            with SheetsClient() as sheets:
+                sheets.update_email_statuses(spreadsheet_id, sent_rows)
+                sheets.sync_senders(spreadsheet_id, all_sender_stats)
+            # statuses and sender rows written in one request
+        """
+        return sum(
+            self._flush_spreadsheet(spreadsheet_id)
+            for spreadsheet_id in self.write_buffer.spreadsheet_ids()
+        )
+
+    def __enter__(self) -> "SheetsClient":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.flush()
+
+    def _put(self, spreadsheet_id: str, range_: str, values: List[List[Any]]) -> None:
+        """Buffer a range write; flush the spreadsheet if the buffer says it's due."""
+        if self.write_buffer.put(spreadsheet_id, range_, values):
+            self._flush_spreadsheet(spreadsheet_id)
+
+    def _flush_spreadsheet(self, spreadsheet_id: str) -> int:
+        """
+        Flush one spreadsheet's buffered writes.
+
+        If the '신규 메일' tab was deleted meanwhile, it is recreated and the
+        flush is retried once (same as _write_new_emails_tab).
+        """
+        try:
+            return self.write_buffer.flush(spreadsheet_id)
+        except HttpError as e:
+            if not (
+                self._is_missing_tab_error(e)
+                and self.write_buffer.has_pending(spreadsheet_id, "신규 메일!")
+            ):
+                raise
+            self._invalidate_schema(spreadsheet_id)
+            self.ensure_new_emails_tab_exists(spreadsheet_id)
+            return self.write_buffer.flush(spreadsheet_id)
 
     def ensure_new_emails_tab_exists(self, spreadsheet_id: str) -> int:
         """
@@ -1380,14 +1799,10 @@ class SheetsClient:
         Returns:
             Sheet ID of '신규 메일' tab
         """
-        # Check if tab exists
-        spreadsheet = self.service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id
-        ).execute()
-
-        for sheet in spreadsheet['sheets']:
-            if sheet['properties']['title'] == '신규 메일':
-                return sheet['properties']['sheetId']
+        # Check if tab exists (schema cache)
+        schema = self._get_schema(spreadsheet_id)
+        if '신규 메일' in schema:
+            return schema['신규 메일']
 
         # Create new tab
         requests = [{
@@ -1406,19 +1821,13 @@ class SheetsClient:
         ).execute()
 
         new_sheet_id = result['replies'][0]['addSheet']['properties']['sheetId']
-
-        # Email Tracker 형식 헤더 (16열 - 답장여부 포함)
-        headers = [
-            "상태", "우선순위", "라벨", "제목", "발신자", "받은CC", "받은시간",
-            "내용미리보기", "AI요약", "초안(제목)", "초안(내용)", "보낼CC",
-            "전송예정", "답장여부", "Draft ID", "Thread ID"
-        ]
+        schema['신규 메일'] = new_sheet_id
 
         self.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range="신규 메일!A1:P1",
             valueInputOption="RAW",
-            body={"values": [headers]},
+            body={"values": [TRACKER_HEADERS]},
         ).execute()
 
         # Format header and conditional formatting
@@ -1438,83 +1847,49 @@ class SheetsClient:
         Args:
             spreadsheet_id: Spreadsheet ID
         """
-        self.ensure_new_emails_tab_exists(spreadsheet_id)
+        # 버퍼에 남은 신규 메일 행은 어차피 지워지므로 버림
+        self.write_buffer.discard(spreadsheet_id, "신규 메일!")
 
         # Clear data rows (keep header row 1) - 16 columns A:P
-        self.service.spreadsheets().values().clear(
-            spreadsheetId=spreadsheet_id,
-            range="신규 메일!A2:P",
-        ).execute()
+        self._write_new_emails_tab(
+            spreadsheet_id,
+            lambda: self.service.spreadsheets().values().clear(
+                spreadsheetId=spreadsheet_id,
+                range="신규 메일!A2:P",
+            ).execute(),
+        )
+        self._row_cursors[(spreadsheet_id, "신규 메일")] = 2
 
     def add_to_new_emails(
         self,
         email_data: dict,
         classification: dict,
-        replied: bool,
+        replied: Optional[bool] = None,
     ) -> None:
         """
         Add email to '신규 메일' tab (Email Tracker 16-column format).
 
+        The row is written right away at the tab's next empty row.
+
         Args:
             email_data: Email data dict
             classification: Classification result
-            replied: Whether user has replied
+            replied: Whether user has replied (default: email_data['replied'] from
+                     GmailClient's sent-thread index)
         """
         history_id = self.get_or_create_history_sheet()
-        self.ensure_new_emails_tab_exists(history_id)
 
-        # 상태 결정
-        if replied:
-            status = '답장완료'
-        elif classification.get('requires_response'):
-            status = '답장필요'
-        else:
-            status = '답장불필요'
-
-        # 라벨 처리
-        labels = email_data.get('labels', [])
-        user_labels = [l for l in labels if not l.startswith(("CATEGORY_", "INBOX", "UNREAD", "SENT", "IMPORTANT", "STARRED", "DRAFT", "SPAM", "TRASH"))]
-        labels_str = ", ".join(user_labels) if user_labels else ""
-
-        # 본문 미리보기 (HTML 태그 제거)
-        body_raw = email_data.get('body', '') or email_data.get('snippet', '')
-        body_preview = strip_html(body_raw)[:300] if body_raw else ""
-
-        # 답장여부
-        reply_status = '답장함' if replied else '미답장'
+        _, row = self._tracker_row(email_data, classification, replied)
 
-        row = [
-            status,                                         # A: 상태
-            classification.get('priority', 3),              # B: 우선순위
-            labels_str,                                     # C: 라벨
-            email_data.get('subject', ''),                  # D: 제목
-            email_data.get('sender', ''),                   # E: 발신자
-            email_data.get('cc', ''),                       # F: 받은CC
-            email_data.get('date', ''),                     # G: 받은시간
-            body_preview,                                   # H: 내용미리보기
-            classification.get('summary', ''),              # I: AI요약
-            classification.get('draft_subject', '') or '',  # J: 초안(제목)
-            classification.get('draft_body', '') or '',     # K: 초안(내용)
-            '',                                             # L: 보낼CC
-            False,                                          # M: 전송예정
-            reply_status,                                   # N: 답장여부
-            '',                                             # O: Draft ID
-            email_data.get('thread_id', ''),                # P: Thread ID
-        ]
-
-        self.service.spreadsheets().values().append(
-            spreadsheetId=history_id,
-            range="신규 메일!A:P",
-            valueInputOption="USER_ENTERED",
-            insertDataOption="INSERT_ROWS",
-            body={"values": [row]},
-        ).execute()
+        self.ensure_new_emails_tab_exists(history_id)
+        self._put_rows(history_id, "신규 메일", "P", [row])
+        self._flush_spreadsheet(history_id)
 
     def add_email_to_both_tabs(
         self,
         email_data: dict,
         classification: dict,
-        replied: bool,
+        replied: Optional[bool] = None,
     ) -> str:
         """
         Add email to both '신규 메일' and '처리 이력' tabs.
@@ -1522,16 +1897,84 @@ class SheetsClient:
         '신규 메일': 매 분석 시 초기화 후 새 이메일만 추가
         '처리 이력': 누적 저장 (중복 시 업데이트)
 
+        Both rows are written right away in one values.batchUpdate. For a
+        whole run, use add_emails_to_both_tabs(), which also replaces the
+        '신규 메일' tab.
+
         Args:
             email_data: Email data dict
             classification: Classification result
-            replied: Whether user has replied
+            replied: Whether user has replied (default: email_data['replied'] from
+                     GmailClient's sent-thread index)
 
         Returns:
             History result: 'added', 'updated', or 'unchanged'
         """
+        history_id = self.get_or_create_history_sheet()
+
+        # 행은 한 번만 생성해 두 탭에 사용
+        status, row = self._tracker_row(email_data, classification, replied)
+
         # 1. 신규 메일 탭에 추가
-        self.add_to_new_emails(email_data, classification, replied)
+        self.ensure_new_emails_tab_exists(history_id)
+        self._put_rows(history_id, "신규 메일", "P", [row])
 
         # 2. 처리 이력 탭에 추가/업데이트
-        return self.add_to_history(email_data, classification, replied)
+        result = self._queue_history_row(history_id, email_data.get('thread_id', ''), status, row)
+
+        self._flush_spreadsheet(history_id)
+        return result
+
+    def add_emails_to_both_tabs(
+        self,
+        items: List[Tuple[dict, dict, Optional[bool]]],
+    ) -> List[str]:
+        """
+        Write a whole run's emails to both tabs in two write requests.
+
+        Each row is built once and used for both tabs. '신규 메일' is
+        replaced with these emails (one values.batchClear), then the new
+        '신규 메일' rows and all '처리 이력' upserts go out in one
+        values.batchUpdate. The history Thread ID index is read once per client.
+
+        Args:
+            items: (email_data, classification, replied) per email; replied may be
+                   None to use email_data['replied']
+
+        Returns:
+            History result per item, in input order: 'added', 'updated', or 'unchanged'
+
+        Example:
+            results = sheets.add_emails_to_both_tabs([
+                (email, email['classification'], None) for email in emails
+            ])
+            print(results.count('added'), "new emails in history")
+        """
+        history_id = self.get_or_create_history_sheet()
+
+        new_rows = []
+        results = []
+        for email_data, classification, replied in items:
+            status, row = self._tracker_row(email_data, classification, replied)
+            new_rows.append(row)
+            results.append(
+                self._queue_history_row(history_id, email_data.get('thread_id', ''), status, row)
+            )
+
+        # 1. 신규 메일 탭 초기화 (헤더 유지, 탭이 삭제됐으면 다시 생성)
+        self.write_buffer.discard(history_id, "신규 메일!")
+        self._write_new_emails_tab(
+            history_id,
+            lambda: self.service.spreadsheets().values().batchClear(
+                spreadsheetId=history_id,
+                body={"ranges": ["신규 메일!A2:P"]},
+            ).execute(),
+        )
+        self._row_cursors[(history_id, "신규 메일")] = 2
+
+        # 2. 신규 메일 행 + 처리 이력 추가/업데이트를 한 번에 기록
+        if new_rows:
+            self._put_rows(history_id, "신규 메일", "P", new_rows)
+        self.flush_history()
+
+        return results
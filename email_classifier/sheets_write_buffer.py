@@ -0,0 +1,129 @@
+"""Write-behind buffer for Google Sheets value updates (one batchUpdate per spreadsheet)."""
+import time
+from typing import Any, Dict, List, Optional
+
+# 자동 flush 기준 (put() 호출 시에만 확인): 스프레드시트별 대기 범위 수 / 가장 오래된 쓰기 이후 경과 시간(초)
+DEFAULT_MAX_RANGES = 200
+DEFAULT_MAX_AGE = 30.0
+
+
+class SheetsWriteBuffer:
+    """
+    Collects range writes and sends them as one values.batchUpdate per spreadsheet.
+
+    Writes to the same range are coalesced (the last value wins), so a cell
+    updated several times during a run is sent once. put() reports when a
+    spreadsheet is due for a flush: max_ranges writes are pending, or the
+    oldest one is older than max_age seconds. The owner (SheetsClient)
+    then calls flush(), so it can handle errors such as a deleted tab.
+    All writes use valueInputOption=USER_ENTERED.
+
+    max_age is only checked when put() is called: there is no timer, so
+    writes can stay pending longer if nothing else is written. Callers
+    must flush() at the end of a run.
+
+    Example:
+        buffer = SheetsWriteBuffer(sheets.service)
+        buffer.put(spreadsheet_id, "Emails!A5", [["답장완료"]])
+        buffer.put(spreadsheet_id, "Emails!M5", [[False]])
+        buffer.flush()  # one values.batchUpdate
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        max_ranges: int = DEFAULT_MAX_RANGES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ) -> None:
+        """
+        Initialize buffer.
+
+        Args:
+            service: Sheets API service
+            max_ranges: Flush a spreadsheet once this many ranges are pending
+            max_age: On put(), flush a spreadsheet whose oldest pending write is at
+                     least this old (seconds); not a timer
+        """
+        self.service = service
+        self.max_ranges = max_ranges
+        self.max_age = max_age
+        self._pending: Dict[str, Dict[str, List[List[Any]]]] = {}  # spreadsheet → range → values
+        self._since: Dict[str, float] = {}                         # spreadsheet → oldest write time
+
+    def put(self, spreadsheet_id: str, range_: str, values: List[List[Any]]) -> bool:
+        """
+        Queue a write of `values` to `range_` (replaces a pending write to the same range).
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            range_: A1 range (e.g., "Emails!A5:O5")
+            values: Rows of cell values
+
+        Returns:
+            True if the spreadsheet's pending writes should be flushed now
+        """
+        pending = self._pending.setdefault(spreadsheet_id, {})
+        self._since.setdefault(spreadsheet_id, time.monotonic())
+
+        pending.pop(range_, None)  # 마지막 쓰기 순서 유지
+        pending[range_] = values
+
+        return (
+            len(pending) >= self.max_ranges
+            or time.monotonic() - self._since[spreadsheet_id] >= self.max_age
+        )
+
+    def discard(self, spreadsheet_id: str, prefix: str) -> None:
+        """Drop pending writes whose range starts with `prefix` (e.g. a tab that is being cleared)."""
+        pending = self._pending.get(spreadsheet_id, {})
+        for range_ in [r for r in pending if r.startswith(prefix)]:
+            del pending[range_]
+
+    def has_pending(self, spreadsheet_id: str, prefix: str = "") -> bool:
+        """Check for pending writes to a spreadsheet (optionally only ranges starting with `prefix`)."""
+        return any(r.startswith(prefix) for r in self._pending.get(spreadsheet_id, {}))
+
+    def spreadsheet_ids(self) -> List[str]:
+        """Spreadsheets with pending writes."""
+        return [sid for sid, pending in self._pending.items() if pending]
+
+    def flush(self, spreadsheet_id: Optional[str] = None) -> int:
+        """
+        Send pending writes, one values.batchUpdate per spreadsheet.
+
+        If a request fails, that spreadsheet's writes stay pending and the
+        error is raised.
+
+        Args:
+            spreadsheet_id: Flush only this spreadsheet (default: all)
+
+        Returns:
+            Number of ranges written
+        """
+        ids = [spreadsheet_id] if spreadsheet_id is not None else list(self._pending)
+        written = 0
+
+        for sid in ids:
+            pending = self._pending.pop(sid, None)
+            self._since.pop(sid, None)
+            if not pending:
+                continue
+
+            try:
+                self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=sid,
+                    body={
+                        "valueInputOption": "USER_ENTERED",
+                        "data": [{"range": r, "values": v} for r, v in pending.items()],
+                    },
+                ).execute()
+            except Exception:
+                # 실패한 쓰기는 다음 flush에서 다시 시도 (그 사이 새로 쌓인 쓰기가 우선)
+                pending.update(self._pending.get(sid, {}))
+                self._pending[sid] = pending
+                self._since.setdefault(sid, time.monotonic())
+                raise
+
+            written += len(pending)
+
+        return written
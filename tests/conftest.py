@@ -0,0 +1,464 @@
+"""Shared in-memory fakes for the Gmail and Sheets API services (no OAuth, no network)."""
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from email_classifier import gmail_client as gmail_module
+from email_classifier.gmail_client import GmailClient
+from email_classifier.label_registry import LabelRegistry
+from email_classifier.message_store import MessageStore
+from email_classifier.request_scheduler import RequestScheduler
+from email_classifier.send_journal import SendJournal
+from email_classifier.sheets_client import SheetsClient
+from email_classifier.sheets_write_buffer import SheetsWriteBuffer
+
+MY_EMAIL = "me@example.com"
+
+SYSTEM_LABELS = {"INBOX", "UNREAD", "SENT", "DRAFT", "IMPORTANT", "STARRED", "SPAM", "TRASH"}
+
+LABEL_NAMES = [
+    "답장필요", "답장불필요", "답장완료",
+    "P1-최저", "P2-낮음", "P3-보통", "P4-긴급", "P5-최우선",
+    "처리완료", "메일요약",
+]
+
+
+# ===== 공통 =====
+
+class FakeResponse(dict):
+    """Minimal httplib2 response for HttpError."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__()
+        self.status = status
+        self.reason = "error"
+
+
+def http_error(status: int, content: bytes = b"error") -> HttpError:
+    return HttpError(FakeResponse(status), content)
+
+
+class FakeRequest:
+    """HttpRequest stand-in: execute() runs the fake's handler."""
+
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        self.fn = fn
+
+    def execute(self) -> Any:
+        return self.fn()
+
+
+class FakeBatch:
+    """BatchHttpRequest stand-in: runs each request and reports to the callback."""
+
+    def __init__(self, callback: Callable[[str, Any, Optional[Exception]], None]) -> None:
+        self.callback = callback
+        self.requests: List[Any] = []
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except HttpError as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+
+# ===== Gmail =====
+
+def message(
+    msg_id: str,
+    sender: str = "Alice <alice@example.com>",
+    to: str = MY_EMAIL,
+    label_ids: Optional[List[str]] = None,
+    thread_id: Optional[str] = None,
+    internal_date: int = 1_700_000_000_000,
+) -> Dict[str, Any]:
+    """Gmail message resource (format=metadata) for FakeGmail.messages_by_id."""
+    return {
+        "id": msg_id,
+        "threadId": thread_id or f"t-{msg_id}",
+        "labelIds": label_ids if label_ids is not None else ["INBOX"],
+        "snippet": f"snippet {msg_id}",
+        "internalDate": str(internal_date),
+        "payload": {"headers": [
+            {"name": "From", "value": sender},
+            {"name": "To", "value": to},
+            {"name": "Subject", "value": f"subject {msg_id}"},
+        ]},
+    }
+
+
+class FakeGmail:
+    """
+    In-memory Gmail service. add() puts messages in the mailbox.
+
+    calls records (name, params) for every request built, e.g.
+    ("messages.get", {...}). failures maps (name, resource ID) to errors
+    raised by the next executions of that request, in order.
+    """
+
+    def __init__(self) -> None:
+        self.label_ids = {name: f"Label_new_{i}" for i, name in enumerate(LABEL_NAMES)}
+        self.messages_by_id: Dict[str, Dict[str, Any]] = {}
+        self.mailbox: List[str] = []  # messages.list order (newest first), filtered by labelIds
+        self.history_pages: Any = []  # history.list pages, or an HttpError to raise
+        self.oldest_history_id = 0    # older startHistoryId → 404 (expired)
+        self.history_id = "1000"
+        self.drafts_by_id: Dict[str, Dict[str, Any]] = {}
+        self.failures: Dict[tuple, List[Exception]] = {}
+        self.calls: List[tuple] = []
+
+    def add(self, *messages: Dict[str, Any]) -> None:
+        """Add messages, newest first (as messages.list returns them)."""
+        for msg in messages:
+            self.messages_by_id[msg["id"]] = msg
+            self.mailbox.append(msg["id"])
+
+    def count(self, name: str) -> int:
+        return sum(1 for call, _ in self.calls if call == name)
+
+    def _request(self, name: str, key: Optional[str], params: Dict[str, Any], fn: Callable[[], Any]) -> FakeRequest:
+        self.calls.append((name, params))
+
+        def _execute() -> Any:
+            errors = self.failures.get((name, key))
+            if errors:
+                raise errors.pop(0)
+            return fn()
+
+        return FakeRequest(_execute)
+
+    # users() 아래 리소스
+    def users(self) -> "FakeGmail":
+        return self
+
+    def labels(self) -> "_Labels":
+        return _Labels(self)
+
+    def messages(self) -> "_Messages":
+        return _Messages(self)
+
+    def history(self) -> "_History":
+        return _History(self)
+
+    def drafts(self) -> "_Drafts":
+        return _Drafts(self)
+
+    def settings(self) -> "FakeGmail":
+        return self
+
+    def sendAs(self) -> "_SendAs":
+        return _SendAs(self)
+
+    def getProfile(self, userId: str) -> FakeRequest:
+        return self._request("getProfile", None, {}, lambda: {
+            "emailAddress": MY_EMAIL, "historyId": self.history_id,
+        })
+
+    def new_batch_http_request(self, callback: Callable[..., None]) -> FakeBatch:
+        return FakeBatch(callback)
+
+    def _check_labels(self, label_ids: List[str]) -> None:
+        unknown = [
+            lid for lid in label_ids
+            if lid not in self.label_ids.values() and lid not in SYSTEM_LABELS
+        ]
+        if unknown:
+            raise http_error(404, f"Requested label {unknown[0]} not found".encode())
+
+
+class _Labels:
+    def __init__(self, gmail: FakeGmail) -> None:
+        self.gmail = gmail
+
+    def list(self, **params: Any) -> FakeRequest:
+        return self.gmail._request("labels.list", None, params, lambda: {
+            "labels": [{"id": lid, "name": name} for name, lid in self.gmail.label_ids.items()]
+        })
+
+
+class _Messages:
+    def __init__(self, gmail: FakeGmail) -> None:
+        self.gmail = gmail
+
+    def get(self, **params: Any) -> FakeRequest:
+        msg_id = params["id"]
+
+        def _get() -> Dict[str, Any]:
+            if msg_id not in self.gmail.messages_by_id:
+                raise http_error(404, b"Not Found")
+            return self.gmail.messages_by_id[msg_id]
+
+        return self.gmail._request("messages.get", msg_id, params, _get)
+
+    def list(self, **params: Any) -> FakeRequest:
+        start = int(params.get("pageToken") or 0)
+        end = start + params["maxResults"]
+
+        def _list() -> Dict[str, Any]:
+            matches = [
+                self.gmail.messages_by_id[i] for i in self.gmail.mailbox
+                if set(params.get("labelIds", [])) <= set(self.gmail.messages_by_id[i]["labelIds"])
+            ]
+            response: Dict[str, Any] = {
+                "messages": [{"id": m["id"], "threadId": m["threadId"]} for m in matches[start:end]]
+            }
+            if end < len(matches):
+                response["nextPageToken"] = str(end)
+            return response
+
+        return self.gmail._request("messages.list", None, params, _list)
+
+    def modify(self, userId: str, id: str, body: Dict[str, Any]) -> FakeRequest:
+        return self.gmail._request("modify", id, body, lambda: self.gmail._check_labels(
+            body.get("addLabelIds", []) + body.get("removeLabelIds", [])
+        ) or {})
+
+    def batchModify(self, userId: str, body: Dict[str, Any]) -> FakeRequest:
+        return self.gmail._request("batchModify", None, body, lambda: self.gmail._check_labels(
+            body.get("addLabelIds", []) + body.get("removeLabelIds", [])
+        ) or {})
+
+
+class _History:
+    def __init__(self, gmail: FakeGmail) -> None:
+        self.gmail = gmail
+
+    def list(self, **params: Any) -> FakeRequest:
+        index = int(params.get("pageToken") or 0)
+
+        def _list() -> Dict[str, Any]:
+            if int(params["startHistoryId"]) < self.gmail.oldest_history_id:
+                raise http_error(404, b"Requested entity was not found.")
+            if isinstance(self.gmail.history_pages, Exception):
+                raise self.gmail.history_pages
+            pages = self.gmail.history_pages or [{}]
+            response = {"history": [], **pages[index], "historyId": self.gmail.history_id}
+            if index + 1 < len(pages):
+                response["nextPageToken"] = str(index + 1)
+            return response
+
+        return self.gmail._request("history.list", None, params, _list)
+
+
+class _Drafts:
+    def __init__(self, gmail: FakeGmail) -> None:
+        self.gmail = gmail
+
+    def get(self, **params: Any) -> FakeRequest:
+        draft_id = params["id"]
+
+        def _get() -> Dict[str, Any]:
+            if draft_id not in self.gmail.drafts_by_id:
+                raise http_error(404, b"Not Found")
+            return self.gmail.drafts_by_id[draft_id]
+
+        return self.gmail._request("drafts.get", draft_id, params, _get)
+
+    def send(self, userId: str, body: Dict[str, Any]) -> FakeRequest:
+        draft_id = body["id"]
+
+        def _send() -> Dict[str, Any]:
+            draft = self.gmail.drafts_by_id.pop(draft_id, None)
+            if draft is None:
+                raise http_error(404, b"Not Found")
+            return {"id": f"sent-{draft_id}", "threadId": draft["message"]["threadId"]}
+
+        return self.gmail._request("drafts.send", draft_id, body, _send)
+
+
+class _SendAs:
+    def __init__(self, gmail: FakeGmail) -> None:
+        self.gmail = gmail
+
+    def list(self, **params: Any) -> FakeRequest:
+        return self.gmail._request("sendAs.list", None, params, lambda: {
+            "sendAs": [{"sendAsEmail": MY_EMAIL}, {"sendAsEmail": "alias@example.com"}]
+        })
+
+
+class FakeFetcher:
+    """ConcurrentFetcher stand-in sharing the fake service."""
+
+    def __init__(self, service: FakeGmail) -> None:
+        self.service = service
+        self.pool = ThreadPoolExecutor(max_workers=2)
+
+    def submit(self, fn: Callable[[Any], Any]) -> Any:
+        return self.pool.submit(fn, self.service)
+
+    def fetch_many(self, message_ids: List[str], **params: Any) -> List[Dict[str, Any]]:
+        results = []
+        for msg_id in message_ids:
+            try:
+                msg = self.service.messages().get(userId="me", id=msg_id).execute()
+                results.append({"id": msg_id, "success": True, "message": msg, "error": None})
+            except HttpError as e:
+                results.append({"id": msg_id, "success": False, "message": None, "error": str(e)})
+        return results
+
+
+@pytest.fixture
+def fake_gmail() -> FakeGmail:
+    return FakeGmail()
+
+
+@pytest.fixture
+def make_gmail(tmp_path, monkeypatch) -> Callable[..., GmailClient]:
+    """
+    Build a GmailClient over a FakeGmail without OAuth.
+
+    All state files (store, label map, sync checkpoint, send journal) live
+    under the given directory (default tmp_path). saved_labels seeds
+    email_labels.json, e.g. with stale IDs.
+    """
+    monkeypatch.setattr(gmail_module, "SYNC_STATE_PATH", str(tmp_path / "email_sync_state.json"))
+
+    def _make(service: FakeGmail, directory=None, saved_labels: Optional[Dict[str, str]] = None) -> GmailClient:
+        directory = directory or tmp_path
+        registry_path = directory / "email_labels.json"
+        if saved_labels is not None:
+            registry_path.write_text(json.dumps({"labels": saved_labels}))
+
+        gmail = GmailClient.__new__(GmailClient)
+        gmail.service = service
+        gmail.scheduler = RequestScheduler(max_retries=3, base_delay=0, max_delay=0)
+        gmail.fetcher = FakeFetcher(service)
+        gmail._pending_sync_state = None
+        gmail.store = MessageStore(str(directory / "email_store.db"))
+        gmail._store_labels_synced = False
+        gmail._history_walk = None
+        gmail._fresh_threads = set()
+        gmail._contacts_synced = False
+        gmail.labels = LabelRegistry(service, path=str(registry_path))
+        gmail.profile_cache_ttl = None
+        gmail._account = None
+        gmail.send_journal = SendJournal(str(directory / "email_send_journal.jsonl"))
+        return gmail
+
+    return _make
+
+
+@pytest.fixture
+def gmail(fake_gmail, make_gmail) -> GmailClient:
+    return make_gmail(fake_gmail)
+
+
+# ===== Sheets =====
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - ord("A") + 1
+    return index - 1
+
+
+def _parse_range(range_: str):
+    """'Tab!A2:L' → (tab, first row, last row or None, first col, last col) (0-based)."""
+    tab, cells = range_.split("!")
+    start, _, end = cells.partition(":")
+    start_col, start_row = re.match(r"([A-Z]+)(\d*)", start).groups()
+    end_col, end_row = re.match(r"([A-Z]+)(\d*)", end or start).groups()
+    return (
+        tab,
+        int(start_row or 1) - 1,
+        int(end_row) - 1 if end_row else None,
+        _column_index(start_col),
+        _column_index(end_col),
+    )
+
+
+def _trim(cells: List[Any]) -> List[Any]:
+    """Drop trailing empty cells, as the Sheets API does."""
+    while cells and cells[-1] in ("", None):
+        cells = cells[:-1]
+    return cells
+
+
+class FakeSheets:
+    """
+    In-memory spreadsheet: tabs maps tab name to rows (row 1 = header).
+
+    Reads drop trailing empty cells and rows like the API; writes from
+    values.batchUpdate are recorded in writes and applied to the tabs.
+    """
+
+    def __init__(self, tabs: Optional[Dict[str, List[List[Any]]]] = None) -> None:
+        self.tabs = tabs or {}
+        self.writes: List[Dict[str, Any]] = []
+        self.calls: List[tuple] = []
+
+    def count(self, name: str) -> int:
+        return sum(1 for call, _ in self.calls if call == name)
+
+    def spreadsheets(self) -> "FakeSheets":
+        return self
+
+    def values(self) -> "FakeSheets":
+        return self
+
+    def _read(self, range_: str, by_column: bool) -> Dict[str, Any]:
+        tab, first_row, last_row, first_col, last_col = _parse_range(range_)
+        if tab not in self.tabs:
+            raise http_error(400, f"Unable to parse range: {range_}".encode())
+
+        rows = self.tabs[tab][first_row:None if last_row is None else last_row + 1]
+        grid = [(list(row) + [""] * (last_col + 1))[first_col:last_col + 1] for row in rows]
+        if by_column:
+            grid = [list(col) for col in zip(*grid)] if grid else []
+        grid = [_trim(line) for line in grid]
+        while grid and not grid[-1]:
+            grid.pop()
+        return {"range": range_, "values": grid} if grid else {"range": range_}
+
+    def get(self, spreadsheetId: str, range: str, **params: Any) -> FakeRequest:
+        self.calls.append(("values.get", {"range": range, **params}))
+        return FakeRequest(lambda: self._read(range, by_column=False))
+
+    def batchGet(self, spreadsheetId: str, ranges: List[str], **params: Any) -> FakeRequest:
+        self.calls.append(("values.batchGet", {"ranges": ranges, **params}))
+        by_column = params.get("majorDimension") == "COLUMNS"
+        return FakeRequest(lambda: {"valueRanges": [self._read(r, by_column) for r in ranges]})
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]) -> FakeRequest:
+        self.calls.append(("values.batchUpdate", body))
+
+        def _update() -> Dict[str, Any]:
+            for data in body["data"]:
+                self.writes.append(data)
+                tab, first_row, _, first_col, _ = _parse_range(data["range"])
+                rows = self.tabs.setdefault(tab, [])
+                for r, values in enumerate(data["values"], start=first_row):
+                    while len(rows) <= r:
+                        rows.append([])
+                    row = rows[r] + [""] * max(0, first_col + len(values) - len(rows[r]))
+                    row[first_col:first_col + len(values)] = values
+                    rows[r] = row
+            return {}
+
+        return FakeRequest(_update)
+
+
+@pytest.fixture
+def make_sheets() -> Callable[[FakeSheets], SheetsClient]:
+    """Build a SheetsClient over a FakeSheets without OAuth."""
+    def _make(service: FakeSheets) -> SheetsClient:
+        client = SheetsClient.__new__(SheetsClient)
+        client.service = service
+        client.scheduler = RequestScheduler(max_retries=3, base_delay=0, max_delay=0)
+        client._row_cursors = {}
+        client._history_index = None
+        client._history_next_row = 2
+        client.write_buffer = SheetsWriteBuffer(service)
+        return client
+
+    return _make
@@ -0,0 +1,37 @@
+"""AsyncGmailClient label writes remap stale label IDs like the sync client."""
+import asyncio
+
+from email_classifier.async_gmail_client import AsyncGmailClient
+
+from conftest import FakeGmail
+
+STALE_LABELS = {"답장필요": "Label_old"}  # email_labels.json saved before the label was recreated
+
+
+def test_batch_modify_remaps_stale_label(fake_gmail, make_gmail):
+    async_gmail = AsyncGmailClient(make_gmail(fake_gmail, saved_labels=STALE_LABELS))
+
+    failed = asyncio.run(async_gmail.batch_modify_labels([
+        ("m1", ["Label_old"], []),
+        ("m2", ["Label_old"], []),
+    ]))
+
+    assert failed == []
+    modifies = [body for name, body in fake_gmail.calls if name in ("batchModify", "modify")]
+    # stale ID rejected once, then one batchModify with the current ID
+    assert [m["addLabelIds"] for m in modifies] == [["Label_old"], [fake_gmail.label_ids["답장필요"]]]
+    assert modifies[-1]["ids"] == ["m1", "m2"]
+    assert fake_gmail.count("labels.list") == 1
+
+
+def test_sync_and_async_agree_on_stale_label(tmp_path, fake_gmail, make_gmail):
+    gmail = make_gmail(fake_gmail, saved_labels=STALE_LABELS)
+    assert gmail.batch_modify_labels([("m1", ["Label_old"], []), ("m2", ["Label_old"], [])]) == []
+
+    async_dir = tmp_path / "async"
+    async_dir.mkdir()
+    async_service = FakeGmail()
+    async_gmail = AsyncGmailClient(make_gmail(async_service, async_dir, saved_labels=STALE_LABELS))
+    asyncio.run(async_gmail.batch_modify_labels([("m1", ["Label_old"], []), ("m2", ["Label_old"], [])]))
+
+    assert [name for name, _ in async_service.calls] == [name for name, _ in fake_gmail.calls]
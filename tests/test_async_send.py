@@ -0,0 +1,34 @@
+"""AsyncGmailClient.batch_send_drafts goes through the send journal like the sync client."""
+import asyncio
+
+from email_classifier.async_gmail_client import AsyncGmailClient
+
+from conftest import http_error
+
+
+def _draft(draft_id, thread_id):
+    return {"id": draft_id, "message": {"id": f"msg-{draft_id}", "threadId": thread_id}}
+
+
+def test_async_send_is_journaled_and_indexed(fake_gmail, gmail):
+    fake_gmail.drafts_by_id = {"d1": _draft("d1", "t1"), "d2": _draft("d2", "t2")}
+    fake_gmail.failures[("drafts.send", "d2")] = [http_error(400, b"invalid to")]
+    async_gmail = AsyncGmailClient(gmail)
+
+    results = asyncio.run(async_gmail.batch_send_drafts(["d1", "d2"]))
+
+    assert [(r["draft_id"], r["success"]) for r in results] == [("d1", True), ("d2", False)]
+    assert gmail.send_journal.get("d1")["status"] == "sent"
+    assert gmail.send_journal.get("d2")["status"] == "failed"
+    assert gmail.store.get_sent_threads(["t1", "t2"]) == {"t1"}
+
+
+def test_async_rerun_does_not_send_twice(fake_gmail, gmail):
+    fake_gmail.drafts_by_id = {"d1": _draft("d1", "t1")}
+    async_gmail = AsyncGmailClient(gmail)
+
+    first = asyncio.run(async_gmail.batch_send_drafts(["d1"]))
+    again = asyncio.run(async_gmail.batch_send_drafts(["d1"]))
+
+    assert first == again
+    assert fake_gmail.count("drafts.send") == 1
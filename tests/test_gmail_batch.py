@@ -0,0 +1,36 @@
+"""GmailClient HTTP batch gets: per-item retry of 429/5xx failures."""
+from conftest import http_error, message
+
+
+def test_batch_retries_only_rate_limited_and_server_errors(fake_gmail, gmail):
+    for msg_id in ("m1", "m2", "m3"):
+        fake_gmail.messages_by_id[msg_id] = message(msg_id)
+    fake_gmail.failures[("messages.get", "m2")] = [http_error(429), http_error(503)]
+
+    results = gmail.batch_get_messages(["m1", "m2", "m3", "gone"], format="metadata")
+
+    assert [r["success"] for r in results] == [True, True, True, False]
+    assert results[1]["message"]["id"] == "m2"
+    assert "404" in results[3]["error"]
+    gets = [params["id"] for name, params in fake_gmail.calls if name == "messages.get"]
+    # m2 retried twice; the 404 is not retried
+    assert gets == ["m1", "m2", "m3", "gone", "m2", "m2"]
+
+
+def test_batch_gives_up_after_max_retries(fake_gmail, gmail):
+    fake_gmail.messages_by_id["m1"] = message("m1")
+    fake_gmail.failures[("messages.get", "m1")] = [http_error(500)] * 10
+
+    result, = gmail.batch_get_messages(["m1"])
+
+    assert not result["success"]
+    assert fake_gmail.count("messages.get") == gmail.scheduler.max_retries + 1
+
+
+def test_batch_keeps_order_for_duplicate_ids(fake_gmail, gmail):
+    fake_gmail.messages_by_id["m1"] = message("m1")
+    fake_gmail.messages_by_id["m2"] = message("m2")
+
+    results = gmail.batch_get_messages(["m2", "m1", "m2"])
+
+    assert [r["message"]["id"] for r in results] == ["m2", "m1", "m2"]
@@ -0,0 +1,70 @@
+"""처리 이력 Thread ID index: one read per client, upserts batched into one write."""
+import pytest
+
+from email_classifier.sheets_client import TRACKER_HEADERS, SheetsClient
+
+from conftest import FakeSheets
+
+
+def _history_row(status, thread_id):
+    return [status] + [""] * 14 + [thread_id]
+
+
+@pytest.fixture
+def history(monkeypatch):
+    monkeypatch.setattr(SheetsClient, "HISTORY_SPREADSHEET_ID", "H")
+    return FakeSheets({"처리 이력": [
+        TRACKER_HEADERS,
+        _history_row("답장필요", "t1"),
+        _history_row("답장불필요", "t2"),
+    ]})
+
+
+def _email(thread_id, replied=False):
+    return {"thread_id": thread_id, "subject": "hi", "sender": "a@example.com", "replied": replied}
+
+
+def test_history_upserts_use_thread_index(history, make_sheets):
+    sheets = make_sheets(history)
+
+    results = [
+        sheets.add_to_history(_email("t1", replied=True), {"priority": 3}, flush=False),
+        sheets.add_to_history(_email("t2"), {"priority": 3}, flush=False),
+        sheets.add_to_history(_email("t3"), {"priority": 3, "requires_response": True}, flush=False),
+        sheets.add_to_history(_email("t3", replied=True), {"priority": 3}, flush=False),
+    ]
+    sheets.flush_history()
+
+    assert results == ["updated", "unchanged", "added", "updated"]
+    assert history.count("values.batchGet") == 1      # index read once (A and P only)
+    assert history.count("values.batchUpdate") == 1   # all upserts in one write
+    assert [w["range"] for w in history.writes] == ["처리 이력!A2:P2", "처리 이력!A4:P4"]
+    assert history.tabs["처리 이력"][3][0] == "답장완료"   # last write to t3 wins
+    assert sheets._check_history_exists("H", "t3") and not sheets._check_history_exists("H", "t9")
+
+
+def test_history_url_reads_config_once(tmp_path, monkeypatch, make_sheets):
+    from email_classifier import sheets_client as sheets_module
+
+    config = tmp_path / "email_history_config.json"
+    monkeypatch.setattr(sheets_module, "HISTORY_CONFIG_PATH", str(config))
+    monkeypatch.setattr(SheetsClient, "HISTORY_SPREADSHEET_ID", None)
+    sheets = make_sheets(FakeSheets())
+
+    assert sheets.get_history_spreadsheet_url() == ""  # not created yet
+
+    config.write_text('{"history_spreadsheet_id": "H1"}')
+    assert sheets.get_history_spreadsheet_url() == "https://docs.google.com/spreadsheets/d/H1"
+
+    config.unlink()  # cached for the process
+    assert sheets.get_history_spreadsheet_url().endswith("/H1")
+    assert sheets.get_or_create_history_sheet() == "H1"
+
+
+def test_add_to_history_writes_through_by_default(history, make_sheets):
+    sheets = make_sheets(history)
+
+    assert sheets.add_to_history(_email("t3"), {"priority": 3}) == "added"
+
+    assert not sheets.write_buffer.spreadsheet_ids()
+    assert history.tabs["처리 이력"][3][15] == "t3"
@@ -0,0 +1,77 @@
+"""One users.history.list walk feeds the store label sync, the sent-thread index and incremental sync."""
+import json
+
+from email_classifier import gmail_client as gmail_module
+
+from conftest import http_error, message
+
+
+def _cache(gmail, fake_gmail, *msg_ids, body=None):
+    records = []
+    for msg_id in msg_ids:
+        record = gmail._to_record(fake_gmail.messages_by_id[msg_id], include_body=False)
+        records.append({**record, "body": body})
+    gmail.store.put_many(records)
+
+
+def test_one_walk_for_store_labels_sent_index_and_incremental_sync(fake_gmail, gmail):
+    fake_gmail.add(message("new"), message("old"), message("m1"))
+    _cache(gmail, fake_gmail, "m1")
+    gmail.store.set_meta("history_id", "900")
+    gmail.store.set_meta("sent_index_built", "1")
+    with open(gmail_module.SYNC_STATE_PATH, "w") as f:
+        json.dump({"history_id": "950", "pending_ids": []}, f)
+
+    reply = fake_gmail.label_ids["답장필요"]
+    fake_gmail.history_pages = [
+        {"history": [
+            {"id": "920", "messagesAdded": [
+                {"message": {"id": "old", "labelIds": ["INBOX"]}},
+                {"message": {"id": "s1", "threadId": "t-sent", "labelIds": ["SENT"]}},
+            ]},
+            {"id": "930", "labelsAdded": [{"message": {"id": "m1"}, "labelIds": [reply]}]},
+        ]},
+        {"history": [
+            {"id": "960", "messagesAdded": [{"message": {"id": "new", "labelIds": ["INBOX"]}}]},
+        ]},
+    ]
+
+    emails = gmail.get_recent_emails(max_results=10, incremental=True, include_body=False)
+
+    # sync checkpoint 950 → only the 960 record; store checkpoint 900 → all records
+    assert [e["id"] for e in emails] == ["new"]
+    assert [p["startHistoryId"] for name, p in fake_gmail.calls if name == "history.list"] == ["900", "900"]
+    assert gmail.store.get_many(["m1"])["m1"]["label_ids"] == ["INBOX", reply]
+    assert gmail.check_if_replied("t-sent")
+    assert gmail.store.get_meta("history_id") == fake_gmail.history_id
+
+
+def test_expired_store_checkpoint_keeps_cached_messages(fake_gmail, gmail):
+    fake_gmail.add(message("m1"))
+    _cache(gmail, fake_gmail, "m1", body="cached body")
+    gmail.store.set_meta("history_id", "1")
+    fake_gmail.history_pages = http_error(404, b"Requested entity was not found.")
+    done = fake_gmail.label_ids["처리완료"]
+    fake_gmail.messages_by_id["m1"]["labelIds"] = ["INBOX", done]  # changed while history expired
+
+    record, = gmail._get_message_records(["m1"], include_body=True)
+
+    assert record["body"] == "cached body"
+    assert record["label_ids"] == ["INBOX", done]
+    formats = [p["format"] for name, p in fake_gmail.calls if name == "messages.get"]
+    assert formats == ["minimal"]  # labels only; headers and body not downloaded again
+    assert not gmail.store.get_many(["m1"])["m1"]["labels_stale"]
+    assert gmail.store.get_meta("sent_index_built") is None  # rebuilt on next use
+
+
+def test_expired_sync_checkpoint_walks_from_store_checkpoint(fake_gmail, gmail):
+    fake_gmail.add(message("m1"))
+    gmail.store.set_meta("history_id", "900")
+    with open(gmail_module.SYNC_STATE_PATH, "w") as f:
+        json.dump({"history_id": "5", "pending_ids": []}, f)
+    fake_gmail.oldest_history_id = 100
+
+    changes = gmail.get_inbox_changes()
+
+    assert changes["full_resync"]
+    assert [p["startHistoryId"] for name, p in fake_gmail.calls if name == "history.list"] == ["5", "900"]
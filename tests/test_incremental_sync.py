@@ -0,0 +1,68 @@
+"""get_recent_emails(incremental=True): historyId checkpoints, carry-over and 404 resync."""
+import json
+
+from email_classifier import gmail_client as gmail_module
+from email_classifier.gmail_client import FULL_RESYNC_LIST_FACTOR
+
+from conftest import http_error, message
+
+
+def _state():
+    with open(gmail_module.SYNC_STATE_PATH) as f:
+        return json.load(f)
+
+
+def _save_state(state):
+    with open(gmail_module.SYNC_STATE_PATH, "w") as f:
+        json.dump(state, f)
+
+
+def test_first_run_lists_a_bounded_backlog(fake_gmail, gmail):
+    fake_gmail.add(*[message(f"m{i}") for i in range(30)])
+
+    emails = gmail.get_recent_emails(max_results=2, incremental=True, include_body=False)
+    gmail.save_sync_checkpoint()
+
+    assert [e["id"] for e in emails] == ["m0", "m1"]
+    # only FULL_RESYNC_LIST_FACTOR * max_results IDs are listed and carried over
+    assert _state() == {
+        "history_id": "1000",
+        "pending_ids": [f"m{i}" for i in range(2, 2 * FULL_RESYNC_LIST_FACTOR)],
+    }
+
+
+def test_delta_run_reads_history_and_carry_over(fake_gmail, gmail):
+    fake_gmail.add(message("new"), message("old1"), message("old2"), message("done", label_ids=["INBOX", "Label_new_8"]))
+    _save_state({"history_id": "900", "pending_ids": ["old1", "old2"]})
+    fake_gmail.history_pages = [
+        {"history": [{"id": "950", "messagesAdded": [{"message": {"id": "done", "labelIds": ["INBOX"]}}]}]},
+        {"history": [{"id": "990", "messagesAdded": [{"message": {"id": "new", "labelIds": ["INBOX"]}}]}]},
+    ]
+
+    emails = gmail.get_recent_emails(max_results=2, incremental=True, include_body=False)
+    gmail.save_sync_checkpoint()
+
+    # newest first; the 처리완료 message is skipped; overflow carried to the next run
+    assert [e["id"] for e in emails] == ["new", "old1"]
+    assert _state() == {"history_id": "1000", "pending_ids": ["old2"]}
+    assert fake_gmail.count("messages.list") == 1  # sent-thread index only, no inbox listing
+
+
+def test_expired_checkpoint_falls_back_to_full_resync(fake_gmail, gmail):
+    fake_gmail.add(message("m1"), message("m2"))
+    _save_state({"history_id": "1", "pending_ids": []})
+    fake_gmail.history_pages = http_error(404, b"Requested entity was not found.")
+
+    emails = gmail.get_recent_emails(max_results=5, incremental=True, include_body=False)
+
+    assert [e["id"] for e in emails] == ["m1", "m2"]
+    gmail.save_sync_checkpoint()
+    assert _state() == {"history_id": "1000", "pending_ids": []}
+
+
+def test_checkpoint_not_saved_until_processed(fake_gmail, gmail):
+    fake_gmail.add(message("m1"))
+
+    gmail.get_recent_emails(max_results=5, incremental=True, include_body=False)
+
+    assert not gmail_module.os.path.exists(gmail_module.SYNC_STATE_PATH)
@@ -0,0 +1,50 @@
+"""batch_modify_labels: one batchModify per identical (add, remove) set."""
+from conftest import http_error, message
+
+
+def test_group_label_changes_merges_identical_sets(gmail):
+    groups = gmail._group_label_changes([
+        ("m1", ["B", "A"], ["C"]),
+        ("m2", ["A", "B"], ["C"]),   # same sets, different order
+        ("m1", ["A", "B"], ["C"]),   # duplicate message
+        ("m3", ["A"], []),
+        ("m4", [], []),              # nothing to change
+    ])
+
+    assert groups == [(["A", "B"], ["C"], ["m1", "m2"]), (["A"], [], ["m3"])]
+
+
+def test_group_label_changes_splits_at_batch_modify_size(gmail, monkeypatch):
+    monkeypatch.setattr(gmail, "BATCH_MODIFY_SIZE", 2)
+
+    groups = gmail._group_label_changes([(f"m{i}", ["A"], []) for i in range(5)])
+
+    assert [ids for _, _, ids in groups] == [["m0", "m1"], ["m2", "m3"], ["m4"]]
+
+
+def test_one_call_per_group_and_store_updated(fake_gmail, gmail):
+    fake_gmail.add(message("m1"), message("m2"), message("m3"))
+    gmail.store.put_many([gmail._to_record(fake_gmail.messages_by_id[i], False) for i in ("m1", "m2", "m3")])
+    reply, done = fake_gmail.label_ids["답장필요"], fake_gmail.label_ids["처리완료"]
+
+    failed = gmail.batch_modify_labels([
+        ("m1", [reply], ["INBOX"]), ("m2", [reply], ["INBOX"]), ("m3", [done], []),
+    ])
+
+    assert failed == []
+    # two groups: batchModify for m1+m2, modify for the single m3
+    assert (fake_gmail.count("batchModify"), fake_gmail.count("modify")) == (1, 1)
+    stored = gmail.store.get_many(["m1", "m3"])
+    assert stored["m1"]["label_ids"] == [reply]
+    assert stored["m3"]["label_ids"] == ["INBOX", done]
+
+
+def test_failed_batch_retried_per_message(fake_gmail, gmail):
+    reply = fake_gmail.label_ids["답장필요"]
+    fake_gmail.failures[("batchModify", None)] = [http_error(400, b"Invalid id")]
+    fake_gmail.failures[("modify", "gone")] = [http_error(404, b"Not Found")]
+
+    failed = gmail.batch_modify_labels([("m1", [reply], []), ("gone", [reply], [])])
+
+    assert failed == ["gone"]
+    assert fake_gmail.count("modify") == 2
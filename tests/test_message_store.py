@@ -0,0 +1,129 @@
+"""MessageStore contact index: message membership and P4-5 counts."""
+import json
+import sqlite3
+
+from email_classifier.message_store import MessageStore
+
+
+def _received(msg_id: str, sender: str = "Alice <Alice@Example.com>", ts: int = 1_700_000_000_000):
+    return {
+        "id": msg_id,
+        "thread_id": f"t-{msg_id}",
+        "label_ids": ["INBOX"],
+        "snippet": "",
+        "headers": [{"name": "From", "value": sender}, {"name": "Subject", "value": "hi"}],
+        "body": None,
+        "internal_date": ts,
+    }
+
+
+def test_redownloaded_message_not_counted_twice(tmp_path):
+    store = MessageStore(str(tmp_path / "email_store.db"))
+
+    store.put_many([_received("m1"), _received("m2")])
+    store.clear()  # messages dropped, contact index kept
+    store.put_many([_received("m1"), _received("m3")])
+
+    contact = store.get_contacts(["alice@example.com"])["alice@example.com"]
+    assert contact["total_received"] == 3
+    assert store.conn.execute("SELECT COUNT(*) FROM contact_messages").fetchone()[0] == 3
+
+
+def test_old_contact_id_arrays_are_migrated(tmp_path):
+    path = str(tmp_path / "email_store.db")
+    MessageStore(path).conn.close()
+
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO contacts (address, name, sent_ids, received_ids, total_sent, total_received, "
+        "sent_samples, received_samples) VALUES (?, '', '[]', ?, 0, 2, '[]', '[]')",
+        ("alice@example.com", json.dumps(["m1", "m2"])),
+    )
+    conn.commit()
+    conn.close()
+
+    store = MessageStore(path)
+    store.put_many([_received("m2"), _received("m3")])
+
+    contact = store.get_contacts(["alice@example.com"])["alice@example.com"]
+    assert contact["total_received"] == 3
+    assert store.conn.execute("SELECT received_ids FROM contacts").fetchone()[0] == "[]"
+
+
+def test_priority_recorded_before_contact_is_indexed(tmp_path):
+    store = MessageStore(str(tmp_path / "email_store.db"))
+
+    # classification runs before index_contacts has seen the sender
+    store.record_priorities([("m1", "Alice@Example.com", 5)])
+    store.record_priorities([("m1", "alice@example.com", 5)])  # rerun: no double count
+    store.put_many([_received("m1")])
+
+    assert store.get_sender_stats()["alice@example.com"]["p45_count"] == 1
+
+    store.record_priorities([("m1", "alice@example.com", 2)])
+    assert store.get_sender_stats()["alice@example.com"]["p45_count"] == 0
+
+
+def _total(store):
+    return int(store.get_meta("total_size"))
+
+
+def _scan(store):
+    return store.conn.execute("SELECT COALESCE(SUM(size), 0) FROM messages").fetchone()[0]
+
+
+def test_size_total_tracks_inserts_updates_and_deletes(tmp_path):
+    store = MessageStore(str(tmp_path / "email_store.db"))
+
+    store.put_many([_received("m1"), _received("m2")])
+    store.put_many([{**_received("m1"), "body": "x" * 500}])  # body fetched later: grows
+    assert _total(store) == _scan(store) > 500
+
+    store.delete(["m2"])
+    assert _total(store) == _scan(store)
+
+    store.clear()
+    assert _total(store) == 0
+
+
+def test_evict_uses_running_total(tmp_path):
+    store = MessageStore(str(tmp_path / "email_store.db"), max_bytes=10_000)
+    store.put_many([{**_received(f"m{i}"), "body": "x" * 1000} for i in range(5)])
+    assert store.evict() == 0
+
+    store.put_many([{**_received(f"n{i}"), "body": "x" * 1000} for i in range(10)])
+
+    assert _total(store) == _scan(store) <= 9_000
+    assert store.get_many(["n9"])  # newest kept
+
+
+def test_size_total_initialized_for_existing_store(tmp_path):
+    path = str(tmp_path / "email_store.db")
+    store = MessageStore(path)
+    store.put_many([_received("m1")])
+    store.conn.execute("DELETE FROM meta WHERE key = 'total_size'")  # store from before the counter
+    store.conn.commit()
+    store.conn.close()
+
+    store = MessageStore(path)
+    assert _total(store) == _scan(store) > 0
+
+
+def test_drafts_and_my_own_mail_not_counted_as_received(tmp_path):
+    store = MessageStore(str(tmp_path / "email_store.db"))
+    store.own_addresses = {"me@example.com", "alias@example.com"}
+
+    draft = {**_received("d1", sender="Me <me@example.com>"), "label_ids": ["DRAFT"]}
+    from_alias = _received("a1", sender="Me <Alias@Example.com>")  # thread fetch, no SENT label
+    store.put_many([draft, from_alias, _received("m1")])
+
+    assert set(store.get_sender_stats()) == {"alice@example.com"}
+    assert store.get_contacts(["me@example.com", "alias@example.com"]) == {}
+
+
+def test_sender_stats_hide_my_address_in_older_stores(tmp_path):
+    store = MessageStore(str(tmp_path / "email_store.db"))
+    store.put_many([_received("m1", sender="me@example.com")])  # indexed before the filter
+
+    store.own_addresses = {"me@example.com"}
+    assert store.get_sender_stats() == {}
@@ -0,0 +1,55 @@
+"""RequestScheduler retry policy for idempotent and non-idempotent methods."""
+import pytest
+
+from email_classifier.request_scheduler import RequestScheduler
+
+from conftest import http_error
+
+
+def _failing_call(errors):
+    """Call that raises the given errors in order, then succeeds; records attempts."""
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        if len(attempts) <= len(errors):
+            raise errors[len(attempts) - 1]
+        return {"id": "sent"}
+
+    return call, attempts
+
+
+@pytest.fixture
+def scheduler():
+    return RequestScheduler(max_retries=3, base_delay=0, max_delay=0)
+
+
+@pytest.mark.parametrize("error", [
+    http_error(503, b"backend error"),
+    TimeoutError("timed out"),
+    ConnectionError("reset"),
+])
+def test_drafts_send_not_retried_after_server_or_transport_error(scheduler, error):
+    call, attempts = _failing_call([error])
+
+    with pytest.raises(type(error)):
+        scheduler.run("gmail.users.drafts.send", call)
+
+    assert len(attempts) == 1
+
+
+def test_drafts_send_retried_when_rate_limited(scheduler):
+    call, attempts = _failing_call([
+        http_error(429, b"too many requests"),
+        http_error(403, b'{"reason": "userRateLimitExceeded"}'),
+    ])
+
+    assert scheduler.run("gmail.users.drafts.send", call) == {"id": "sent"}
+    assert len(attempts) == 3
+
+
+def test_idempotent_method_retried_after_server_error(scheduler):
+    call, attempts = _failing_call([http_error(503, b""), TimeoutError("timed out")])
+
+    assert scheduler.run("gmail.users.messages.get", call) == {"id": "sent"}
+    assert len(attempts) == 3
@@ -0,0 +1,67 @@
+"""batch_send_drafts resumes from the send journal without sending a draft twice."""
+from email_classifier.send_journal import FAILED, PENDING, SENT, SendJournal
+
+from conftest import http_error
+
+
+def _draft(draft_id, thread_id="t1"):
+    return {"id": draft_id, "message": {"id": f"msg-{draft_id}", "threadId": thread_id}}
+
+
+def _sends(fake_gmail):
+    return [p["id"] for name, p in fake_gmail.calls if name == "drafts.send"]
+
+
+def test_sent_draft_not_sent_again(fake_gmail, gmail):
+    fake_gmail.drafts_by_id = {"d1": _draft("d1")}
+
+    first = gmail.batch_send_drafts(["d1"])
+    again = gmail.batch_send_drafts(["d1"])
+
+    assert first == again and first[0]["success"]
+    assert _sends(fake_gmail) == ["d1"]
+    assert gmail.store.get_sent_threads(["t1"]) == {"t1"}
+
+
+def test_interrupted_send_resolved_by_draft_existence(fake_gmail, gmail):
+    fake_gmail.drafts_by_id = {"still-there": _draft("still-there")}
+    gmail.send_journal.record("still-there", PENDING)
+    gmail.send_journal.record("gone", PENDING)  # Gmail deleted it: the send went through
+
+    results = gmail.batch_send_drafts(["still-there", "gone"])
+
+    assert [r["success"] for r in results] == [True, True]
+    assert _sends(fake_gmail) == ["still-there"]
+    assert gmail.send_journal.get("gone")["status"] == SENT
+
+
+def test_unknown_state_is_not_resent(fake_gmail, gmail):
+    gmail.send_journal.record("d1", PENDING)
+    fake_gmail.failures[("drafts.get", "d1")] = [http_error(500, b"backend error")]
+
+    result, = gmail.batch_send_drafts(["d1"])
+
+    assert not result["success"] and "500" in result["error"]
+    assert _sends(fake_gmail) == []
+    assert gmail.send_journal.get("d1")["status"] == PENDING
+
+
+def test_failed_send_is_retried(fake_gmail, gmail):
+    fake_gmail.drafts_by_id = {"d1": _draft("d1")}
+    fake_gmail.failures[("drafts.send", "d1")] = [http_error(400, b"invalid to")]
+
+    assert not gmail.batch_send_drafts(["d1"])[0]["success"]
+    assert gmail.send_journal.get("d1")["status"] == FAILED
+    assert gmail.batch_send_drafts(["d1"])[0]["success"]
+    assert _sends(fake_gmail) == ["d1", "d1"]
+
+
+def test_journal_survives_restart(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    SendJournal(path).record("d1", SENT, message_id="m1", thread_id="t1")
+    with open(path, "a") as f:
+        f.write('{"draft_id": "d2", "sta')  # crash mid-write
+
+    journal = SendJournal(path)
+    assert journal.get("d1")["message_id"] == "m1"
+    assert journal.get("d2") is None
@@ -0,0 +1,71 @@
+"""SheetsClient sender sync against a fake Sheets service."""
+from conftest import FakeSheets
+
+SENDER_HEADER = ["이메일", "이름", "자동점수", "수동등급", "최종점수", "", "", "", "", "", "", "메모"]
+
+
+def _stats(**overrides):
+    stats = {
+        "name": "Foo", "total_sent": 1, "total_received": 2, "p45_count": 0,
+        "total_emails": 2, "recent_7days": 1.0, "last_contact_date": "2026-10-01",
+    }
+    stats.update(overrides)
+    return stats
+
+
+def test_sync_senders_matches_sheet_address_case_insensitively(make_sheets):
+    service = FakeSheets({"발신자 관리": [
+        SENDER_HEADER,
+        ["Foo@Bar.com", "Foo", 0, "VIP", 100, 0, 0, 0, "0%", 0, "", "memo"],
+    ]})
+    client = make_sheets(service)
+
+    result = client.sync_senders("S", {"foo@bar.com": _stats()})
+    client.flush()
+
+    assert result["added"] == 0
+    assert [w["range"] for w in service.writes] == ["발신자 관리!A2:L2"]
+    row = service.writes[0]["values"][0]
+    assert row[0] == "Foo@Bar.com"          # sheet spelling kept
+    assert (row[3], row[11]) == ("VIP", "memo")  # manual grade and memo kept
+
+
+def test_single_item_mutators_write_without_flush(make_sheets):
+    service = FakeSheets({
+        "Emails": [["상태"], ["답장필요"]],
+        "발신자 관리": [SENDER_HEADER],
+    })
+    client = make_sheets(service)
+
+    client.update_email_status("S", 2)
+    client.add_or_update_sender("S", "foo@bar.com", _stats())
+
+    assert not client.write_buffer.spreadsheet_ids()
+    assert service.tabs["Emails"][1][0] == "답장완료"
+    assert service.tabs["발신자 관리"][1][0] == "foo@bar.com"
+
+
+def test_bulk_mutators_wait_for_flush(make_sheets):
+    service = FakeSheets({"Emails": [["상태"], ["답장필요"], ["답장필요"]]})
+    client = make_sheets(service)
+
+    client.update_email_statuses("S", [2, 3])
+    assert service.count("values.batchUpdate") == 0
+
+    assert client.flush() == 4
+    assert service.count("values.batchUpdate") == 1
+
+
+def test_sender_reads_keep_rows_with_trailing_empty_cells(make_sheets):
+    service = FakeSheets({"발신자 관리": [
+        SENDER_HEADER,
+        ["vip@example.com", "", 0, "차단", 90],
+        ["new@example.com", "", 0],             # D and E still empty
+        ["old@example.com", "", 0, "", ""],
+    ]})
+    client = make_sheets(service)
+
+    assert client.get_sender_importance_scores("S") == {
+        "vip@example.com": 90, "new@example.com": 0, "old@example.com": 0,
+    }
+    assert client.get_blocked_senders("S") == ["vip@example.com"]
@@ -0,0 +1,51 @@
+"""SheetsWriteBuffer: coalesced range writes, one values.batchUpdate per spreadsheet."""
+import pytest
+from googleapiclient.errors import HttpError
+
+from email_classifier.sheets_write_buffer import SheetsWriteBuffer
+
+from conftest import FakeSheets, http_error
+
+
+def test_same_range_is_coalesced_and_written_once_per_spreadsheet():
+    service = FakeSheets()
+    buffer = SheetsWriteBuffer(service)
+
+    buffer.put("S", "Emails!A5", [["답장필요"]])
+    buffer.put("S", "Emails!M5", [[False]])
+    buffer.put("S", "Emails!A5", [["답장완료"]])
+    buffer.put("T", "Emails!A2", [["답장완료"]])
+
+    assert buffer.flush() == 3
+    assert service.count("values.batchUpdate") == 2
+    assert [(w["range"], w["values"]) for w in service.writes[:2]] == [
+        ("Emails!M5", [[False]]),
+        ("Emails!A5", [["답장완료"]]),   # last value wins, written once
+    ]
+    assert buffer.spreadsheet_ids() == []
+
+
+def test_put_reports_flush_due_at_max_ranges():
+    buffer = SheetsWriteBuffer(FakeSheets(), max_ranges=2)
+
+    assert buffer.put("S", "Emails!A2", [["x"]]) is False
+    assert buffer.put("S", "Emails!A2", [["y"]]) is False  # same range, still one pending
+    assert buffer.put("S", "Emails!A3", [["z"]]) is True
+
+
+def test_failed_flush_keeps_writes_pending():
+    service = FakeSheets()
+    buffer = SheetsWriteBuffer(service)
+    buffer.put("S", "Emails!A2", [["x"]])
+
+    def fail(spreadsheetId, body):
+        raise http_error(500, b"backend error")
+
+    service.batchUpdate, ok = fail, service.batchUpdate
+    with pytest.raises(HttpError):
+        buffer.flush()
+    assert buffer.has_pending("S", "Emails!")
+
+    service.batchUpdate = ok
+    assert buffer.flush("S") == 1
+    assert service.tabs["Emails"][1] == ["x"]
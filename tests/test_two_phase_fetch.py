@@ -0,0 +1,32 @@
+"""Metadata-first fetch: headers only, bodies loaded later for the survivors."""
+import base64
+
+from conftest import MY_EMAIL, message
+
+
+def _with_body(msg_id, text, **kwargs):
+    msg = message(msg_id, **kwargs)
+    msg["payload"]["body"] = {"data": base64.urlsafe_b64encode(text.encode()).decode()}
+    return msg
+
+
+def test_bodies_loaded_only_when_requested(fake_gmail, gmail):
+    fake_gmail.add(_with_body("m1", "hello"), _with_body("m2", "world"))
+
+    emails = gmail.get_recent_emails(max_results=2, include_body=False, skip_processed=False)
+    assert [(e["body"], e["body_loaded"]) for e in emails] == [("", False), ("", False)]
+    assert all(params["format"] == "metadata" for name, params in fake_gmail.calls if name == "messages.get")
+
+    gmail.load_email_bodies(emails[:1])
+    assert (emails[0]["body"], emails[1]["body_loaded"]) == ("hello", False)
+
+
+def test_list_id_alone_does_not_make_group_mail(gmail):
+    headers = [
+        {"name": "To", "value": MY_EMAIL},
+        {"name": "List-Id", "value": "<notifications.tool.example.com>"},
+    ]
+    assert gmail.get_recipient_type(headers, my_email=MY_EMAIL)["recipient_type"] == "direct"
+
+    headers[0]["value"] = "team-all@example.com"
+    assert gmail.get_recipient_type(headers, my_email=MY_EMAIL)["recipient_type"] == "group"